@@ -0,0 +1,76 @@
+# Copyright (c) 2018, Vienna University of Technology (TU Wien), Department
+# of Geodesy and Geoinformation (GEO).
+# All rights reserved.
+
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE
+# ARE DISCLAIMED. IN NO EVENT SHALL VIENNA UNIVERSITY OF TECHNOLOGY,
+# DEPARTMENT OF GEODESY AND GEOINFORMATION BE LIABLE FOR ANY DIRECT, INDIRECT,
+# INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT
+# LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA,
+# OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF
+# LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING
+# NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE,
+# EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+"""
+Benchmark of the memory needed to keep many parsed SGRT filenames, comparing SmartFilename objects
+with and without an intern pool and compact filenames (SmartFilename.compact).
+
+Usage (with geopathfinder installed): python benchmarks/bench_memory.py
+"""
+
+import gc
+import tracemalloc
+
+from geopathfinder.file_naming import InternPool
+from geopathfinder.naming_conventions.sgrt_naming import SgrtFilename
+
+
+def make_filenames(n):
+    fn_template = 'M20170725_165004--_SIG0-----_S1BIWGRDH1VVA_{:03d}_A0104_EU500M_E{:03d}N012T6.tif'
+    return [fn_template.format(i % 1000, i // 1000 % 1000) for i in range(n)]
+
+
+def measure(parse, filenames):
+    """
+    Returns the memory (in bytes) allocated by the parsed filenames, i.e. without the filename strings themselves.
+    """
+
+    gc.collect()
+    tracemalloc.start()
+    parsed = [parse(fn) for fn in filenames]
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del parsed
+
+    return size
+
+
+def parse_decoded(fn):
+    sgrt_fn = SgrtFilename.from_filename(fn, convert=True)
+    # access all fields to decode them
+    for name in SgrtFilename.fields_def.keys():
+        getattr(sgrt_fn.obj, name)
+    return sgrt_fn
+
+
+def run(n=20000):
+    filenames = make_filenames(n)
+    parsers = [('SmartFilename', SgrtFilename.from_filename, None),
+               ('SmartFilename (decoded)', parse_decoded, None),
+               ('SmartFilename (decoded, interned)', parse_decoded, InternPool()),
+               ('CompactFilename', SgrtFilename.compact, None)]
+
+    for name, parse, intern_pool in parsers:
+        SgrtFilename.intern_pool = intern_pool
+        # parse once before measuring to exclude cached layouts and specifications
+        parse(filenames[0])
+        size = measure(parse, filenames)
+        print("{:<34} {:10.1f} bytes per filename".format(name, size / n))
+    SgrtFilename.intern_pool = None
+
+
+if __name__ == '__main__':
+    run()
@@ -0,0 +1,67 @@
+# Copyright (c) 2018, Vienna University of Technology (TU Wien), Department
+# of Geodesy and Geoinformation (GEO).
+# All rights reserved.
+
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE
+# ARE DISCLAIMED. IN NO EVENT SHALL VIENNA UNIVERSITY OF TECHNOLOGY,
+# DEPARTMENT OF GEODESY AND GEOINFORMATION BE LIABLE FOR ANY DIRECT, INDIRECT,
+# INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT
+# LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA,
+# OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF
+# LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING
+# NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE,
+# EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+"""
+Benchmark of renaming fields of SGRT filenames, comparing the in-place update of
+SmartFilename.__setitem__ with the former deep-copy based update.
+
+Usage (with geopathfinder installed): python benchmarks/bench_setitem.py
+"""
+
+import copy
+import timeit
+
+from geopathfinder.naming_conventions.sgrt_naming import SgrtFilename
+
+
+def deepcopy_setitem(smart_fn, name, value):
+    """
+    Former implementation of SmartFilename.__setitem__, copying the filename part before each update.
+    """
+
+    fn_part = copy.deepcopy(smart_fn._fn_map[name])
+    fn_part.arg = value
+    if not fn_part.is_valid():
+        raise ValueError("Length does not comply with definition.")
+    smart_fn._fn_map[name] = fn_part
+    smart_fn._fn_cache = None
+    setattr(smart_fn.obj, name, fn_part.encoded.replace(smart_fn.pad, ''))
+
+
+def inplace_setitem(smart_fn, name, value):
+    """
+    Current implementation of SmartFilename.__setitem__.
+    """
+
+    smart_fn[name] = value
+
+
+def run(number=20000):
+    fn = 'M20170725_165004--_SIG0-----_S1BIWGRDH1VVA_146_A0104_EU500M_E048N012T6.tif'
+    smart_fn = SgrtFilename.from_filename(fn)
+
+    for setitem in [deepcopy_setitem, inplace_setitem]:
+        def rename():
+            setitem(smart_fn, 'workflow_id', 'A0105')
+            setitem(smart_fn, 'var_name', 'SSM')
+            str(smart_fn)
+
+        duration = min(timeit.repeat(rename, number=number, repeat=3))
+        print("{:<18} {:8.2f} us per rename".format(setitem.__name__, duration / number * 1e6))
+
+
+if __name__ == '__main__':
+    run()
@@ -15,14 +15,698 @@
 # EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
 
 import os
-import copy
+import sys
+import importlib
+import itertools
+import datetime as dt
+from datetime import datetime
+from functools import lru_cache
 from collections import OrderedDict
+from collections import namedtuple
+
+import regex as re
+import numpy as np
+import pandas as pd
+
+
+class FieldLayout(namedtuple('FieldLayout', ['names', 'lengths', 'delimiters', 'pads', 'slices'])):
+    """
+    Immutable, pre-computed slice table of a filename fields definition.
+
+    Attributes
+    ----------
+    names : tuple of str
+        Names of all fields in the right order.
+    lengths : tuple of int or None
+        Length of each field (None if the length is not defined).
+    delimiters : tuple of str
+        Delimiter between each field and the following one.
+    pads : tuple of str
+        Padding symbol of each field.
+    slices : tuple of tuple
+        (name, start, stop) for each field with a defined length.
+    """
+
+    __slots__ = ()
+
+    def split(self, filename_str):
+        """
+        Cuts a filename into its (still encoded and padded) fields.
+
+        Parameters
+        ----------
+        filename_str : str
+            Filename without any paths.
+
+        Returns
+        -------
+        dict
+            Name of fields (keys) and encoded values.
+        """
+
+        return {name: filename_str[start:stop] for name, start, stop in self.slices}
+
+    @property
+    def signature(self):
+        """
+        Cheap signature of filenames following the layout, i.e. their length and the positions of the delimiters.
+        For fields without a defined length, the length of the filename is variable and the signature ends there.
+
+        Returns
+        -------
+        FilenameSignature
+            Signature of the layout.
+        """
+
+        delimiters = []
+        pos = 0
+        length = None
+        for i, field_len in enumerate(self.lengths):
+            if field_len is None:
+                break
+            pos += field_len
+            if i < len(self.names) - 1:
+                delimiters.extend((pos + j, char) for j, char in enumerate(self.delimiters[i]))
+                pos += len(self.delimiters[i])
+        else:
+            length = pos
+
+        return FilenameSignature(length, pos, tuple(delimiters))
+
+    def split_many(self, filenames, names=None):
+        """
+        Cuts many filenames at once into columns of (still encoded and padded) fields.
+        The filenames are sliced as a character matrix, i.e. no Python object is created per filename.
+
+        Parameters
+        ----------
+        filenames : list of str or bytes, numpy.ndarray
+            Filenames without any paths. Filenames given as bytes are sliced as bytes and only the requested
+            fields are decoded. If any of them is not ASCII, all are decoded with os.fsdecode first.
+        names : list of str, optional
+            Names of the fields, which should be cut (default: all fields).
+
+        Returns
+        -------
+        OrderedDict
+            Name of fields (keys) and numpy arrays of encoded values (values).
+        """
+
+        filenames = np.asarray(filenames)
+        if filenames.dtype.kind not in ['S', 'U']:
+            filenames = filenames.astype(str)
+        kind = filenames.dtype.kind
+        char_size = 1 if kind == 'S' else 4
+        n = len(filenames)
+        width = max([filenames.dtype.itemsize // char_size] + [stop for _, _, stop in self.slices])
+        chars = np.asarray(filenames, dtype='{}{}'.format(kind, width)).view(kind + '1').reshape(n, width)
+        if kind == 'S' and (chars.view(np.uint8) >= 0x80).any():
+            # byte offsets only correspond to field positions for ASCII filenames
+            return self.split_many([os.fsdecode(filename) for filename in filenames.tolist()], names=names)
+
+        names = self.names if names is None else names
+        columns = OrderedDict((name, np.full(n, '', dtype='U1')) for name in names)
+        for name, start, stop in self.slices:
+            if name in columns and stop > start:
+                column = np.ascontiguousarray(chars[:, start:stop]).view('{}{}'.format(kind, stop - start)).ravel()
+                columns[name] = column.astype('U{}'.format(stop - start)) if kind == 'S' else column
+
+        return columns
+
+
+class FilenameSignature(namedtuple('FilenameSignature', ['length', 'min_length', 'delimiters'])):
+    """
+    Cheap signature of a filename layout, which allows to reject filenames without parsing them.
+
+    Attributes
+    ----------
+    length : int or None
+        Length of the filename without extension (None if variable).
+    min_length : int
+        Minimum length of the filename without extension.
+    delimiters : tuple of tuple
+        (position, character) of all delimiters with a fixed position.
+    """
+
+    __slots__ = ()
+
+    def complies(self, stem):
+        """
+        Checks if a filename without extension complies with the signature.
+
+        Parameters
+        ----------
+        stem : str
+            Filename without paths and extension.
+
+        Returns
+        -------
+        bool
+            True if the filename complies with the signature, else False.
+        """
+
+        if len(stem) < self.min_length or (self.length is not None and len(stem) != self.length):
+            return False
+
+        return all(stem[pos] == char for pos, char in self.delimiters)
+
+
+_layout_cache = {}
+
+
+def compile_layout(fields_def, pad='-', delimiter='_'):
+    """
+    Compiles a fields definition into a FieldLayout. Layouts are cached, i.e. each distinct definition
+    is only compiled once.
+
+    Parameters
+    ----------
+    fields_def : OrderedDict
+        Name of fields (keys) in right order and length (values). Only "len", "start", "delim" and "pad"
+        are considered.
+    pad : str, optional
+        Padding symbol (default: '-').
+    delimiter : str, optional
+        Delimiter (default: '_')
+
+    Returns
+    -------
+    FieldLayout
+        Slice table of the filename.
+    """
+
+    key = (pad, delimiter) + tuple((name, value.get('len'), value.get('start'), value.get('delim'), value.get('pad'))
+                                   for name, value in fields_def.items())
+    layout = _layout_cache.get(key)
+    if layout is None:
+        names, lengths, delimiters, pads, slices = [], [], [], [], []
+        start = 0
+        for name, length, field_start, field_delim, field_pad in key[2:]:
+            # parse part of filename via start and end position
+            if length is not None:
+                if field_start is not None:
+                    start = field_start
+                slices.append((name, start, start + length))
+                start += length
+
+            field_delim = delimiter if field_delim is None else field_delim
+            start += len(field_delim)
+
+            names.append(name)
+            lengths.append(length)
+            delimiters.append(field_delim)
+            pads.append(pad if field_pad is None else field_pad)
+
+        layout = FieldLayout(tuple(names), tuple(lengths), tuple(delimiters), tuple(pads), tuple(slices))
+        _layout_cache[key] = layout
+
+    return layout
+
+
+_regex_cache = {}
+
+
+def compile_regex(fields_def, pad='-', delimiter='_', ext=None):
+    """
+    Derives a regular expression from a fields definition, which matches complete filenames following this
+    definition. Each field becomes a named group. Regular expressions are cached, i.e. each distinct definition
+    is only compiled once.
+
+    Parameters
+    ----------
+    fields_def : OrderedDict
+        Name of fields (keys) in right order and length (values). Next to "len", "delim" and "pad", a field
+        definition can contain:
+            - "regex": str, optional
+                Regular expression of the field content (default: any characters of the given length).
+    pad : str, optional
+        Padding symbol (default: '-').
+    delimiter : str, optional
+        Delimiter (default: '_')
+    ext : str, optional
+        File name extension. If not given, any extension is accepted (default: None).
+
+    Returns
+    -------
+    regex.Pattern
+        Compiled regular expression.
+    """
+
+    key = (pad, delimiter, ext) + tuple((name, value.get('len'), value.get('delim'), value.get('regex'))
+                                        for name, value in fields_def.items())
+    regex = _regex_cache.get(key)
+    if regex is None:
+        pattern = ''
+        for i, (name, length, field_delim, field_regex) in enumerate(key[3:]):
+            if field_regex is None:
+                field_regex = '.{{{}}}'.format(length) if length is not None else '[^.\\n]*?'
+            pattern += '(?P<{}>{})'.format(name, field_regex)
+            if i < len(key) - 4:
+                pattern += re.escape(delimiter if field_delim is None else field_delim)
+        pattern += '(?:\\.[^\\n]*)?' if ext is None else re.escape(ext)
+        regex = re.compile('^' + pattern + '$', flags=re.MULTILINE)
+        _regex_cache[key] = regex
+
+    return regex
+
+
+def to_bytes_regex(regex):
+    """
+    Converts a (cached) regular expression for filenames into one matching filenames given as bytes.
+
+    Parameters
+    ----------
+    regex : regex.Pattern
+        Compiled regular expression (e.g., from 'compile_regex').
+
+    Returns
+    -------
+    regex.Pattern
+        Compiled regular expression for bytes.
+    """
+
+    key = ('bytes', regex.pattern)
+    bytes_regex = _regex_cache.get(key)
+    if bytes_regex is None:
+        bytes_regex = re.compile(regex.pattern.encode(), flags=re.MULTILINE)
+        _regex_cache[key] = bytes_regex
+
+    return bytes_regex
+
+
+@lru_cache(maxsize=65536)
+def cached_strptime(string, format):
+    """
+    Decodes a string into a datetime object. Results are cached, i.e. identical strings
+    (e.g. the same date in filenames of many tiles) are only decoded once.
+
+    Parameters
+    ----------
+    string : str
+        String needed to be decoded to a datetime object.
+    format : str
+        Datetime format (e.g., '%Y%m%d').
+
+    Returns
+    -------
+    datetime.datetime
+        Datetime object parsed from the given string.
+    """
+
+    return datetime.strptime(string, format)
+
+
+# fixed-width directives supported by 'parse_datetime64' and their number of digits
+_datetime64_directives = OrderedDict([('%Y', 4), ('%m', 2), ('%d', 2), ('%H', 2), ('%M', 2), ('%S', 2)])
+
+
+def parse_datetime64(column, format):
+    """
+    Decodes a column of fixed-width date/time strings at once by evaluating their digits, i.e. without
+    calling 'datetime.strptime' per value. Values, which do not comply with the format (e.g., empty or padded
+    values) are set to NaT.
+
+    Parameters
+    ----------
+    column : numpy.ndarray or list of str
+        Encoded date/time values.
+    format : str
+        Datetime format consisting of the directives '%Y', '%m', '%d', '%H', '%M', '%S' and literal characters
+        (e.g., '%Y%m%d', '%H%M%S', '%Y%m%dT%H%M%S' or '%Y%m%d%H%M%S').
+
+    Returns
+    -------
+    numpy.ndarray
+        Array of numpy.datetime64[s] values, or numpy.timedelta64[s] values (time of the day) if the format
+        only consists of a time.
+    """
+
+    # locate the directives and literals within the fixed-width strings
+    positions = dict()
+    literals = []
+    width = 0
+    i = 0
+    while i < len(format):
+        if format[i] == '%':
+            directive = format[i:i + 2]
+            if directive not in _datetime64_directives:
+                raise ValueError("Unsupported datetime directive: {:}".format(directive))
+            positions[directive] = (width, width + _datetime64_directives[directive])
+            width += _datetime64_directives[directive]
+            i += 2
+        else:
+            literals.append((width, format[i]))
+            width += 1
+            i += 1
+
+    column = np.asarray(column, dtype=str)
+    n = len(column)
+    chars = column.astype('U{:d}'.format(width)).view('U1').reshape(n, width)
+    digits = chars.view(np.uint32).astype(np.int64) - ord('0')
+
+    valid = np.char.str_len(column) == width
+    for pos, literal in literals:
+        valid &= chars[:, pos] == literal
+
+    def to_int(directive, default):
+        if directive not in positions:
+            return np.full(n, default, dtype=np.int64)
+        start, stop = positions[directive]
+        number = np.zeros(n, dtype=np.int64)
+        for k in range(start, stop):
+            valid[:] &= (digits[:, k] >= 0) & (digits[:, k] <= 9)
+            number = number * 10 + digits[:, k]
+        return number
+
+    year, month, day = to_int('%Y', 1970), to_int('%m', 1), to_int('%d', 1)
+    hour, minute, second = to_int('%H', 0), to_int('%M', 0), to_int('%S', 0)
+    valid &= (hour < 24) & (minute < 60) & (second < 60)
+    seconds = (hour * 3600 + minute * 60 + second).astype('timedelta64[s]')
+
+    if not any(directive in positions for directive in ['%Y', '%m', '%d']):
+        seconds[~valid] = np.timedelta64('NaT')
+        return seconds
+
+    valid &= (month >= 1) & (month <= 12) & (day >= 1)
+    months = ((year - 1970) * 12 + month - 1).astype('datetime64[M]')
+    days = months.astype('datetime64[D]') + (day - 1).astype('timedelta64[D]')
+    # days exceeding the month (e.g., 20180230) are invalid
+    valid &= days.astype('datetime64[M]') == months
+
+    values = days.astype('datetime64[s]') + seconds
+    values[~valid] = np.datetime64('NaT')
+
+    return values
+
+
+def factorize(column):
+    """
+    Encodes a column as integer codes referring to its distinct values. Unlike the default of
+    pandas.factorize, missing values are kept as a distinct value (independent of the pandas version).
+
+    Parameters
+    ----------
+    column : numpy.ndarray
+        Values (must be hashable).
+
+    Returns
+    -------
+    codes : numpy.ndarray
+        Integer codes of the values.
+    uniques : numpy.ndarray
+        Distinct values (missing values as None).
+    """
+
+    codes, uniques = pd.factorize(column)
+    missing = codes < 0
+    if missing.any():
+        codes = np.where(missing, len(uniques), codes)
+        uniques = np.append(np.asarray(uniques, dtype=object), None)
+
+    return codes, uniques
+
+
+def map_unique(column, func):
+    """
+    Applies a function to each distinct value of a column only once.
+
+    Parameters
+    ----------
+    column : numpy.ndarray
+        Values (must be hashable).
+    func : function
+        Function applied to each distinct value.
+
+    Returns
+    -------
+    numpy.ndarray
+        Array of objects holding the function results.
+    """
+
+    codes, uniques = factorize(column)
+    values = np.empty(len(uniques), dtype=object)
+    for i, value in enumerate(uniques):
+        values[i] = func(value)
+
+    return values[codes]
+
+
+def decode_value(value, pad='-', decoder=None, convert=False):
+    """
+    Strips the padding from an encoded field value and decodes it if requested.
+
+    Parameters
+    ----------
+    value : str
+        Encoded field value.
+    pad : str, optional
+        Padding symbol (default: '-').
+    decoder : function, optional
+        Decodes a certain value (str -> object).
+    convert : bool, optional
+        If true, an empty value is set to None and the decoder is applied (default is False).
+
+    Returns
+    -------
+    str, object
+        Stripped or decoded value.
+    """
+
+    value = value.strip(pad)
+    if convert:
+        if value == '':
+            value = None
+        elif decoder is not None:
+            value = decoder(value)
+
+    return value
+
+
+def decode_column(column, pad='-', decoder=None, convert=False, categorical=False):
+    """
+    Strips the padding from a column of encoded field values and decodes them if requested.
+    Each distinct value is only processed once.
+
+    Parameters
+    ----------
+    column : numpy.ndarray
+        Encoded field values.
+    pad : str, optional
+        Padding symbol (default: '-').
+    decoder : function, optional
+        Decodes a certain value (str -> object).
+    convert : bool, optional
+        If true, empty values are set to None and the decoder is applied (default is False).
+    categorical : bool, optional
+        If true, the values are dictionary-encoded, i.e. integer codes referring to a table of distinct values
+        (default is False).
+
+    Returns
+    -------
+    numpy.ndarray or pandas.Categorical
+        Array of objects or categorical holding the stripped or decoded values. Missing (None) values have
+        the code -1 in a categorical.
+    """
+
+    if not categorical:
+        return map_unique(column, lambda value: decode_value(value, pad=pad, decoder=decoder, convert=convert))
+
+    codes, uniques = factorize(column)
+    values = np.empty(len(uniques), dtype=object)
+    for i, value in enumerate(uniques):
+        values[i] = decode_value(value, pad=pad, decoder=decoder, convert=convert)
+    # different encoded values may decode to the same value (e.g., differently padded)
+    value_codes, categories = pd.factorize(values)
+
+    return pd.Categorical.from_codes(value_codes[codes], categories=categories)
+
+
+@lru_cache(maxsize=None)
+def record_type(name, fields):
+    """
+    Returns a (cached) lightweight record type holding a selection of filename fields.
+
+    Parameters
+    ----------
+    name : str
+        Name of the record type (e.g., 'SgrtFilenameRecord').
+    fields : tuple of str
+        Names of the fields.
+
+    Returns
+    -------
+    class
+        Named tuple type with the given fields.
+    """
+
+    return namedtuple(name, fields)
+
+
+def encode_value(value, length=None, pad='-', encoder=None):
+    """
+    Encodes a field value and pads it to the given length.
+
+    Parameters
+    ----------
+    value : object
+        Field value.
+    length : int, optional
+        Length of the field. If not given, the value is not padded.
+    pad : str, optional
+        Padding symbol (default: '-').
+    encoder : function, optional
+        Encodes a certain value (object -> str).
+
+    Returns
+    -------
+    str
+        Encoded and padded value.
+    """
+
+    if value is None or (not isinstance(value, str) and pd.isnull(value)):
+        value = ''
+    elif encoder is not None:
+        value = encoder(value)
+    value = str(value)
+    if length is not None:
+        if len(value) > length:
+            err_msg = "Length does not comply with definition: {:} > {:}".format(len(value), length)
+            raise ValueError(err_msg)
+        value = value.ljust(length, pad)
+
+    return value
+
+
+def encode_column(column, length=None, pad='-', encoder=None):
+    """
+    Encodes a column of field values and pads them to the given length.
+    Each distinct value is only processed (and validated) once.
+
+    Parameters
+    ----------
+    column : numpy.ndarray
+        Field values.
+    length : int, optional
+        Length of the field. If not given, values are not padded.
+    pad : str, optional
+        Padding symbol (default: '-').
+    encoder : function, optional
+        Encodes a certain value (object -> str).
+
+    Returns
+    -------
+    numpy.ndarray
+        Array of encoded and padded strings.
+    """
+
+    return map_unique(column, lambda value: encode_value(value, length=length, pad=pad, encoder=encoder)).astype(str)
+
+
+def to_columns(fields):
+    """
+    Converts field values into columns of equal length. Single values are repeated.
+
+    Parameters
+    ----------
+    fields : dict or pandas.DataFrame
+        Name of fields (keys) and values or array-like columns (values).
+
+    Returns
+    -------
+    OrderedDict
+        Name of fields (keys) and numpy arrays of objects (values).
+    """
+
+    fields = OrderedDict(fields.items())
+    lengths = set(len(value) for value in fields.values() if not isinstance(value, str) and np.ndim(value) > 0)
+    if len(lengths) > 1:
+        raise ValueError("Columns have different lengths: {}".format(sorted(lengths)))
+    n = lengths.pop() if lengths else 1
+
+    columns = OrderedDict()
+    for name, value in fields.items():
+        if isinstance(value, str) or np.ndim(value) == 0:
+            column = np.empty(n, dtype=object)
+            column[:] = [value] * n
+        else:
+            column = pd.Series(value).astype(object).to_numpy()
+        columns[name] = column
+
+    return columns
+
+
+def identity(x):
+    """
+    Default en- and decoder of a filename part, returning the given value.
+    """
+
+    return x
+
+
+# types of values, which can be shared safely by many filenames
+_immutable_types = (str, bytes, int, float, bool, dt.date, dt.time, dt.timedelta, np.datetime64)
+
+
+class InternPool(object):
+    """
+    Pool of field values shared by many filenames (flyweights), i.e. identical values are represented by one object.
+    Only values of immutable types are pooled, all others are returned unchanged.
+    A pool can be assigned to a naming convention via its class attribute 'intern_pool',
+    e.g. SgrtFilename.intern_pool = InternPool().
+    """
+
+    def __init__(self):
+        """
+        Constructor of InternPool class.
+        """
+
+        self._values = {}
+
+    def intern(self, value):
+        """
+        Returns the pooled object being equal to the given value. Unknown values are added to the pool.
+
+        Parameters
+        ----------
+        value : object
+            Encoded or decoded field value.
+
+        Returns
+        -------
+        object
+            Shared object representing the value.
+        """
+
+        if not isinstance(value, _immutable_types):
+            return value
+
+        # the type is part of the key, since e.g. 1 == 1.0 == True
+        return self._values.setdefault((type(value), value), value)
+
+    def clear(self):
+        """
+        Removes all values from the pool.
+        """
+
+        self._values.clear()
+
+    def __len__(self):
+        """
+        Returns the number of pooled values.
+
+        Returns
+        -------
+        int
+            Number of pooled values.
+        """
+
+        return len(self._values)
 
 
 class SmartFilenamePart(object):
     """ Represents a part of filename. """
 
-    def __init__(self, arg, start=0, length=None, delimiter="_", pad="-", decoder=None, encoder=None):
+    def __init__(self, arg, start=0, length=None, delimiter="_", pad="-", decoder=None, encoder=None, pool=None):
         """
         Constructor of SmartFilenamePart class.
 
@@ -42,114 +726,734 @@ class SmartFilenamePart(object):
             Decodes a certain value (str -> object).
         encoder: function, optional
             Encodes a certain value (object -> str).
+        pool: InternPool, optional
+            Pool sharing identical decoded values between filenames.
+        """
+
+        self.arg = arg
+        self.start = start
+        self.delimiter = delimiter
+        self.pad = pad
+        self.decoder = identity if decoder is None else decoder
+        self.encoder = identity if encoder is None else encoder
+        self.pool = pool
+        self.length = length if length is not None else len(self.encoded)
+        self._decoded = None
+
+        # check validity
+        if not self.is_valid():
+            err_msg = "Length does not comply with definition: {:} > {:}".format(len(self), self.length)
+            raise ValueError(err_msg)
+
+    def is_valid(self):
+        """
+        Checks if a SmartFilenamePart instance is valid.
+        It is valid if the specified length is equal to the length of the SmartFilenamePart.
+
+        Returns
+        -------
+        bool
+            True if SmartFilenamePart instance is valid, else False.
+        """
+
+        return self.length == len(self)
+
+    def update(self, arg):
+        """
+        Sets a new argument in place. The argument is validated before it is set,
+        i.e. an invalid argument leaves the SmartFilenamePart unchanged.
+
+        Parameters
+        ----------
+        arg: object
+            Input argument, which can be a string or the decoded part of the filename.
+        """
+
+        encoded = self.encoder(arg)
+        if len(encoded) > self.length:
+            err_msg = "Length does not comply with definition: {:} > {:}".format(len(encoded), self.length)
+            raise ValueError(err_msg)
+
+        self.arg = arg
+
+    @property
+    def encoded(self):
+        """
+        Converts filename part to an encoded (string) representation.
+
+        Returns
+        -------
+        str
+            Encoded (string) representation of a filename part.
+        """
+
+        return self.encoder(self.arg)
+
+    @property
+    def decoded(self):
+        """
+        Converts filename part to a decoded (object) representation.
+
+        Returns
+        -------
+        object
+            Decoded (object) representation of a filename part.
+        """
+
+        # the decoded value is memoized as long as the argument stays the same
+        if self._decoded is None or self._decoded[0] is not self.arg:
+            enc_wo_pad = self.encoded.strip(self.pad)
+            if enc_wo_pad != '':
+                decoded = self.decoder(enc_wo_pad)
+                if self.pool is not None:
+                    decoded = self.pool.intern(decoded)
+            else:
+                decoded = None
+            self._decoded = (self.arg, decoded)
+
+        return self._decoded[1]
+
+    def __repr__(self):
+        """
+        Returns the string representation of the class.
+
+        Returns
+        -------
+        str
+            String representation of the class.
         """
 
-        self.arg = arg
-        self.start = start
-        self.delimiter = delimiter
-        self.pad = pad
-        self.decoder = (lambda x: x) if decoder is None else decoder
-        self.encoder = (lambda x: x) if encoder is None else encoder
-        self.length = length if length is not None else len(self.encoded)
+        return self.encoded.ljust(self.length, self.pad)
+
+    def __len__(self):
+        """
+        Returns length of the filename part.
+
+        Returns
+        -------
+        int
+            Length of the filename part.
+        """
+
+        return len(str(self))
+
+    def __add__(self, other):
+        """
+        Defines summation rule for two SmartFilenamePart/str instances.
+
+        Parameters
+        ----------
+        other: SmartFilenamePart, str
+            Second summand.
+
+        Returns
+        -------
+        str
+            Concatenated strings separated by a delimiter.
+        """
+
+        return str(self) + self.delimiter + str(other)
+
+
+class FilenameObj(object):
+    """
+    Gives access to all filename fields as attributes. A field is only decoded when its attribute is accessed for
+    the first time; afterwards the value is kept as a common attribute.
+    """
+
+    def __init__(self, fn_map, convert=False):
+        """
+        Constructor of FilenameObj class.
+
+        Parameters
+        ----------
+        fn_map : OrderedDict
+            Map between filename part names and SmartFilenamePart instances.
+        convert: bool, optional
+            If true, attributes are decoded, else they are encoded strings (default is False).
+        """
+
+        self._fn_map = fn_map
+        self._convert = convert
+
+    def __getattr__(self, name):
+        """
+        Decodes and memoizes a field, which has not been accessed yet.
+
+        Parameters
+        ----------
+        name : str
+            Name of the field.
+
+        Returns
+        -------
+        str, object
+            Encoded (convert=False) or decoded (convert=True) field.
+        """
+
+        fn_map = self.__dict__.get('_fn_map')
+        if fn_map is None or name not in fn_map:
+            raise AttributeError("'FilenameObj' object has no attribute '{}'".format(name))
+
+        value = fn_map[name].decoded if self._convert else fn_map[name].encoded
+        setattr(self, name, value)
+
+        return value
+
+
+class CompactSpec(namedtuple('CompactSpec', ['convention', 'fields'])):
+    """
+    Shared description of compact filenames of one naming convention (and layout).
+
+    Attributes
+    ----------
+    convention : class
+        Naming convention (subclass of SmartFilename) the filenames belong to.
+    fields : OrderedDict
+        Name of fields (keys) and a tuple (start, stop, pad, decoder) locating and decoding each field (values).
+    """
+
+    __slots__ = ()
+
+
+def compile_compact_spec(convention, fields_def, pad='-', delimiter='_'):
+    """
+    Compiles a fields definition into a CompactSpec, i.e. a slice and decoder table shared by compact filenames.
+
+    Parameters
+    ----------
+    convention : class
+        Naming convention (subclass of SmartFilename).
+    fields_def : OrderedDict
+        Name of fields (keys) in right order and length (values). Decoders are taken from the key "decoder".
+    pad : str, optional
+        Padding symbol (default: '-').
+    delimiter : str, optional
+        Delimiter (default: '_')
+
+    Returns
+    -------
+    CompactSpec
+        Slice and decoder table.
+    """
+
+    layout = compile_layout(fields_def, pad=pad, delimiter=delimiter)
+    slices = dict((name, (start, stop)) for name, start, stop in layout.slices)
+    fields = OrderedDict()
+    for name, field_pad in zip(layout.names, layout.pads):
+        start, stop = slices.get(name, (0, 0))
+        fields[name] = (start, stop, field_pad, fields_def[name].get('decoder'))
+
+    return CompactSpec(convention, fields)
+
+
+class CompactFilename(object):
+    """
+    Compact and immutable representation of a filename following a naming convention. Only the filename itself is
+    stored, fields are cut out of it and decoded on access. The slice and decoder table is shared by all filenames of
+    a convention, which makes it suitable for catalogues of millions of filenames. Properties of the naming convention
+    (e.g. 'stime') are evaluated on a SmartFilename, which is created on first access and kept afterwards.
+    """
+
+    __slots__ = ('filename', '_spec', '_convert', '_smart_fn')
+
+    def __init__(self, filename, spec, convert=False):
+        """
+        Constructor of CompactFilename class.
+
+        Parameters
+        ----------
+        filename : str
+            Filename without any paths.
+        spec : CompactSpec
+            Slice and decoder table of the naming convention.
+        convert: bool, optional
+            If true, fields are decoded, else they are encoded strings (default is False).
+        """
+
+        object.__setattr__(self, 'filename', filename)
+        object.__setattr__(self, '_spec', spec)
+        object.__setattr__(self, '_convert', convert)
+        object.__setattr__(self, '_smart_fn', None)
+
+    @property
+    def convention(self):
+        """
+        Returns the naming convention of the filename.
+
+        Returns
+        -------
+        class
+            Subclass of SmartFilename.
+        """
+
+        return self._spec.convention
+
+    @property
+    def ext(self):
+        """
+        Returns the extension of the filename.
+
+        Returns
+        -------
+        str
+            File name extension (e.g., '.tif').
+        """
+
+        return os.path.splitext(self.filename)[1]
+
+    @property
+    def obj(self):
+        """
+        Gives access to all filename fields as attributes, like SmartFilename.obj.
+
+        Returns
+        -------
+        CompactFilename
+            The compact filename itself.
+        """
+
+        return self
+
+    def to_smartfilename(self):
+        """
+        Converts the compact filename into a fully-fledged (mutable) object of its naming convention.
+
+        Returns
+        -------
+        SmartFilename
+            Class representing the filename.
+        """
+
+        return self.convention.from_filename(self.filename, convert=self._convert)
+
+    def _get_property(self, name):
+        """
+        Evaluates a property of the naming convention, e.g. 'stime'.
+
+        Parameters
+        ----------
+        name : str
+            Name of the property.
+
+        Returns
+        -------
+        object
+            Value of the property.
+
+        Raises
+        ------
+        AttributeError
+            If the naming convention has no property with the given name.
+        """
+
+        if not isinstance(getattr(self.convention, name, None), property):
+            raise AttributeError("'CompactFilename' object has no attribute '{}'".format(name))
+
+        if self._smart_fn is None:
+            object.__setattr__(self, '_smart_fn', self.to_smartfilename())
+
+        return getattr(self._smart_fn, name)
+
+    def __getitem__(self, name):
+        """
+        Returns the value of the field with a given key.
+
+        Parameters
+        ----------
+        name : str
+            Name of the field.
+
+        Returns
+        -------
+        str, object
+            Part of the filename associated with given key. Depending on the chosen flag 'convert', it is either a str
+            (convert=False) or an object. If the key can't be found in the fields definition, the method tries to return
+            a property of the naming convention.
+        """
+
+        try:
+            start, stop, pad, decoder = self._spec.fields[name]
+        except KeyError:
+            try:
+                return self._get_property(name)
+            except AttributeError:
+                raise KeyError("Field name undefined: {:}".format(name))
+
+        value = decode_value(self.filename[start:stop], pad=pad, decoder=decoder, convert=self._convert)
+        pool = self._spec.convention.intern_pool
+
+        return value if pool is None else pool.intern(value)
+
+    def __getattr__(self, name):
+        """
+        Returns the value of the field or of the property of the naming convention with the given attribute name.
+
+        Parameters
+        ----------
+        name : str
+            Name of the field or property.
+
+        Returns
+        -------
+        str, object
+            Encoded (convert=False) or decoded (convert=True) field, or value of the property.
+        """
+
+        if name.startswith('_'):
+            raise AttributeError("'CompactFilename' object has no attribute '{}'".format(name))
+        if name not in self._spec.fields:
+            return self._get_property(name)
+
+        return self[name]
+
+    def __setattr__(self, name, value):
+        """
+        Prevents changing the filename.
+        """
+
+        raise AttributeError("'CompactFilename' object is immutable")
+
+    def sort_key(self, *names):
+        """
+        Returns a key for sorting filenames by the given fields. The fixed-width, encoded and padded
+        parts of the filename are compared, i.e. nothing is decoded.
+
+        Parameters
+        ----------
+        *names : str
+            Names of the fields in the order of their priority.
+
+        Returns
+        -------
+        tuple of str
+            Encoded fields.
+        """
+
+        fields = self._spec.fields
+        return tuple(self.filename[fields[name][0]:fields[name][1]] for name in names)
+
+    def __eq__(self, other):
+        """
+        Compares filenames by value.
+
+        Parameters
+        ----------
+        other : object
+            Object to compare with.
+
+        Returns
+        -------
+        bool
+            True if both objects represent the same filename.
+        """
+
+        if isinstance(other, (CompactFilename, SmartFilename)):
+            return str(self) == str(other)
+        return NotImplemented
+
+    def __hash__(self):
+        """
+        Returns the hash of the filename.
+
+        Returns
+        -------
+        int
+            Hash value.
+        """
+
+        return hash(self.filename)
+
+    def __reduce__(self):
+        """
+        Reduces the object to its naming convention and filename, which makes it picklable.
+
+        Returns
+        -------
+        tuple
+            Callable and arguments restoring the object.
+        """
+
+        return self.convention.compact, (self.filename, self._convert)
+
+    def __repr__(self):
+        """
+        Returns the string representation of the class.
+
+        Returns
+        -------
+        str
+            Filename.
+        """
+
+        return self.filename
+
+
+_compact_specs = {}
+
+
+def field_sort_key(*names):
+    """
+    Returns a key function for sorting SmartFilename or CompactFilename objects by the given fields,
+    e.g. sorted(filenames, key=field_sort_key('tile_name', 'dtime_1')).
+
+    Parameters
+    ----------
+    *names : str
+        Names of the fields in the order of their priority.
+
+    Returns
+    -------
+    function
+        Key function returning the encoded fields of a filename.
+    """
+
+    def key(smart_fn):
+        return smart_fn.sort_key(*names)
+
+    return key
+
+
+# registered naming conventions, i.e. subclasses of SmartFilename defining their own 'fields_def'
+_conventions = []
+
+# sorted naming conventions with their signatures and regular expressions per state of the registry
+_detectors = {}
+
+# layouts and signatures of the naming conventions
+_layouts = {}
+_signatures = {}
+
+# naming conventions shipped with geopathfinder
+builtin_conventions = ['geopathfinder.naming_conventions.sgrt_naming',
+                       'geopathfinder.naming_conventions.bmon_naming',
+                       'geopathfinder.naming_conventions.eodr_naming']
+
+
+def get_conventions():
+    """
+    Returns all registered naming conventions. Conventions with a fixed filename length come first.
+    The conventions shipped with geopathfinder are always registered.
+
+    Returns
+    -------
+    list of class
+        Registered subclasses of SmartFilename.
+    """
+
+    return [convention for convention, _, _ in _get_detectors()]
+
+
+def _get_detectors():
+    """
+    Returns the (cached) registered naming conventions together with their signatures and regular expressions.
+    The cache is renewed whenever a naming convention is registered or removed.
+
+    Returns
+    -------
+    list of tuple
+        (convention, signature, regex) for each registered naming convention in the order of 'get_conventions'.
+    """
+
+    for module_name in builtin_conventions:
+        if module_name not in sys.modules:
+            importlib.import_module(module_name)
+
+    key = tuple(_conventions)
+    detectors = _detectors.get(key)
+    if detectors is None:
+        conventions = sorted(_conventions, key=lambda convention: convention.get_signature().length is None)
+        detectors = [(convention, convention.get_signature(), convention.get_regex()) for convention in conventions]
+        _detectors.clear()
+        _detectors[key] = detectors
+
+    return detectors
+
+
+def detect_convention(filename_str):
+    """
+    Detects the naming convention of a filename. Conventions are preselected by their signature
+    (filename length and delimiter positions) and confirmed by their regular expression.
+
+    Parameters
+    ----------
+    filename_str : str
+        Filename without any paths.
+
+    Returns
+    -------
+    class or None
+        Naming convention (subclass of SmartFilename) of the filename or None if no convention applies.
+    """
+
+    stem = os.path.splitext(filename_str)[0]
+    for convention, signature, regex in _get_detectors():
+        if signature.complies(stem) and regex.match(filename_str):
+            return convention
+
+    return None
+
+
+def partition_by_convention(filenames):
+    """
+    Partitions a listing of filenames by their naming conventions (see 'detect_convention').
+    Signatures are checked once per filename length, and all candidates of a convention
+    are confirmed with one regular expression pass.
+
+    Parameters
+    ----------
+    filenames : list of str
+        Filenames without any paths.
+
+    Returns
+    -------
+    OrderedDict
+        Naming conventions (keys) and list of filenames (values). Filenames without a convention are
+        collected under the key None.
+    """
+
+    filenames = list(filenames)
+
+    # group filenames by the length of their stem
+    remaining = OrderedDict()
+    for filename in filenames:
+        remaining.setdefault(len(os.path.splitext(filename)[0]), []).append(filename)
+
+    partitions = OrderedDict()
+    for convention, signature, _ in _get_detectors():
+        candidates = []
+        for length, group in remaining.items():
+            if length >= signature.min_length and (signature.length is None or length == signature.length):
+                candidates.extend(group)
+        candidates = [filename for filename in candidates if signature.complies(os.path.splitext(filename)[0])]
+        valid = set(convention.filter_valid(candidates))
+        if valid:
+            partitions[convention] = [filename for filename in filenames if filename in valid]
+            for length in list(remaining.keys()):
+                remaining[length] = [filename for filename in remaining[length] if filename not in valid]
+
+    unknown = set(filename for group in remaining.values() for filename in group)
+    if unknown:
+        partitions[None] = [filename for filename in filenames if filename in unknown]
+
+    return partitions
+
+
+class SmartFilename(object):
+
+    """
+    SmartFilename class handles file names with pre-defined field names
+    and field length.
+    """
 
-        # check validity
-        if not self.is_valid():
-            err_msg = "Length does not comply with definition: {:} > {:}".format(len(self), self.length)
-            raise ValueError(err_msg)
+    # optional InternPool sharing identical (encoded and decoded) field values between filenames
+    intern_pool = None
 
-    def is_valid(self):
+    def __init_subclass__(cls, **kwargs):
         """
-        Checks if a SmartFilenamePart instance is valid.
-        It is valid if the specified length is equal to the length of the SmartFilenamePart.
-
-        Returns
-        -------
-        bool
-            True if SmartFilenamePart instance is valid, else False.
+        Registers subclasses defining their own 'fields_def' as naming conventions. Only subclasses with the
+        class attributes 'pad' and 'delimiter' are registered, since a convention is detected by them.
         """
 
-        return self.length == len(self)
+        super().__init_subclass__(**kwargs)
+        if 'fields_def' in cls.__dict__ and hasattr(cls, 'pad') and hasattr(cls, 'delimiter'):
+            _conventions.append(cls)
 
-    @property
-    def encoded(self):
+    @classmethod
+    def get_layout(cls):
         """
-        Converts filename part to an encoded (string) representation.
+        Returns the (cached) layout of a naming convention, derived from its class attributes
+        'fields_def', 'pad' and 'delimiter'. It is only compiled once per class.
 
         Returns
         -------
-        str
-            Encoded (string) representation of a filename part.
+        FieldLayout
+            Slice table of the naming convention.
         """
 
-        return self.encoder(self.arg)
+        layout = _layouts.get(cls)
+        if layout is None:
+            layout = compile_layout(cls.fields_def, pad=cls.pad, delimiter=cls.delimiter)
+            _layouts[cls] = layout
 
-    @property
-    def decoded(self):
+        return layout
+
+    @classmethod
+    def get_signature(cls):
         """
-        Converts filename part to a decoded (object) representation.
+        Returns the (cached) signature of a naming convention, derived from its class attributes
+        'fields_def', 'pad' and 'delimiter'.
 
         Returns
         -------
-        object
-            Decoded (object) representation of a filename part.
+        FilenameSignature
+            Signature of the naming convention.
         """
 
-        enc_wo_pad = self.encoded.strip(self.pad)
-        if enc_wo_pad != '':
-            return self.decoder(enc_wo_pad)
-        else:
-            return None
+        signature = _signatures.get(cls)
+        if signature is None:
+            signature = cls.get_layout().signature
+            _signatures[cls] = signature
 
-    def __repr__(self):
+        return signature
+
+    @classmethod
+    def decoding_fields_def(cls):
         """
-        Returns the string representation of the class.
+        Returns the fields definition of a naming convention extended by decoders, which do not depend on an instance.
 
         Returns
         -------
-        str
-            String representation of the class.
+        OrderedDict
+            Fields definition.
         """
 
-        return self.encoded.ljust(self.length, self.pad)
+        return cls.fields_def
 
-    def __len__(self):
+    @classmethod
+    def compact(cls, filename_str, convert=False):
         """
-        Returns length of the filename part.
+        Converts a filename given as a string into a compact and immutable record of a naming convention.
+
+        Parameters
+        ----------
+        filename_str : str
+            Filename without any paths.
+        convert: bool, optional
+            If true, fields are decoded on access, else they are encoded strings (default is False).
 
         Returns
         -------
-        int
-            Length of the filename part.
+        CompactFilename
+            Compact representation of the filename.
         """
 
-        return len(str(self))
+        return CompactFilename(filename_str, cls._get_compact_spec(filename_str), convert=convert)
 
-    def __add__(self, other):
+    @classmethod
+    def _get_compact_spec(cls, filename_str):
         """
-        Defines summation rule for two SmartFilenamePart/str instances.
+        Returns the (cached) slice and decoder table of a naming convention.
 
         Parameters
         ----------
-        other: SmartFilenamePart, str
-            Second summand.
+        filename_str : str
+            Filename without any paths. Only needed by conventions with a variable layout.
 
         Returns
         -------
-        str
-            Concatenated strings separated by a delimiter.
+        CompactSpec
+            Slice and decoder table.
         """
 
-        return str(self) + self.delimiter + str(other)
-
-
-class SmartFilename(object):
+        spec = _compact_specs.get(cls)
+        if spec is None:
+            spec = compile_compact_spec(cls, cls.decoding_fields_def(), pad=cls.pad, delimiter=cls.delimiter)
+            _compact_specs[cls] = spec
 
-    """
-    SmartFilename class handles file names with pre-defined field names
-    and field length.
-    """
+        return spec
 
-    def __init__(self, fields, fields_def, ext=None, pad='-', delimiter='_', convert=False):
+    def __init__(self, fields, fields_def, ext=None, pad='-', delimiter='_', convert=False, layout=None):
         """
         Define name of fields, length, pad and delimiter symbol.
 
@@ -175,23 +1479,31 @@ class SmartFilename(object):
             Delimiter (default: '_')
         convert: bool, optional
             If true, decoding is applied to parts of the filename, where such an operation is available (default is False).
+        layout : FieldLayout, optional
+            Layout of 'fields_def', 'pad' and 'delimiter', e.g. from 'get_layout' (default: compiled from them).
         """
         self.ext = ext
         self.delimiter = delimiter
         self.pad = pad
         self.convert = convert
+        self._layout = compile_layout(fields_def, pad=pad, delimiter=delimiter) if layout is None else layout
         self._fn_map = self.__build_map(fields, fields_def)
+        self._fn_cache = None
+        self._hashed = False
         self.obj = self.__init_filename_obj()
 
     @classmethod
-    def from_filename(cls, filename_str, fields_def, pad="-", delimiter="_", convert=False):
+    def from_filename(cls, filename_str, fields_def, pad="-", delimiter="_", convert=False, fields=None,
+                      layout=None):
         """
-        Converts a filename given as a string into a SmartFilename class object.
+        Converts a filename given as a string into a SmartFilename class object. If only some fields are requested,
+        just these fields are extracted and decoded into a lightweight record.
 
         Parameters
         ----------
-        filename_str : str
-            Filename without any paths (e.g., "M20170725_test.tif").
+        filename_str : str or bytes
+            Filename without any paths (e.g., "M20170725_test.tif"). If it is given as bytes (e.g., from
+            'os.scandir' of a bytes path) and fields are requested, only these fields are decoded.
         fields_def : OrderedDict
             Name of fields (keys) in right order and length (values). It must contain:
                 - "len": int
@@ -208,65 +1520,404 @@ class SmartFilename(object):
             Delimiter (default: '_')
         convert: bool, optional
             If true, decoding is applied to parts of the filename, where such an operation is available (default is False).
+        fields : list of str, optional
+            Names of the requested fields. If given, a named tuple with these fields is returned instead of
+            a SmartFilename. Decoders are taken from the fields definition (default: None).
+        layout : FieldLayout, optional
+            Layout of 'fields_def', 'pad' and 'delimiter', e.g. from 'get_layout' (default: compiled from them).
 
         Returns
         -------
-        SmartFilename
-            Class representing a filename.
+        SmartFilename or namedtuple
+            Class representing a filename or record of the requested fields.
         """
 
+        # byte offsets only correspond to field positions for ASCII filenames
+        if isinstance(filename_str, bytes) and (fields is None or any(byte >= 0x80 for byte in filename_str)):
+            filename_str = os.fsdecode(filename_str)
+
+        if layout is None:
+            layout = compile_layout(fields_def, pad=pad, delimiter=delimiter)
+        if fields is not None:
+            values = []
+            for name in fields:
+                if name not in fields_def:
+                    raise KeyError("Field name undefined: {:}".format(name))
+                for slice_name, start, stop in layout.slices:
+                    if slice_name == name:
+                        value = filename_str[start:stop]
+                        if isinstance(value, bytes):
+                            value = value.decode('ascii')
+                        break
+                else:
+                    value = ''
+                values.append(decode_value(value, pad=layout.pads[layout.names.index(name)],
+                                           decoder=fields_def[name].get('decoder'), convert=convert))
+            return record_type(cls.__name__ + 'Record', tuple(fields))(*values)
+
         # get extensions from filename
         ext = os.path.splitext(filename_str)[1]
+        fn_fields = layout.split(filename_str)
 
-        fields = dict()
-        start = 0
-        for name, value in fields_def.items():
-            # parse part of filename via start and end position
-            if 'start' in value.keys() and 'len' in value.keys():
-                start = value['start']
-                length = value['len']
-                fields[name] = filename_str[start:(start + length)]
-            elif 'len' in value.keys():
-                length = value['len']
-                fields[name] = filename_str[start:(start + length)]
-            else:
-                length = 0
+        if cls.__name__ == "SmartFilename":
+            return cls(fn_fields, fields_def, ext=ext, convert=convert, pad=pad, delimiter=delimiter, layout=layout)
+        else:
+            return cls(fn_fields, ext=ext, convert=convert)
+
+    @classmethod
+    def parse_many(cls, filenames, fields_def, pad="-", delimiter="_", convert=False, fields=None,
+                   categorical=False):
+        """
+        Parses many filenames at once into a table with one column per field, without creating
+        a SmartFilename object per filename.
+
+        Parameters
+        ----------
+        filenames : list of str or numpy.ndarray
+            Filenames without any paths (e.g., ["M20170725_test.tif", "M20170726_test.tif"]).
+        fields_def : OrderedDict
+            Name of fields (keys) in right order and length (values). See 'from_filename'. If a field definition
+            contains a "decoder", it is applied if 'convert' is true. A "column_decoder" is preferred, which
+            decodes a whole column of encoded and padded values at once (e.g., 'parse_datetime64').
+        pad : str, optional
+            Padding symbol (default: '-').
+        delimiter : str, optional
+            Delimiter (default: '_')
+        convert: bool, optional
+            If true, decoding is applied to parts of the filename, where such an operation is available (default is False).
+        fields : list of str, optional
+            Names of the requested fields. If given, only these fields are extracted and decoded (default: all fields).
+        categorical : bool, optional
+            If true, the columns are dictionary-encoded (pandas.Categorical), which saves memory for repeating
+            values and turns equality filters into integer comparisons (default is False).
 
-            start += length
+        Returns
+        -------
+        pandas.DataFrame
+            Table with one row per filename and one column per (requested) field.
+        """
 
-            if 'delim' in value.keys():
-                start += len(value['delim'])
+        layout = compile_layout(fields_def, pad=pad, delimiter=delimiter)
+        names = list(layout.names) if fields is None else list(fields)
+        for name in names:
+            if name not in fields_def:
+                raise KeyError("Field name undefined: {:}".format(name))
+
+        columns = layout.split_many(filenames, names=names)
+        data = OrderedDict()
+        for name in names:
+            column_decoder = fields_def[name].get('column_decoder')
+            if convert and column_decoder is not None:
+                # distinct values are decoded only once
+                codes, uniques = factorize(columns[name])
+                data[name] = column_decoder(np.asarray(uniques, dtype=str))[codes]
+                if categorical:
+                    data[name] = pd.Categorical(data[name])
             else:
-                start += len(delimiter)
+                data[name] = decode_column(columns[name], pad=layout.pads[layout.names.index(name)],
+                                           decoder=fields_def[name].get('decoder'), convert=convert,
+                                           categorical=categorical)
 
-        if cls.__name__ == "SmartFilename":
-            return cls(fields, fields_def, ext=ext, convert=convert, pad=pad, delimiter=delimiter)
-        else:
-            return cls(fields, ext=ext, convert=convert)
+        return pd.DataFrame(data, columns=names)
 
-    def __init_filename_obj(self):
+    @classmethod
+    def get_regex(cls, fields_def=None, pad=None, delimiter=None, ext=None):
         """
-        Initialises the class 'FilenameObj' to set all filename attributes as class variables.
-        This enables an easier access to filename properties.
+        Returns the (cached) regular expression matching filenames of the given definition.
+
+        Parameters
+        ----------
+        fields_def : OrderedDict, optional
+            Name of fields (keys) in right order and length (values). See 'compile_regex'
+            (default: class attribute 'fields_def').
+        pad : str, optional
+            Padding symbol (default: class attribute 'pad' or '-').
+        delimiter : str, optional
+            Delimiter (default: class attribute 'delimiter' or '_')
+        ext : str, optional
+            File name extension. If not given, any extension is accepted (default: None).
 
         Returns
         -------
-        FilenameObj
+        regex.Pattern
+            Compiled regular expression.
+        """
+
+        fields_def = cls.fields_def if fields_def is None else fields_def
+        pad = getattr(cls, 'pad', "-") if pad is None else pad
+        delimiter = getattr(cls, 'delimiter', "_") if delimiter is None else delimiter
+
+        return compile_regex(fields_def, pad=pad, delimiter=delimiter, ext=ext)
+
+    @classmethod
+    def matches(cls, filenames, *args, **kwargs):
+        """
+        Checks many filenames at once against the regular expression of the class. All filenames are matched
+        in one pass over the joined listing.
+
+        Parameters
+        ----------
+        filenames : list of str or bytes
+            Filenames without any paths. Filenames given as bytes are matched without decoding them.
+        *args, **kwargs
+            Arguments passed to 'get_regex' (e.g., 'ext' or, for a plain SmartFilename, the fields definition).
 
+        Returns
+        -------
+        numpy.ndarray
+            Boolean array, which is true for each filename complying with the definition.
         """
 
-        class FilenameObj(object):
-            def __init__(self):
-                pass
+        filenames = list(filenames)
+        valid = np.zeros(len(filenames), dtype=bool)
+        if not filenames:
+            return valid
 
-        filename_obj = FilenameObj()
-        for name, fn_part in self._fn_map.items():
-            if self.convert:
-                setattr(filename_obj, name, fn_part.decoded)
+        regex = cls.get_regex(*args, **kwargs)
+        line_break = '\n'
+        if isinstance(filenames[0], bytes):
+            regex = to_bytes_regex(regex)
+            line_break = b'\n'
+        starts = np.cumsum([0] + [len(filename) + 1 for filename in filenames[:-1]])
+        for match in regex.finditer(line_break.join(filenames)):
+            i = np.searchsorted(starts, match.start(), side='right') - 1
+            # a filename containing a line break can only be matched partially
+            valid[i] = match.end() - match.start() == len(filenames[i])
+
+        return valid
+
+    @classmethod
+    def filter_valid(cls, filenames, *args, **kwargs):
+        """
+        Filters out all filenames, which do not comply with the regular expression of the class.
+
+        Parameters
+        ----------
+        filenames : list of str or bytes
+            Filenames without any paths.
+        *args, **kwargs
+            Arguments passed to 'get_regex' (e.g., 'ext' or, for a plain SmartFilename, the fields definition).
+
+        Returns
+        -------
+        list of str or bytes
+            Filenames complying with the definition.
+        """
+
+        filenames = list(filenames)
+        valid = cls.matches(filenames, *args, **kwargs)
+
+        return [filename for filename, is_valid in zip(filenames, valid) if is_valid]
+
+    @classmethod
+    def validate_many(cls, filenames, fields_def, pad="-", delimiter="_"):
+        """
+        Validates many filenames at once against a fields definition. First, the lengths of the fields and the
+        delimiters are checked in one pass over the joined listing. Second, the contents of fields defining a
+        "regex" are checked, where each distinct value is only checked once.
+
+        Parameters
+        ----------
+        filenames : list of str
+            Filenames without any paths.
+        fields_def : OrderedDict
+            Name of fields (keys) in right order and length (values). See 'compile_regex'.
+        pad : str, optional
+            Padding symbol (default: '-').
+        delimiter : str, optional
+            Delimiter (default: '_')
+
+        Returns
+        -------
+        pandas.DataFrame
+            Table with one row per filename and the boolean columns 'layout' (lengths and delimiters comply),
+            one per field with a "regex" (content complies) and 'valid' (all checks passed).
+        """
+
+        filenames = list(filenames)
+        layout_def = OrderedDict((name, dict((key, value) for key, value in field_def.items() if key != 'regex'))
+                                 for name, field_def in fields_def.items())
+        report = OrderedDict()
+        report['layout'] = SmartFilename.matches(filenames, layout_def, pad=pad, delimiter=delimiter)
+
+        names = [name for name, field_def in fields_def.items() if 'regex' in field_def]
+        if filenames and names:
+            columns = compile_layout(fields_def, pad=pad, delimiter=delimiter).split_many(filenames, names=names)
+            for name in names:
+                regex = re.compile('(?:{})'.format(fields_def[name]['regex']))
+                complies = map_unique(columns[name], lambda value: regex.fullmatch(value) is not None)
+                report[name] = report['layout'] & complies.astype(bool)
+        else:
+            for name in names:
+                report[name] = np.zeros(len(filenames), dtype=bool)
+
+        report = pd.DataFrame(report)
+        report['valid'] = report.all(axis=1)
+
+        return report
+
+    @classmethod
+    def build_many(cls, fields, fields_def, ext=None, pad="-", delimiter="_"):
+        """
+        Builds many filenames at once from columns of field values, without creating
+        a SmartFilename object per filename.
+
+        Parameters
+        ----------
+        fields : dict or pandas.DataFrame
+            Name of fields (keys) and array-like columns or single values (values). Single values are used
+            for all filenames.
+        fields_def : OrderedDict
+            Name of fields (keys) in right order and length (values). See 'from_filename'. If a field definition
+            contains an "encoder", it is applied to the values.
+        ext : str, optional
+            File name extension (default: None).
+        pad : str, optional
+            Padding symbol (default: '-').
+        delimiter : str, optional
+            Delimiter (default: '_')
+
+        Returns
+        -------
+        numpy.ndarray
+            Array of filenames.
+        """
+
+        columns = to_columns(fields)
+        for name in columns.keys():
+            if name not in fields_def.keys():
+                raise KeyError("Field name undefined: {:}".format(name))
+        n = len(next(iter(columns.values()))) if columns else 1
+
+        layout = compile_layout(fields_def, pad=pad, delimiter=delimiter)
+        filenames = np.full(n, '', dtype='U1')
+        for i, name in enumerate(layout.names):
+            if name in columns:
+                column = encode_column(columns[name], length=layout.lengths[i], pad=layout.pads[i],
+                                       encoder=fields_def[name].get('encoder'))
             else:
-                setattr(filename_obj, name, fn_part.encoded)
+                column = (layout.lengths[i] or 0) * layout.pads[i]
+            filenames = np.char.add(filenames, column)
+            if i < len(layout.names) - 1:
+                filenames = np.char.add(filenames, layout.delimiters[i])
+
+        if ext is not None:
+            filenames = np.char.add(filenames, ext)
+
+        return filenames
+
+    @classmethod
+    def expand(cls, fields, fields_def, ext=None, pad="-", delimiter="_", lazy=False):
+        """
+        Expands a filename template into all combinations of the given field values, without creating
+        a SmartFilename object per filename. Each value is encoded and validated only once.
+
+        Parameters
+        ----------
+        fields : dict
+            Name of fields (keys) and single values or iterables of values (values). Fields, which vary together,
+            can be given by a tuple of names (key) and an iterable of value tuples (value),
+            e.g. {('dtime_1', 'dtime_2'): [(d1, t1), (d2, t2)]}.
+        fields_def : OrderedDict
+            Name of fields (keys) in right order and length (values). See 'from_filename'. If a field definition
+            contains an "encoder", it is applied to the values.
+        ext : str, optional
+            File name extension (default: None).
+        pad : str, optional
+            Padding symbol (default: '-').
+        delimiter : str, optional
+            Delimiter (default: '_')
+        lazy : bool, optional
+            If true, the filenames are generated one after another, else they are returned as an array
+            (default is False).
+
+        Returns
+        -------
+        numpy.ndarray or generator
+            Filenames of all combinations. The last field varies fastest (like itertools.product).
+        """
+
+        layout = compile_layout(fields_def, pad=pad, delimiter=delimiter)
+
+        # encode the values of each axis of the template
+        axes = []
+        for key, values in fields.items():
+            names = key if isinstance(key, tuple) else (key,)
+            for name in names:
+                if name not in fields_def:
+                    raise KeyError("Field name undefined: {:}".format(name))
+            if not isinstance(key, tuple):
+                if isinstance(values, str) or np.ndim(values) == 0:
+                    values = [values]
+                values = [(value,) for value in values]
+            encoded = []
+            for value in values:
+                encoded.append(tuple(encode_value(component, length=layout.lengths[layout.names.index(name)],
+                                                  pad=layout.pads[layout.names.index(name)],
+                                                  encoder=fields_def[name].get('encoder'))
+                                     for name, component in zip(names, value)))
+            axes.append((names, encoded))
+
+        # position of each field within the axes or its empty (padded) value
+        parts = []
+        for i, name in enumerate(layout.names):
+            part = (layout.lengths[i] or 0) * layout.pads[i]
+            for j, (names, _) in enumerate(axes):
+                if name in names:
+                    part = (j, names.index(name))
+            parts.append(part)
+        delimiters = list(layout.delimiters[:-1]) + [ext or '']
+
+        if lazy:
+            return cls.__expand_lazy(axes, parts, delimiters)
+
+        n = int(np.prod([len(encoded) for _, encoded in axes]))
+        idxs = np.unravel_index(np.arange(n), [len(encoded) for _, encoded in axes]) if axes else ()
+        filenames = np.full(n, '', dtype='U1')
+        for part, delim in zip(parts, delimiters):
+            if isinstance(part, tuple):
+                j, k = part
+                part = np.array([value[k] for value in axes[j][1]], dtype=str)[idxs[j]]
+            filenames = np.char.add(np.char.add(filenames, part), delim)
+
+        return filenames
+
+    @staticmethod
+    def __expand_lazy(axes, parts, delimiters):
+        """
+        Generates the filenames of an expanded template one after another.
+
+        Parameters
+        ----------
+        axes : list of tuple
+            Names of fields and encoded value tuples of each axis.
+        parts : list
+            Empty (padded) value or axis and field index of each field.
+        delimiters : list of str
+            Delimiter following each field (the extension for the last one).
+
+        Returns
+        -------
+        generator
+            Filenames of all combinations.
+        """
+
+        for combination in itertools.product(*[encoded for _, encoded in axes]):
+            yield ''.join([(combination[part[0]][part[1]] if isinstance(part, tuple) else part) + delim
+                           for part, delim in zip(parts, delimiters)])
+
+    def __init_filename_obj(self):
+        """
+        Initialises the class 'FilenameObj' to access all filename attributes as class variables.
+        This enables an easier access to filename properties. Fields are decoded lazily on first access.
+
+        Returns
+        -------
+        FilenameObj
 
-        return filename_obj
+        """
+
+        return FilenameObj(self._fn_map, convert=self.convert)
 
     def __build_map(self, fields, fields_def):
         """
@@ -299,30 +1950,25 @@ class SmartFilename(object):
                 raise KeyError("Field name undefined: {:}".format(key))
 
         fn_map = OrderedDict()
-        for name, keys in fields_def.items():
-            if name not in fields:
-                elem = ""
-            else:
-                elem = fields[name]
-
-            if 'delim' not in keys:
-                keys['delimiter'] = self.delimiter
-            else:
-                keys['delimiter'] = keys['delim']
-                del keys['delim']
-            if 'pad' not in keys:
-                keys['pad'] = self.pad
-            if 'len' in keys:
-                keys['length'] = keys['len']
-                del keys['len']
-            smart_fn_part = SmartFilenamePart(elem, **keys)
+        layout = self._layout
+        pool = self.intern_pool
+        for i, name in enumerate(layout.names):
+            keys = fields_def[name]
+            arg = fields.get(name, "")
+            if pool is not None:
+                arg = pool.intern(arg)
+            smart_fn_part = SmartFilenamePart(arg, start=keys.get('start', 0),
+                                              length=layout.lengths[i], delimiter=layout.delimiters[i],
+                                              pad=layout.pads[i], decoder=keys.get('decoder'),
+                                              encoder=keys.get('encoder'), pool=pool)
             fn_map[name] = smart_fn_part
 
         return fn_map
 
     def _build_fn(self):
         """
-        Build file name based on fields, padding and length.
+        Build file name based on fields, padding and length. The file name is built in one pass and cached
+        until a field or the extension changes.
 
         Returns
         -------
@@ -330,15 +1976,17 @@ class SmartFilename(object):
             Filled file name.
 
         """
-        fn_parts = list(self._fn_map.values())
-        filename = str(fn_parts[0])
-        for i in range(1, len(fn_parts)):
-            filename = filename[:-len(fn_parts[i-1])] + (fn_parts[i-1] + fn_parts[i])
+        if self._fn_cache is None or self._fn_cache[0] != self.ext:
+            fn_parts = list(self._fn_map.values())
+            filename = ''.join([str(fn_part) + fn_part.delimiter for fn_part in fn_parts[:-1]] +
+                               [str(fn_part) for fn_part in fn_parts[-1:]])
+
+            if self.ext is not None:
+                filename += self.ext
 
-        if self.ext is not None:
-            filename += self.ext
+            self._fn_cache = (self.ext, filename)
 
-        return filename
+        return self._fn_cache[1]
 
     def _get_field(self, name):
         """
@@ -356,13 +2004,14 @@ class SmartFilename(object):
             (convert=False) or an object.
         """
 
-        # check and reset the attribute of the object variable
-        field_from_obj = self._fn_map[name].encoder(getattr(self.obj, name))
+        # check and reset the attribute of the object variable (if it has already been accessed)
+        field_from_obj = self._fn_map[name].encoder(vars(self.obj)[name]) if name in vars(self.obj) else None
         if field_from_obj and (field_from_obj != self._fn_map[name].encoded):
-            fn_part = copy.deepcopy(self._fn_map[name])
-            fn_part.arg = field_from_obj
-            if fn_part.is_valid():
-                self._fn_map[name] = fn_part
+            try:
+                self._fn_map[name].update(field_from_obj)
+                self._fn_cache = None
+            except ValueError:
+                pass
 
         if self.convert:
             return self._fn_map[name].decoded
@@ -395,7 +2044,8 @@ class SmartFilename(object):
 
     def __setitem__(self, name, value):
         """
-        Sets the value of a filename field corresponding to the given key.
+        Sets the value of a filename field corresponding to the given key. Once the filename has been hashed
+        (e.g. as a member of a set or a key of a dictionary), its fields can not be changed anymore.
 
         Parameters
         ----------
@@ -406,23 +2056,95 @@ class SmartFilename(object):
 
         """
 
+        if self._hashed:
+            raise TypeError("'{}' object has been hashed and can not be changed anymore".format(type(self).__name__))
+
         if name in self._fn_map:
-            fn_part = copy.deepcopy(self._fn_map[name])
-            fn_part.arg = value
-            if not fn_part.is_valid():
-                err_msg = "Length does not comply with definition: {:} > {:}".format(len(fn_part.encoded),
-                                                                                     fn_part.length)
-                raise ValueError(err_msg)
+            fn_part = self._fn_map[name]
+            fn_part.update(value if self.intern_pool is None else self.intern_pool.intern(value))
+            self._fn_cache = None
+            if self.convert:
+                setattr(self.obj, name, fn_part.decoded)
             else:
-                self._fn_map[name] = fn_part
-                value = fn_part.encoded.replace(self.pad, '')
-                if self.convert:
-                    setattr(self.obj, name, fn_part.decoded)
-                else:
-                    setattr(self.obj, name, value)
+                setattr(self.obj, name, fn_part.encoded.replace(self.pad, ''))
         else:
             raise KeyError("Field name undefined: {:}".format(name))
 
+    def sort_key(self, *names):
+        """
+        Returns a key for sorting filenames by the given fields. The fixed-width, encoded and padded
+        parts of the filename are compared, i.e. nothing is decoded and no filename is built.
+
+        Parameters
+        ----------
+        *names : str
+            Names of the fields in the order of their priority.
+
+        Returns
+        -------
+        tuple of str
+            Encoded fields.
+        """
+
+        return tuple(str(self._fn_map[name]) for name in names)
+
+    def __eq__(self, other):
+        """
+        Compares filenames by value.
+
+        Parameters
+        ----------
+        other : object
+            Object to compare with.
+
+        Returns
+        -------
+        bool
+            True if both objects represent the same filename.
+        """
+
+        if isinstance(other, (SmartFilename, CompactFilename)):
+            return str(self) == str(other)
+        return NotImplemented
+
+    def __hash__(self):
+        """
+        Returns the hash of the filename. Afterwards, fields can not be set anymore, since the filename
+        would get lost in sets and dictionaries. The extension and the attributes of 'obj' must not be
+        changed either. For deduplicating many filenames, 'CompactFilename' is better suited.
+
+        Returns
+        -------
+        int
+            Hash value.
+        """
+
+        self._hashed = True
+
+        return hash(self._build_fn())
+
+    def __reduce__(self):
+        """
+        Reduces the object to its class and its (encoded and padded) fields, which makes it picklable,
+        e.g. to return it from a process pool. Naming conventions are restored by their constructor,
+        a plain SmartFilename additionally needs its fields definition.
+
+        Returns
+        -------
+        tuple
+            Callable and arguments restoring the object.
+        """
+
+        fields = OrderedDict((name, str(fn_part)) for name, fn_part in self._fn_map.items())
+        if self.__class__.__name__ == "SmartFilename":
+            fields_def = OrderedDict()
+            for name, fn_part in self._fn_map.items():
+                fields_def[name] = {'len': fn_part.length, 'start': fn_part.start, 'delim': fn_part.delimiter,
+                                    'pad': fn_part.pad, 'decoder': fn_part.decoder, 'encoder': fn_part.encoder}
+            return self.__class__, (fields, fields_def, self.ext, self.pad, self.delimiter, self.convert)
+        else:
+            return self.__class__, (fields, self.ext, self.convert)
+
     def __repr__(self):
         """
         Returns the string representation of the class.
@@ -19,12 +19,16 @@ Module handling folder trees.
 """
 
 import os
-import glob
 import copy
+import json
+import operator
 import shutil
 import warnings
 
 from datetime import datetime
+from functools import lru_cache
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 
 import regex as re
 import numpy as np
@@ -220,21 +224,21 @@ class SmartPath(object):
             e.g. "deeper_including" removes the level itself, and deeper levels.
         '''
 
-        dict = {'deeper_including': '>=',
-                'deeper_excluding': '>',
-                'higher_including': '<=',
-                'higher_excluding': '<'}
+        dict = {'deeper_including': operator.ge,
+                'deeper_excluding': operator.gt,
+                'higher_including': operator.le,
+                'higher_excluding': operator.lt}
 
         if level in self.hierarchy:
 
-            hierarchy = copy.copy(self.hierarchy)
+            hierarchy = self.hierarchy
             level_ind = hierarchy.index(level)
-            indxs = np.array(range(len(hierarchy)))
-            cmd = 'np.array(hierarchy)[indxs {} {}].tolist()'.format(dict[remove], level_ind)
-            subset = eval(cmd)
+            subset = [h for i, h in enumerate(hierarchy) if dict[remove](i, level_ind)]
 
+            # the SmartPath is initialised once for all removed levels
             for h in subset:
-                self.remove_level(h)
+                self.levels.pop(h)
+            self.__init__(self.levels, [h for h in hierarchy if h not in subset])
 
         else:
             print('Level \'{}\' is not in hierarchy!')
@@ -467,6 +471,11 @@ class SmartTree(object):
         self.file_count = 0
         self.file_register = []
         self.has_register = False
+        # modification times of the walked directories (see refresh())
+        self.mtimes = OrderedDict()
+        self.scan_options = {}
+        # keys of the SmartPaths per level and folder name (see find())
+        self.level_index = {}
 
         if make_dir:
             if not os.path.exists(self.root):
@@ -665,16 +674,19 @@ class SmartTree(object):
         self.dir_count = len(self.dirs)
 
 
-    def get_smartpath(self, pattern):
+    def get_smartpath(self, pattern=None, **levels):
         '''
         Returns one SmartPath-object from the SmartTree that matches with
         the pattern. If more than one match, None is returned.
 
         Parameters
         ----------
-        pattern : str tuple
+        pattern : str tuple, optional
             strings defining search pattern for path search
             e.g. ('C1003', 'E048N012T6')
+        **levels : str or list of str, optional
+            names of folders at levels (see find()), instead of a pattern.
+            e.g. wflow='C1003', tile='E048N012T6'
 
         Returns
         -------
@@ -682,14 +694,17 @@ class SmartTree(object):
             The path object matching the pattern.
         '''
 
-        pattern = patterns_2_regex(pattern)
+        if pattern is None:
+            matching_paths = [smartpath.get_dir() for smartpath in self.find(**levels)]
+        else:
+            pattern = patterns_2_regex(pattern)
 
-        paths = self.dirs.keys()
+            paths = self.dirs.keys()
 
-        matching_paths = []
+            matching_paths = []
 
-        regex = re.compile(pattern)
-        matching_paths += [m for m in paths if regex.match(m)]
+            regex = re.compile(pattern)
+            matching_paths += [m for m in paths if regex.match(m)]
 
         if len(matching_paths) == 0:
             warnings.warn('get_smartpath(): No matches for "pattern"!')
@@ -748,30 +763,27 @@ class SmartTree(object):
             list of paths at given level, matching the given pattern
         '''
 
-        result = []
+        # the pattern is matched once per folder name at the level
+        keys = set()
+        if pattern is not None:
+            regex = re.compile(patterns_2_regex(pattern))
+        for value, value_keys in self.level_index.get(level, {}).items():
+            if pattern is None or regex.match(value):
+                keys.update(value_keys)
 
-        for _, elem in self.dirs.items():
-            smartpath = copy.deepcopy(elem)
-            if smartpath.levels[level] is not None:
-                if pattern is not None:
-                    rpattern = patterns_2_regex(pattern)
-                    regex = re.compile(rpattern)
-                    if regex.match(smartpath.levels[level]):
-                        smartpath.trim2level(level, remove='deeper_excluding')
-                        result.append(smartpath)
-                else:
-                    smartpath.trim2level(level, remove='deeper_excluding')
-                    result.append(smartpath)
+        if len(keys) == 0:
+            return []
 
-        result = np.array(result)
+        # the SmartPaths are trimmed to the folder names down to the level
+        hierarchy = self.hierarchy[:self.hierarchy.index(level) + 1]
+        prefixes = [tuple(self.dirs[key].levels[h] for h in hierarchy) for key in keys]
         if unique:
             # remove duplicates after trimming the tree
-            _, uni_idx = np.unique([x.get_dir() for x in result], return_index=True)
-            result = result[uni_idx]
+            prefixes = set(prefixes)
 
-        sort_ind = np.argsort([x.get_dir() for x in result])
+        result = [SmartPath(dict(zip(hierarchy, prefix)), list(hierarchy)) for prefix in prefixes]
 
-        return result[sort_ind].tolist()
+        return sorted(result, key=lambda x: x.get_dir())
 
 
     def collect_level_topnames(self, level, pattern=None, unique=True):
@@ -820,7 +832,11 @@ class SmartTree(object):
 
             if self.hierarchy == smartpath.hierarchy:
 
-                self.dirs.update({smartpath.get_dir(): smartpath})
+                key = smartpath.get_dir()
+                if key in self.dirs:
+                    self._unindex_smartpath(key)
+                self.dirs.update({key: smartpath})
+                self._index_smartpath(key)
                 self.count_dirs()
 
             else:
@@ -841,10 +857,88 @@ class SmartTree(object):
             Path representing the key for the SmartPath
         '''
 
+        self._unindex_smartpath(key)
         self.dirs.pop(key)
         self.count_dirs()
 
 
+    def find(self, **levels):
+        '''
+        Returns the SmartPaths with the given folder names at the given
+        levels, by intersecting the SmartPaths indexed per level and folder
+        name (without matching patterns against all paths).
+
+        Usage-example: smarttree.find(wflow='C1003', tile='E048N012T6')
+
+        Parameters
+        ----------
+        **levels : str or list of str
+            name(s) of the folders at the levels (keywords). SmartPaths
+            matching any of several names at a level are returned.
+
+        Returns
+        -------
+        list of SmartPaths
+            SmartPaths with the given folder names, sorted by their path.
+        '''
+
+        keys = None
+        for level, names in levels.items():
+            if level not in self.hierarchy:
+                raise ValueError('Level \'{}\' is not in hierarchy!'.format(level))
+            if isinstance(names, str):
+                names = [names]
+            level_index = self.level_index.get(level, {})
+            level_keys = set()
+            for name in names:
+                level_keys.update(level_index.get(name, ()))
+            keys = level_keys if keys is None else keys & level_keys
+
+        if keys is None:
+            keys = self.dirs.keys()
+
+        return [self.dirs[key] for key in sorted(keys)]
+
+
+    def build_index(self):
+        '''
+        Builds the index of the SmartPaths per level and folder name (see
+        find()) again, e.g. after the SmartPaths have been modified.
+        '''
+
+        self.level_index = {}
+        for key in self.dirs.keys():
+            self._index_smartpath(key)
+
+
+    def _index_smartpath(self, key):
+        '''
+        Adds the SmartPath with 'key' to the index per level and folder name.
+        '''
+
+        smartpath = self.dirs[key]
+        for level in smartpath.hierarchy:
+            name = smartpath.levels.get(level)
+            if name is not None:
+                self.level_index.setdefault(level, {}).setdefault(name, set()).add(key)
+
+
+    def _unindex_smartpath(self, key):
+        '''
+        Removes the SmartPath with 'key' from the index per level and folder
+        name.
+        '''
+
+        smartpath = self.dirs[key]
+        for level in smartpath.hierarchy:
+            name = smartpath.levels.get(level)
+            level_index = self.level_index.get(level, {})
+            if name in level_index:
+                level_index[name].discard(key)
+                if not level_index[name]:
+                    level_index.pop(name)
+
+
     def trim2branch(self, level, pattern, register_file_pattern=None):
         '''
         Returns a branch (a subtree) of a SmartTree that matches with
@@ -867,6 +961,9 @@ class SmartTree(object):
         '''
 
         branch = copy.deepcopy(self)
+        # the walked directories do not refer to the branch
+        branch.mtimes = OrderedDict()
+        branch.scan_options = {}
 
         branch_path = self.collect_level_string(level, pattern=pattern, unique=True)
 
@@ -886,6 +983,8 @@ class SmartTree(object):
 
             # update dir_count
             branch.count_dirs()
+            # update the index of the trimmed SmartPaths
+            branch.build_index()
             # update tree root
             branch.root = branch_path[0]
             # update tree hierarchy
@@ -913,6 +1012,224 @@ class SmartTree(object):
             return branch
 
 
+    def save(self, filename):
+        '''
+        Saves a snapshot of the SmartTree (directories, hierarchy, file
+        register and modification times of the walked directories) to a
+        JSON file.
+
+        Parameters
+        ----------
+        filename : str
+            path of the snapshot file.
+        '''
+
+        snapshot = {'root': self.root,
+                    'hierarchy': self.hierarchy,
+                    'dirs': [[smartpath.levels[h] for h in self.hierarchy[1:]]
+                             for smartpath in self.dirs.values()],
+                    'file_register': self.file_register,
+                    'has_register': self.has_register,
+                    'mtimes': self.mtimes,
+                    'scan_options': self.scan_options}
+
+        with open(filename, 'w') as f:
+            json.dump(snapshot, f)
+
+
+    @classmethod
+    def load(cls, filename):
+        '''
+        Loads a snapshot of a SmartTree saved by save(), without walking
+        through the directories.
+
+        Parameters
+        ----------
+        filename : str
+            path of the snapshot file.
+
+        Returns
+        -------
+        SmartTree
+        '''
+
+        with open(filename) as f:
+            snapshot = json.load(f)
+
+        smart_tree = cls(snapshot['root'], snapshot['hierarchy'])
+        hierarchy = smart_tree.hierarchy[1:]
+        for levels in snapshot['dirs']:
+            smart_tree.add_smartpath(SmartPath(dict(zip(hierarchy, levels)), hierarchy))
+
+        smart_tree.file_register = snapshot['file_register']
+        smart_tree.file_count = len(smart_tree.file_register)
+        smart_tree.has_register = snapshot['has_register']
+        smart_tree.mtimes = OrderedDict(snapshot['mtimes'])
+        smart_tree.scan_options = snapshot['scan_options']
+
+        return smart_tree
+
+
+    def refresh(self, workers=None):
+        '''
+        Updates the SmartTree in place with the changes in the file system
+        since it was built: Only directories with a changed modification time
+        are listed again (and new directories walked), then "dirs" and the
+        file register are patched.
+        Only possible for SmartTrees built by build_smarttree() with
+        "record_mtimes" and without trimming (or loaded from their snapshots).
+
+        Parameters
+        ----------
+        workers : int, optional
+            if larger than 1, the modification times are checked and new
+            directories are listed concurrently by this number of threads.
+
+        Returns
+        -------
+        list of str
+            directories, which have been listed again or added.
+        '''
+
+        if not self.mtimes:
+            raise ValueError('SmartTree has no modification times of its directories! '
+                             'Build it with build_smarttree(..., record_mtimes=True).')
+
+        target_level = self.scan_options.get('target_level')
+        register_file_pattern = self.scan_options.get('register_file_pattern')
+        as_bytes = self.scan_options.get('as_bytes', False)
+
+        root_depth = len(self.root.split(os.sep))
+        target_depth = None if target_level is None else self.hierarchy.index(target_level)
+
+        # files of the register per directory before the refresh
+        old_register_dirs = self._get_register_dirs(target_depth)
+        old_files = {}
+        for f in self.file_register:
+            old_files.setdefault(os.path.dirname(f), []).append(f)
+
+        # check the modification times
+        dirpaths = list(self.mtimes.keys())
+        if workers is not None and workers > 1:
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                mtimes = list(executor.map(_get_mtime, dirpaths))
+        else:
+            mtimes = [_get_mtime(dirpath) for dirpath in dirpaths]
+        changed = [dirpath for dirpath, mtime in zip(dirpaths, mtimes) if mtime != self.mtimes[dirpath]]
+
+        # list changed directories again and walk new subdirectories
+        children = {}
+        for dirpath in changed:
+            children[dirpath] = []
+        for key in self.mtimes:
+            parent = os.path.dirname(key)
+            if parent in children:
+                children[parent].append(key)
+        listed = OrderedDict()
+        for dirpath in changed:
+            if dirpath not in self.mtimes:
+                continue
+            top = os.fsencode(dirpath) if as_bytes else dirpath
+            listing = list_dir(top, stat=True)
+            if listing is None:
+                self._remove_walked(dirpath)
+                continue
+            entry_names, subdirs, mtime = listing
+            self.mtimes[dirpath] = mtime
+            listed[dirpath] = (top, entry_names)
+
+            depth = len(dirpath.split(os.sep)) - root_depth
+            if target_depth is not None and depth >= target_depth:
+                continue
+
+            # removed subdirectories
+            subdirs = OrderedDict((os.fsdecode(subdir), subdir) for subdir in subdirs)
+            for key in children[dirpath]:
+                if key not in subdirs and key in self.mtimes:
+                    self._remove_walked(key)
+
+            # new subdirectories
+            sub_depth = None if target_depth is None else target_depth - depth - 1
+            walked = OrderedDict()
+            for key, subdir in subdirs.items():
+                if key in self.mtimes:
+                    continue
+                for sub_top, sub_names in scan_tree(subdir, max_depth=sub_depth, workers=workers, mtimes=walked):
+                    listed[os.fsdecode(sub_top)] = (sub_top, sub_names)
+            self.mtimes.update((os.fsdecode(sub_top), sub_mtime) for sub_top, sub_mtime in walked.items())
+
+        # patch the SmartPaths
+        alldirs = [dirpath.replace(self.root, '') for dirpath in self.mtimes]
+        depth = [len(dirpath.split(os.sep)) - root_depth for dirpath in self.mtimes]
+        smartpaths = OrderedDict()
+        for fp in select_singular_paths(alldirs, depth, target_depth=target_depth):
+            smartpath = relative_smartpath(fp, self.hierarchy[1:])
+            smartpath.base_onto_root(self.root)
+            smartpaths[smartpath.get_dir()] = smartpath
+        for key in list(self.dirs.keys()):
+            if key not in smartpaths:
+                self.remove_smartpath(key)
+        for key, smartpath in smartpaths.items():
+            if key not in self.dirs:
+                self.add_smartpath(smartpath)
+
+        # patch the file register
+        if self.has_register and register_file_pattern is not None:
+            register_dirs = self._get_register_dirs(target_depth)
+            file_register = []
+            for dirpath in self.mtimes:
+                if dirpath not in register_dirs:
+                    continue
+                if dirpath in old_register_dirs and dirpath not in listed:
+                    file_register += old_files.get(dirpath, [])
+                    continue
+                if dirpath in listed:
+                    top, entry_names = listed[dirpath]
+                else:
+                    # the directory is on the way to a new target directory
+                    top = os.fsencode(dirpath) if as_bytes else dirpath
+                    listing = list_dir(top)
+                    if listing is None:
+                        continue
+                    entry_names = listing[0]
+                files, _ = match_files(top, entry_names, register_file_pattern,
+                                       full_paths=True, as_bytes=as_bytes)
+                if as_bytes:
+                    files = [os.fsdecode(f) for f in files]
+                file_register += files
+
+            self.file_register = file_register
+            self.file_count = len(file_register)
+
+        return list(listed.keys())
+
+
+    def _get_register_dirs(self, target_depth=None):
+        '''
+        Returns the walked directories, whose files are in the file register.
+        '''
+
+        if target_depth is None:
+            return set(self.mtimes)
+
+        root_depth = len(self.root.split(os.sep))
+        target_dirs = [dirpath.replace(self.root, '') for dirpath in self.mtimes
+                       if len(dirpath.split(os.sep)) - root_depth == target_depth]
+
+        return collect_parent_dirs(self.root, target_dirs).intersection(self.mtimes)
+
+
+    def _remove_walked(self, dirpath):
+        '''
+        Removes a walked directory and its subdirectories from the record of
+        modification times.
+        '''
+
+        prefix = os.path.join(dirpath, '')
+        for key in [key for key in self.mtimes if key == dirpath or key.startswith(prefix)]:
+            self.mtimes.pop(key)
+
+
     def make_dirs(self):
         '''
         Creates a full path for each of the contained SmartPaths.
@@ -1009,7 +1326,10 @@ def build_smarttree(root,
                     target_level=None,
                     register_file_pattern=None,
                     trim_level=None,
-                    trim_pattern=None):
+                    trim_pattern=None,
+                    as_bytes=False,
+                    workers=None,
+                    record_mtimes=False):
     '''
     Function walking through directories in root path for building a structure
     of SmartPaths. Can also search for files.
@@ -1041,6 +1361,18 @@ def build_smarttree(root,
         matching this pattern at "trim_level" will be included in the
         SmartTree()
         e.g. 'EQUI7_EU500M'
+    as_bytes : bool, optional
+        if True, directories are walked and files are searched as bytes,
+        i.e. only the names of directories and registered files are decoded.
+        The resulting SmartTree is the same.
+    workers : int, optional
+        if larger than 1, sibling directories are listed concurrently by
+        this number of threads (e.g. for network file systems).
+        The resulting SmartTree is the same (see scan_tree()).
+    record_mtimes : bool, optional
+        if True, the modification time of each walked directory is recorded,
+        which allows to refresh() the SmartTree later on. This costs one
+        additional stat call per directory (default: False).
 
     Returns
     -------
@@ -1053,40 +1385,114 @@ def build_smarttree(root,
     # path depth of root
     root_depth = len(root.split(os.sep))
 
+    # the walk stops at the target level (deeper folders are not needed)
+    if target_level is not None:
+        target_depth = smart_tree.hierarchy.index(target_level)
+    else:
+        target_depth = None
+
     alldirs = []
     depth = []
+    names = {}
+    mtimes = OrderedDict() if record_mtimes else None
 
     # walk thru the dirs below of root
-    for dirpath, dirs, files in os.walk(root, topdown=False):
+    for top, entry_names in scan_tree(os.fsencode(root) if as_bytes else root,
+                                      max_depth=target_depth, workers=workers, mtimes=mtimes):
+        dirpath = os.fsdecode(top) if as_bytes else top
         alldirs += [dirpath.replace(root, '')]
         depth += [len(dirpath.split(os.sep)) - root_depth]
         # if set, then files are registered
         # (they are in the memory anyway at this moment)
         if trim_level is None:
             if register_file_pattern is not None:
-                files, count = regex_file_search(dirpath,
-                                                 register_file_pattern,
-                                                 full_paths=True)
-                smart_tree.file_register += files
-                smart_tree.file_count += count
+                if target_level is None:
+                    files, count = match_files(top, entry_names, register_file_pattern,
+                                               full_paths=True, as_bytes=as_bytes)
+                    if as_bytes:
+                        files = [os.fsdecode(f) for f in files]
+                    smart_tree.file_register += files
+                    smart_tree.file_count += count
+                else:
+                    names[dirpath] = (top, entry_names)
+
+    singular_paths = select_singular_paths(alldirs, depth, target_depth=target_depth)
+
+    # register only files in paths down to target level, i.e. in the
+    # folders on the way from root to the singular paths
+    if trim_level is None:
+        if register_file_pattern is not None and target_level is not None:
+            file_register = set()
+            for dirpath in collect_parent_dirs(root, singular_paths).intersection(names):
+                top, entry_names = names[dirpath]
+                files, _ = match_files(top, entry_names, register_file_pattern,
+                                       full_paths=True, as_bytes=as_bytes)
+                if as_bytes:
+                    files = [os.fsdecode(f) for f in files]
+                file_register.update(files)
+
+            smart_tree.file_register = list(file_register)
+            smart_tree.file_count = len(smart_tree.file_register)
+
+    # create and append a SmartPath for each singular path
+    for fp in singular_paths:
+        smart_tree.add_smartpath(relative_smartpath(fp, hierarchy))
+
+    # the modification times allow to refresh the SmartTree
+    if trim_level is None and record_mtimes:
+        smart_tree.mtimes = OrderedDict((os.fsdecode(top), mtime) for top, mtime in mtimes.items())
+        smart_tree.scan_options = {'target_level': target_level,
+                                   'register_file_pattern': register_file_pattern,
+                                   'as_bytes': as_bytes}
+
+    # update self.dir_count
+    smart_tree.count_dirs()
+
+    if trim_level is not None and trim_pattern is not None:
+        smart_tree = smart_tree.trim2branch(trim_level, pattern=trim_pattern,
+                                            register_file_pattern=register_file_pattern)
+
+    if register_file_pattern is not None:
+        smart_tree.has_register = True
+
+    return smart_tree
+
+
+def select_singular_paths(alldirs, depth, target_depth=None):
+    '''
+    Selects the directories, which become the SmartPaths of a SmartTree.
+
+    Parameters
+    ----------
+    alldirs : list of str
+        paths of all walked directories relative to the root.
+    depth : list of int
+        depth of the directories relative to the root.
+    target_depth : int, optional
+        if set, only the directories at this depth are selected, else all
+        directories without children.
+
+    Returns
+    -------
+    numpy.ndarray
+        selected paths relative to the root.
+    '''
+
     alldirs = np.array(alldirs)
+    depth = np.array(depth)
 
     # only select paths reaching given target level
-    if target_level is not None:
-        target_depth = smart_tree.hierarchy.index(target_level)
-        singular_paths = alldirs[np.array(depth) == target_depth]
-
-        # reset file register (to register only files down to target level)
-        file_register = []
+    if target_depth is not None:
+        singular_paths = alldirs[depth == target_depth]
 
     # select all singular paths that have no children - and drop their parents
     else:
         target_depth = max(depth)
-        singular_paths = alldirs[np.array(depth) == target_depth]
+        singular_paths = alldirs[depth == target_depth]
         for d in sorted((set(depth)), reverse=True):
             if d == target_depth:
                 continue
-            paths_at_depth = alldirs[np.array(depth) == d]
+            paths_at_depth = alldirs[depth == d]
             paths_ending = []
             for pad in paths_at_depth:
                 if all([pad not in x for x in singular_paths]):
@@ -1094,49 +1500,63 @@ def build_smarttree(root,
 
             singular_paths = np.append(singular_paths, paths_ending)
 
-    # create and append a SmartPath for each singular path
-    for fp in singular_paths:
-        levels = {}
-        sub_levels = fp.split(os.sep)[1:]
-        tail_depth = len(sub_levels)
-        for p in range(len(hierarchy)):
-            if p < tail_depth:
-                levels.update({hierarchy[p]: sub_levels[p]})
-            else:
-                # note sure about this. Potentially causes problems somewhere
-                levels.update({hierarchy[p]: None})
+    return singular_paths
 
-        smart_path = SmartPath(levels, hierarchy)
 
-        smart_tree.add_smartpath(smart_path)
+def collect_parent_dirs(root, paths):
+    '''
+    Collects the directories on the way from the root to the given paths
+    (including both).
 
-        # to register only files down to target level
-        if trim_level is None:
-            if register_file_pattern is not None and target_level is not None:
-                smart_path.build_file_register(down_to_level=target_level,
-                                               pattern=register_file_pattern)
-                file_register += smart_path.file_register
+    Parameters
+    ----------
+    root : str
+        root directory.
+    paths : list of str
+        paths relative to the root.
 
-        smart_path = None
-        levels = None
+    Returns
+    -------
+    set
+        full paths of the directories.
+    '''
 
-    # update self.dir_count
-    smart_tree.count_dirs()
+    dirpaths = set()
+    for fp in paths:
+        sub_levels = fp.split(os.sep)
+        dirpaths.update(root + os.sep.join(sub_levels[:p + 1]) for p in range(len(sub_levels)))
 
-    # register only files in paths down to target level
-    if trim_level is None:
-        if register_file_pattern is not None and target_level is not None:
-            smart_tree.file_register = list(set(file_register))
-            smart_tree.file_count = len(smart_tree.file_register)
+    return dirpaths
 
-    if trim_level is not None and trim_pattern is not None:
-        smart_tree = smart_tree.trim2branch(trim_level, pattern=trim_pattern,
-                                            register_file_pattern=register_file_pattern)
 
-    if register_file_pattern is not None:
-        smart_tree.has_register = True
+def relative_smartpath(path, hierarchy):
+    '''
+    Creates a SmartPath() from a path relative to the root, which is not yet
+    based onto the root (see SmartTree.add_smartpath()).
 
-    return smart_tree
+    Parameters
+    ----------
+    path : str
+        path relative to the root.
+    hierarchy : list of str
+        List defining the order of the levels (without "root")
+
+    Returns
+    -------
+    SmartPath
+    '''
+
+    levels = {}
+    sub_levels = path.split(os.sep)[1:]
+    tail_depth = len(sub_levels)
+    for p in range(len(hierarchy)):
+        if p < tail_depth:
+            levels.update({hierarchy[p]: sub_levels[p]})
+        else:
+            # note sure about this. Potentially causes problems somewhere
+            levels.update({hierarchy[p]: None})
+
+    return SmartPath(levels, hierarchy)
 
 
 def expand_full_path(path, files):
@@ -1241,7 +1661,7 @@ def patterns_2_regex(patterns):
     return ''.join(regex)
 
 
-def regex_file_search(path, pattern, full_paths=True):
+def regex_file_search(path, pattern, full_paths=True, as_bytes=False):
     '''
     Carries out the file search using the strings in pattern as regex strings.
 
@@ -1254,6 +1674,51 @@ def regex_file_search(path, pattern, full_paths=True):
         that should be excluded from the matches
     full_paths : bool, optional
         should full paths be returned? default: True
+    as_bytes : bool, optional
+        if True, the directory is listed and matched as bytes, i.e. the
+        names of the entries are not decoded and bytes are returned.
+        default: False
+
+    Returns
+    -------
+    tuple
+        a tuple (files, count) that contains the file list and the
+        count of files ([], 0 if the directory cannot be listed)
+
+    '''
+
+    if as_bytes:
+        path = os.fsencode(path)
+    try:
+        with os.scandir(path) as entries:
+            basenames = [entry.name for entry in entries]
+    except OSError:
+        return [], 0
+
+    return match_files(path, basenames, pattern, full_paths=full_paths, as_bytes=as_bytes)
+
+
+def match_files(path, basenames, pattern, full_paths=True, as_bytes=False):
+    '''
+    Carries out the file search on names of the entries of a directory, which
+    are already listed (e.g. while walking through the directories).
+    Like regex_file_search(), only names with an extension are matched.
+
+    Parameters
+    ----------
+    path : str or bytes
+        directory of the entries.
+    basenames : list of str or list of bytes
+        names of the entries in the directory.
+    pattern : str or tuple of str
+        string patterns for matching.
+        when starting with "-" it is interpreted as negative pattern
+        that should be excluded from the matches
+    full_paths : bool, optional
+        should full paths be returned? default: True
+    as_bytes : bool, optional
+        if True, the names are matched as bytes and bytes are returned.
+        default: False
 
     Returns
     -------
@@ -1264,11 +1729,11 @@ def regex_file_search(path, pattern, full_paths=True):
     '''
 
     pattern = patterns_2_regex(pattern)
+    # same selection as glob's '*.*', i.e. no hidden entries
+    dot = b'.' if as_bytes else '.'
+    basenames = [f for f in basenames if dot in f and not f.startswith(dot)]
 
-    paths = glob.glob(os.path.join(path, '*.*'))
-    basenames = reduce_2_basename(paths)
-
-    regex = re.compile(pattern)
+    regex = get_file_regex(os.fsencode(pattern) if as_bytes else pattern)
     files = [f for f in basenames if regex.match(f)]
 
     if full_paths:
@@ -1277,6 +1742,191 @@ def regex_file_search(path, pattern, full_paths=True):
     return sorted(files), len(files)
 
 
+@lru_cache(maxsize=256)
+def get_file_regex(pattern):
+    '''
+    Compiles the regular expression of a file search (cached).
+
+    Parameters
+    ----------
+    pattern : str or bytes
+        regular expression.
+
+    Returns
+    -------
+    regex.Pattern
+        compiled regular expression.
+    '''
+
+    return re.compile(pattern)
+
+
+def scan_tree(top, max_depth=None, workers=None, mtimes=None):
+    '''
+    Walks through the directories below (and including) "top", like
+    os.walk(top, topdown=False), but uses the type information of the
+    directory entries and stops descending at "max_depth".
+
+    Parameters
+    ----------
+    top : str or bytes
+        top directory.
+    max_depth : int, optional
+        depth of the deepest directories relative to "top" (0).
+        deeper directories are not walked (default: all directories).
+    workers : int, optional
+        if larger than 1, the directories are listed concurrently by this
+        number of threads (e.g. for network file systems), with at most two
+        listings per thread prefetched (see list_tree()). The directories are
+        yielded in the same order as by a serial walk (default: serial walk).
+    mtimes : dict, optional
+        if given, the modification time (in ns) of each walked directory is
+        recorded in it, just before the directory is listed.
+
+    Returns
+    -------
+    generator
+        yields a tuple (dirpath, names) for each directory with the names of
+        its entries, children before their parents.
+    '''
+
+    stat = mtimes is not None
+    if workers is not None and workers > 1:
+        listings = list_tree(top, max_depth=max_depth, workers=workers, stat=stat)
+    else:
+        listings = None
+
+    return _walk_listings(top, max_depth, listings=listings, mtimes=mtimes)
+
+
+def list_tree(top, max_depth=None, workers=4, stat=False):
+    '''
+    Lists the directories below (and including) "top" concurrently with a
+    thread pool. The listings are yielded one after another in the order of
+    a serial walk (parents before their children), while the next
+    directories of the walk are listed in advance, with at most two listings
+    per thread in flight or waiting. Hence, as for a serial walk, the
+    listings are not kept in memory.
+
+    Parameters
+    ----------
+    top : str or bytes
+        top directory.
+    max_depth : int, optional
+        depth of the deepest directories relative to "top" (0).
+        deeper directories are not listed (default: all directories).
+    workers : int, optional
+        number of threads (default: 4).
+    stat : bool, optional
+        if True, the modification times of the directories are determined
+        (see list_dir()) (default: False).
+
+    Returns
+    -------
+    generator
+        yields a tuple (path, listing) for each directory with its listing
+        (see list_dir()), or None if the directory could not be listed.
+    '''
+
+    # directories still to be walked, the next one on top
+    stack = [(top, 0)]
+    prefetched = {}
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        while stack:
+            path, depth = stack.pop()
+            future = prefetched.pop(path, None)
+            listing = list_dir(path, stat=stat) if future is None else future.result()
+            if listing is not None and (max_depth is None or depth < max_depth):
+                stack.extend((subdir, depth + 1) for subdir in reversed(listing[1]))
+
+            # list the next directories of the walk in advance
+            for next_path, _ in reversed(stack):
+                if len(prefetched) >= 2 * workers:
+                    break
+                if next_path not in prefetched:
+                    prefetched[next_path] = executor.submit(list_dir, next_path, stat=stat)
+
+            yield path, listing
+
+
+def list_dir(path, stat=False):
+    '''
+    Lists a directory once, using the type information of its entries to
+    find the subdirectories (symbolic links are not followed, as by os.walk).
+
+    Parameters
+    ----------
+    path : str or bytes
+        directory.
+    stat : bool, optional
+        if True, the modification time of the directory is determined before
+        listing it (default: False).
+
+    Returns
+    -------
+    tuple or None
+        a tuple (names, subdirs, mtime) with the names of all entries, the
+        paths of the subdirectories and the modification time in ns (or None),
+        or None if the directory could not be listed.
+    '''
+
+    try:
+        mtime = os.stat(path).st_mtime_ns if stat else None
+        with os.scandir(path) as scan:
+            entries = list(scan)
+    except OSError:
+        return None
+
+    subdirs = []
+    for entry in entries:
+        try:
+            is_dir = entry.is_dir() and not entry.is_symlink()
+        except OSError:
+            is_dir = False
+        if is_dir:
+            subdirs.append(entry.path)
+
+    return [entry.name for entry in entries], subdirs, mtime
+
+
+def _get_mtime(path):
+    '''
+    Returns the modification time of a path in ns, or None if it does not
+    exist anymore.
+    '''
+
+    try:
+        return os.stat(path).st_mtime_ns
+    except OSError:
+        return None
+
+
+def _walk_listings(top, max_depth, listings=None, mtimes=None):
+    '''
+    Yields the directories below (and including) "top" bottom-up, listing
+    them on the way or taking them one after another from the given
+    listings (see list_tree()).
+    '''
+
+    if listings is None:
+        listing = list_dir(top, stat=mtimes is not None)
+    else:
+        _, listing = next(listings)
+    if listing is None:
+        return
+
+    names, subdirs, mtime = listing
+    if mtimes is not None:
+        mtimes[top] = mtime
+    if max_depth is None or max_depth > 0:
+        sub_depth = None if max_depth is None else max_depth - 1
+        for subdir in subdirs:
+            for sub in _walk_listings(subdir, sub_depth, listings=listings, mtimes=mtimes):
+                yield sub
+
+    yield top, names
+
+
 def copy_tree(source, dest, file_pattern=None, overwrite=False):
     """
     Copies a directory tree structure.
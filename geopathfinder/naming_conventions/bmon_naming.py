@@ -19,12 +19,12 @@ BMon file name definition.
 
 """
 
-import copy
 import datetime as dt
-from datetime import datetime
 from collections import OrderedDict
 
 from geopathfinder.file_naming import SmartFilename
+from geopathfinder.file_naming import cached_strptime
+from geopathfinder.file_naming import parse_datetime64
 
 
 class BMonFilename(SmartFilename):
@@ -41,6 +41,9 @@ class BMonFilename(SmartFilename):
     ])
     pad = "-"
     delimiter = "_"
+    timestamp_format = "%Y%m%d%H%M%S"
+    # fields definitions with decoders and encoders per class
+    _fields_defs = {}
 
     def __init__(self, fields, ext='.nc', convert=False):
         """
@@ -56,17 +59,33 @@ class BMonFilename(SmartFilename):
             If true, decoding is applied to parts of the filename, where such an operation is available (default is False).
         """
 
-        self.timestamp_format = "%Y%m%d%H%M%S"
+        super(BMonFilename, self).__init__(fields, self._get_fields_def(), ext=ext, pad=BMonFilename.pad,
+                                           delimiter=BMonFilename.delimiter, convert=convert,
+                                           layout=self.get_layout())
 
-        fields_def_ext = copy.deepcopy(BMonFilename.fields_def)
-        fields_def_ext['timestamp']['decoder'] = lambda x: self.decode_timestamp(x)
-        fields_def_ext['timestamp']['encoder'] = lambda x: self.encode_timestamp(x)
+    @classmethod
+    def _get_fields_def(cls):
+        """
+        Returns the (cached) BMon fields definition extended by the decoder and encoder of BMonFilename objects.
+        It is built once per class, i.e. not per object.
+
+        Returns
+        -------
+        OrderedDict
+            Fields definition with a decoder and an encoder for the timestamp. It is shared and must not be altered.
+        """
+
+        fields_def_ext = cls._fields_defs.get(cls)
+        if fields_def_ext is None:
+            fields_def_ext = cls.decoding_fields_def()
+            fields_def_ext['timestamp'] = dict(fields_def_ext['timestamp'],
+                                               encoder=cls.encoding_fields_def()['timestamp']['encoder'])
+            cls._fields_defs[cls] = fields_def_ext
 
-        super(BMonFilename, self).__init__(fields, fields_def_ext, ext=ext, pad=BMonFilename.pad,
-                                           delimiter=BMonFilename.delimiter, convert=convert)
+        return fields_def_ext
 
     @classmethod
-    def from_filename(cls, filename_str, convert=False):
+    def from_filename(cls, filename_str, convert=False, fields=None):
         """
         Converts a filename given as a string into a BMonFilename class object.
 
@@ -76,15 +95,160 @@ class BMonFilename(SmartFilename):
             Filename without any paths (e.g., "BMON_DM_ENSEMBLE_500m_20160101120000_v1.nc").
         convert: bool, optional
             If true, decoding is applied to parts of the filename, where such an operation is available (default is False).
+        fields : list of str, optional
+            Names of the requested fields. If given, only these fields are extracted and decoded into a named tuple
+            (default: None).
+
+        Returns
+        -------
+        BMonFilename or namedtuple
+            Class representing a BMON filename or record of the requested fields.
+        """
+
+        fields_def = BMonFilename.fields_def if fields is None else cls.decoding_fields_def()
+        return super().from_filename(filename_str, fields_def, pad=BMonFilename.pad,
+                                     delimiter=BMonFilename.delimiter, convert=convert, fields=fields,
+                                     layout=cls.get_layout())
+
+    @classmethod
+    def parse_many(cls, filenames, convert=False, fields=None, categorical=False, datetime64=False):
+        """
+        Parses many BMon filenames at once into a table with one column per field.
+
+        Parameters
+        ----------
+        filenames : list of str or numpy.ndarray
+            Filenames without any paths.
+        convert: bool, optional
+            If true, decoding is applied to parts of the filename, where such an operation is available (default is False).
+        fields : list of str, optional
+            Names of the requested fields. If given, only these fields are extracted and decoded (default: all fields).
+        categorical : bool, optional
+            If true, the columns are dictionary-encoded (pandas.Categorical) (default is False).
+        datetime64 : bool, optional
+            If true (and 'convert' is true), the timestamp is decoded column-wise into numpy.datetime64 values
+            (default is False).
 
         Returns
         -------
-        BMonFilename
-            Class representing a BMON filename.
+        pandas.DataFrame
+            Table with one row per filename and one column per (requested) BMon field.
         """
 
-        return super().from_filename(filename_str, BMonFilename.fields_def, pad=BMonFilename.pad,
-                                     delimiter=BMonFilename.delimiter, convert=convert)
+        fields_def_ext = cls.decoding_fields_def()
+        if datetime64:
+            fields_def_ext['timestamp'] = dict(fields_def_ext['timestamp'],
+                                               column_decoder=lambda x: parse_datetime64(x, cls.timestamp_format))
+
+        return super().parse_many(filenames, fields_def_ext, pad=BMonFilename.pad,
+                                  delimiter=BMonFilename.delimiter, convert=convert, fields=fields,
+                                  categorical=categorical)
+
+    @classmethod
+    def decoding_fields_def(cls):
+        """
+        Returns the BMon fields definition extended by decoders, which do not depend on an instance.
+
+        Returns
+        -------
+        OrderedDict
+            Fields definition with a decoder for the timestamp.
+        """
+
+        fields_def_ext = OrderedDict(BMonFilename.fields_def)
+        fields_def_ext['timestamp'] = dict(fields_def_ext['timestamp'],
+                                           decoder=lambda x: cached_strptime(x, cls.timestamp_format))
+
+        return fields_def_ext
+
+    @classmethod
+    def get_regex(cls, ext=None):
+        """
+        Returns the (cached) regular expression matching BMon filenames.
+
+        Parameters
+        ----------
+        ext : str, optional
+            File name extension. If not given, any extension is accepted (default: None).
+
+        Returns
+        -------
+        regex.Pattern
+            Compiled regular expression.
+        """
+
+        fields_def_ext = OrderedDict(BMonFilename.fields_def)
+        fields_def_ext['timestamp'] = dict(fields_def_ext['timestamp'], regex='[0-9]{14}')
+
+        return super().get_regex(fields_def_ext, pad=BMonFilename.pad, delimiter=BMonFilename.delimiter, ext=ext)
+
+    @classmethod
+    def build_many(cls, fields, ext='.nc'):
+        """
+        Builds many BMon filenames at once from columns of field values.
+
+        Parameters
+        ----------
+        fields : dict or pandas.DataFrame
+            Name of fields (keys) and array-like columns or single values (values).
+        ext : str, optional
+            File name extension (default is '.nc').
+
+        Returns
+        -------
+        numpy.ndarray
+            Array of BMon filenames.
+        """
+
+        return super().build_many(fields, cls.encoding_fields_def(), ext=ext, pad=BMonFilename.pad,
+                                  delimiter=BMonFilename.delimiter)
+
+    @classmethod
+    def expand(cls, fields, ext='.nc', lazy=False):
+        """
+        Expands a BMon filename template into all combinations of the given field values, without creating
+        a BMonFilename object per combination. Each value is validated only once.
+
+        Parameters
+        ----------
+        fields : dict
+            Name of fields (keys) and single values or iterables of values (values).
+        ext : str, optional
+            File name extension (default is '.nc').
+        lazy : bool, optional
+            If true, the filenames are generated one after another, else they are returned as an array
+            (default is False).
+
+        Returns
+        -------
+        numpy.ndarray or generator
+            BMon filenames of all combinations.
+        """
+
+        return super().expand(fields, cls.encoding_fields_def(), ext=ext, pad=BMonFilename.pad,
+                              delimiter=BMonFilename.delimiter, lazy=lazy)
+
+    @classmethod
+    def encoding_fields_def(cls):
+        """
+        Returns the BMon fields definition extended by encoders, which do not depend on an instance.
+
+        Returns
+        -------
+        OrderedDict
+            Fields definition with an encoder for the timestamp.
+        """
+
+        def encode_timestamp(time_obj):
+            if isinstance(time_obj, (dt.datetime, dt.date, dt.time)):
+                return time_obj.strftime(cls.timestamp_format)
+            else:
+                return time_obj
+
+        fields_def_ext = OrderedDict(BMonFilename.fields_def)
+        fields_def_ext['timestamp'] = dict(fields_def_ext['timestamp'], encoder=encode_timestamp)
+
+        return fields_def_ext
 
     def decode_timestamp(self, string):
         """
@@ -102,7 +266,7 @@ class BMonFilename(SmartFilename):
         """
 
         if isinstance(string, str):
-            return datetime.strptime(string, self.timestamp_format)
+            return cached_strptime(string, self.timestamp_format)
         else:
             return string
 
@@ -19,13 +19,19 @@ eoDR file name definition.
 
 """
 
-import copy
 import os
 from datetime import datetime
 from collections import OrderedDict
 
+import numpy as np
+import pandas as pd
+
 
 from geopathfinder.file_naming import SmartFilename
+from geopathfinder.file_naming import cached_strptime
+from geopathfinder.file_naming import compile_compact_spec
+from geopathfinder.file_naming import compile_layout
+from geopathfinder.file_naming import parse_datetime64
 
 
 class EODRFilename(SmartFilename):
@@ -42,6 +48,11 @@ class EODRFilename(SmartFilename):
     ])
     pad = "-"
     delimiter = "_"
+    dt_format = "%Y%m%dT%H%M%S"
+    # fields definitions, layouts and compact specifications per band length and lengths of additional dimensions
+    _layout_fields_defs = {}
+    _layouts = {}
+    _compact_specs = {}
 
     def __init__(self, fields, ext='.vrt', convert=False):
         """
@@ -56,14 +67,12 @@ class EODRFilename(SmartFilename):
         convert: bool, optional
             If true, decoding is applied to parts of the filename, where such an operation is available (default is False).
         """
-        self.dt_format = "%Y%m%dT%H%M%S"
-
-        fields_def_ext = copy.deepcopy(EODRFilename.fields_def)
-        fields_def_ext['dt_1']['decoder'] = lambda x: self.decode_datetime(x)
-        fields_def_ext['dt_1']['encoder'] = lambda x: self.encode_datetime(x)
-        fields_def_ext['dt_2']['decoder'] = lambda x: self.decode_datetime(x)
-        fields_def_ext['dt_2']['encoder'] = lambda x: self.encode_datetime(x)
-        fields_def_ext['band']['encoder'] = lambda x: str(x)
+        fields_def_ext = OrderedDict(EODRFilename.fields_def)
+        fields_def_ext['dt_1'] = dict(fields_def_ext['dt_1'], decoder=lambda x: self.decode_datetime(x),
+                                      encoder=lambda x: self.encode_datetime(x))
+        fields_def_ext['dt_2'] = dict(fields_def_ext['dt_2'], decoder=lambda x: self.decode_datetime(x),
+                                      encoder=lambda x: self.encode_datetime(x))
+        fields_def_ext['band'] = dict(fields_def_ext['band'], encoder=lambda x: str(x))
 
         fields_def_keys = list(fields_def_ext.keys())
         for key in fields.keys():
@@ -74,7 +83,7 @@ class EODRFilename(SmartFilename):
                                            pad=EODRFilename.pad, ext=ext, convert=convert)
 
     @classmethod
-    def from_filename(cls, filename_str, convert=False):
+    def from_filename(cls, filename_str, convert=False, fields=None):
         """
         Converts a filename given as a string into an EODRFilename class object.
 
@@ -84,24 +93,277 @@ class EODRFilename(SmartFilename):
             Filename without any paths (e.g., "123456------_20181220T232333_---------------_B5_34_aug.vrt").
         convert: bool, optional
             If true, decoding is applied to parts of the filename, where such an operation is available (default is False).
+        fields : list of str, optional
+            Names of the requested fields. If given, only these fields are extracted and decoded into a named tuple
+            (default: None).
 
         Returns
         -------
-        EODRFilename
-            Class representing an EODR filename.
+        EODRFilename or namedtuple
+            Class representing an EODR filename or record of the requested fields.
         """
 
-        fn_parts = os.path.splitext(os.path.basename(filename_str))[0].split(EODRFilename.delimiter)
-        fields_def_ext = copy.deepcopy(EODRFilename.fields_def)
-        fields_def_ext['band']['len'] = len(fn_parts[3])  # get length of the band in the filename
-        # if the filename consists of more than 4 parts, additional "dimensions" are added to the fields dictionary
-        if len(fn_parts) > 4:
-            for i, fn_part in enumerate(fn_parts[4:]):
-                key = 'd' + str(i + 1)
-                fields_def_ext[key] = {'len': len(fn_part)}
+        part_lengths = cls.get_part_lengths(os.path.basename(filename_str))
+        fields_def_ext = cls.layout_fields_def(part_lengths)
+        layout = cls._layouts.get(part_lengths)
+        if layout is None:
+            layout = compile_layout(fields_def_ext, pad=EODRFilename.pad, delimiter=EODRFilename.delimiter)
+            cls._layouts[part_lengths] = layout
 
         return super().from_filename(filename_str, fields_def_ext, pad=EODRFilename.pad,
-                                     delimiter=EODRFilename.delimiter, convert=convert)
+                                     delimiter=EODRFilename.delimiter, convert=convert, fields=fields, layout=layout)
+
+    @staticmethod
+    def get_part_lengths(filename_str):
+        """
+        Determines the layout of an EODR filename, i.e. the lengths of the band and the additional dimensions.
+
+        Parameters
+        ----------
+        filename_str : str or bytes
+            Filename without any paths.
+
+        Returns
+        -------
+        tuple of int
+            Length of the band followed by the lengths of the additional dimensions.
+        """
+
+        delimiter = EODRFilename.delimiter.encode() if isinstance(filename_str, bytes) else EODRFilename.delimiter
+        fn_parts = os.path.splitext(filename_str)[0].split(delimiter)
+
+        return tuple(len(fn_part) for fn_part in fn_parts[3:])
+
+    @classmethod
+    def layout_fields_def(cls, part_lengths):
+        """
+        Returns the (cached) fields definition of an EODR filename layout. Next to the band, additional
+        "dimensions" 'd1', 'd2', ... are defined if the filename consists of more than 4 parts.
+
+        Parameters
+        ----------
+        part_lengths : tuple of int
+            Length of the band followed by the lengths of the additional dimensions (see 'get_part_lengths').
+
+        Returns
+        -------
+        OrderedDict
+            Fields definition including decoders for the date-times. It is shared and must not be altered.
+        """
+
+        fields_def_ext = cls._layout_fields_defs.get(part_lengths)
+        if fields_def_ext is None:
+            fields_def_ext = OrderedDict(EODRFilename.fields_def)
+            fields_def_ext['dt_1'] = dict(fields_def_ext['dt_1'], decoder=lambda x: cached_strptime(x, cls.dt_format))
+            fields_def_ext['dt_2'] = dict(fields_def_ext['dt_2'], decoder=lambda x: cached_strptime(x, cls.dt_format))
+            fields_def_ext['band'] = dict(fields_def_ext['band'], len=part_lengths[0] if part_lengths else 0)
+            for i, length in enumerate(part_lengths[1:]):
+                fields_def_ext['d' + str(i + 1)] = {'len': length}
+            cls._layout_fields_defs[part_lengths] = fields_def_ext
+
+        return fields_def_ext
+
+    @classmethod
+    def _get_compact_spec(cls, filename_str):
+        """
+        Returns the (cached) slice and decoder table for the layout of the given EODR filename.
+
+        Parameters
+        ----------
+        filename_str : str
+            Filename without any paths.
+
+        Returns
+        -------
+        CompactSpec
+            Slice and decoder table.
+        """
+
+        part_lengths = cls.get_part_lengths(filename_str)
+        spec = cls._compact_specs.get(part_lengths)
+        if spec is None:
+            spec = compile_compact_spec(cls, cls.layout_fields_def(part_lengths), pad=EODRFilename.pad,
+                                        delimiter=EODRFilename.delimiter)
+            cls._compact_specs[part_lengths] = spec
+
+        return spec
+
+    @classmethod
+    def parse_many(cls, filenames, convert=False, fields=None, categorical=False, datetime64=False):
+        """
+        Parses many EODR filenames at once into a table with one column per field.
+        Filenames sharing the same band length and number of additional dimensions are parsed together.
+
+        Parameters
+        ----------
+        filenames : list of str or numpy.ndarray
+            Filenames without any paths.
+        convert: bool, optional
+            If true, decoding is applied to parts of the filename, where such an operation is available (default is False).
+        fields : list of str, optional
+            Names of the requested fields. If given, only these fields are extracted and decoded (default: all fields).
+        categorical : bool, optional
+            If true, the columns are dictionary-encoded (pandas.Categorical) (default is False).
+        datetime64 : bool, optional
+            If true (and 'convert' is true), the date-times are decoded column-wise into numpy.datetime64 values
+            (default is False).
+
+        Returns
+        -------
+        pandas.DataFrame
+            Table with one row per filename and one column per (requested) EODR field. Missing dimensions are empty
+            (convert=False) or None (convert=True).
+        """
+
+        filenames = np.asarray(filenames, dtype=str)
+
+        # group filenames by their layout, i.e. the lengths of the band and the additional dimensions
+        groups = OrderedDict()
+        for i, filename in enumerate(filenames):
+            groups.setdefault(cls.get_part_lengths(filename), []).append(i)
+
+        tables = []
+        for part_lengths, idxs in groups.items():
+            fields_def_ext = cls.layout_fields_def(part_lengths)
+            if datetime64:
+                fields_def_ext = OrderedDict(fields_def_ext)
+                for name in ['dt_1', 'dt_2']:
+                    fields_def_ext[name] = dict(fields_def_ext[name],
+                                                column_decoder=lambda x: parse_datetime64(x, cls.dt_format))
+            group_fields = None if fields is None else [name for name in fields if name in fields_def_ext]
+            table = super().parse_many(filenames[idxs], fields_def_ext, pad=EODRFilename.pad,
+                                       delimiter=EODRFilename.delimiter, convert=convert, fields=group_fields)
+            table.index = idxs
+            tables.append(table)
+
+        if not tables:
+            return pd.DataFrame(columns=list(EODRFilename.fields_def.keys()) if fields is None else list(fields))
+        table = pd.concat(tables, sort=False).sort_index()
+        if fields is not None:
+            # dimensions, which are missing in all filenames, are still returned
+            table = table.reindex(columns=list(fields))
+        if not convert:
+            # fill up missing dimensions
+            table = table.fillna('')
+        else:
+            # missing dimensions are None, as empty fields of a single filename
+            for name in table.columns:
+                if table[name].dtype.kind != 'M' and table[name].isna().any():
+                    table[name] = table[name].astype(object).where(table[name].notna(), None)
+        if categorical:
+            # groups are dictionary-encoded after merging them, since their value tables differ
+            table = table.astype('category')
+
+        return table
+
+    @classmethod
+    def get_regex(cls, ext=None):
+        """
+        Returns the (cached) regular expression matching EODR filenames. The additional dimensions
+        are matched together by the group 'dims' (e.g., '_34_aug').
+
+        Parameters
+        ----------
+        ext : str, optional
+            File name extension. If not given, any extension is accepted (default: None).
+
+        Returns
+        -------
+        regex.Pattern
+            Compiled regular expression.
+        """
+
+        fields_def_ext = OrderedDict(EODRFilename.fields_def)
+        fields_def_ext['dt_1'] = dict(fields_def_ext['dt_1'], regex='[0-9]{8}T[0-9]{6}|-{15}')
+        fields_def_ext['dt_2'] = dict(fields_def_ext['dt_2'], regex='[0-9]{8}T[0-9]{6}|-{15}')
+        fields_def_ext['band'] = dict(fields_def_ext['band'], delim='', regex='[^_.\\n]+')
+        fields_def_ext['dims'] = {'regex': '(?:_[^_.\\n]+)*'}
+
+        return super().get_regex(fields_def_ext, pad=EODRFilename.pad, delimiter=EODRFilename.delimiter, ext=ext)
+
+    @classmethod
+    def build_many(cls, fields, ext='.vrt'):
+        """
+        Builds many EODR filenames at once from columns of field values.
+        Additional fields are appended as dimensions.
+
+        Parameters
+        ----------
+        fields : dict or pandas.DataFrame
+            Name of fields (keys) and array-like columns or single values (values).
+        ext : str, optional
+            Extension of the filename (default is '.vrt' for GDAL VRT files)
+
+        Returns
+        -------
+        numpy.ndarray
+            Array of EODR filenames.
+        """
+
+        return super().build_many(fields, cls.encoding_fields_def(fields.keys()), ext=ext, pad=EODRFilename.pad,
+                                  delimiter=EODRFilename.delimiter)
+
+    @classmethod
+    def expand(cls, fields, ext='.vrt', lazy=False):
+        """
+        Expands an EODR filename template into all combinations of the given field values, without creating
+        an EODRFilename object per combination. Each value is validated only once. Additional fields are
+        appended as dimensions.
+
+        Parameters
+        ----------
+        fields : dict
+            Name of fields (keys) and single values or iterables of values (values). Fields, which vary together,
+            can be given by a tuple of names and an iterable of value tuples (see 'SmartFilename.expand').
+        ext : str, optional
+            Extension of the filename (default is '.vrt' for GDAL VRT files)
+        lazy : bool, optional
+            If true, the filenames are generated one after another, else they are returned as an array
+            (default is False).
+
+        Returns
+        -------
+        numpy.ndarray or generator
+            EODR filenames of all combinations.
+        """
+
+        names = []
+        for key in fields.keys():
+            names.extend(key if isinstance(key, tuple) else [key])
+
+        return super().expand(fields, cls.encoding_fields_def(names), ext=ext, pad=EODRFilename.pad,
+                              delimiter=EODRFilename.delimiter, lazy=lazy)
+
+    @classmethod
+    def encoding_fields_def(cls, names=()):
+        """
+        Returns the EODR fields definition extended by encoders, which do not depend on an instance.
+
+        Parameters
+        ----------
+        names : iterable of str, optional
+            Names of the given fields. Names, which are not part of the definition, are appended as dimensions.
+
+        Returns
+        -------
+        OrderedDict
+            Fields definition with encoders for the date-times.
+        """
+
+        def encode_datetime(time_obj):
+            if isinstance(time_obj, datetime):
+                return time_obj.strftime(cls.dt_format)
+            else:
+                return time_obj
+
+        fields_def_ext = OrderedDict(EODRFilename.fields_def)
+        fields_def_ext['dt_1'] = dict(fields_def_ext['dt_1'], encoder=encode_datetime)
+        fields_def_ext['dt_2'] = dict(fields_def_ext['dt_2'], encoder=encode_datetime)
+        for name in names:
+            if name not in fields_def_ext:
+                fields_def_ext[name] = {}
+
+        return fields_def_ext
 
     @property
     def stime(self):
@@ -154,7 +416,7 @@ class EODRFilename(SmartFilename):
             Original object or datetime object parsed from the given string.
         """
         if isinstance(string, str):
-            return datetime.strptime(string, self.dt_format)
+            return cached_strptime(string, self.dt_format)
         else:
             return string
 
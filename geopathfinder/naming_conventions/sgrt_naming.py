@@ -20,16 +20,24 @@ SGRT folder and file name definition.
 """
 
 import os
-import copy
+from functools import lru_cache
 
 import datetime as dt
 from datetime import datetime
 from collections import OrderedDict
 
+import numpy as np
+import pandas as pd
+
 from geopathfinder.folder_naming import SmartPath
 from geopathfinder.folder_naming import build_smarttree
 from geopathfinder.folder_naming import create_smartpath
 from geopathfinder.file_naming import SmartFilename
+from geopathfinder.file_naming import cached_strptime
+from geopathfinder.file_naming import compile_layout
+from geopathfinder.file_naming import parse_datetime64
+from geopathfinder.file_naming import map_unique
+from geopathfinder.file_naming import to_columns
 
 
 # Please add here new sensors if they follow the SGRT naming convention.
@@ -65,6 +73,10 @@ class SgrtFilename(SmartFilename):
     ])
     pad = "-"
     delimiter = "_"
+    date_format = "%Y%m%d"
+    time_format = "%H%M%S"
+    # fields definitions with decoders and encoders per class and 'single_date' setting
+    _fields_defs = {}
 
     def __init__(self, fields, ext=".tif", convert=False):
         """
@@ -78,8 +90,6 @@ class SgrtFilename(SmartFilename):
             If true, decoding is applied to parts of the filename, where such an operation is available (default is False).
         """
 
-        self.date_format = "%Y%m%d"
-        self.time_format = "%H%M%S"
         fields = fields.copy()
 
         if 'dtime_2' not in fields.keys():
@@ -109,19 +119,50 @@ class SgrtFilename(SmartFilename):
                 fields['dtime_1'] = self.encode_date(fields['dtime_1'])
                 fields['dtime_2'] = self.encode_date(fields['dtime_2'])
 
-        fields_def_ext = copy.deepcopy(SgrtFilename.fields_def)
-        fields_def_ext['dtime_1']['decoder'] = lambda x: self.decode_date(x)
-        fields_def_ext['dtime_1']['encoder'] = lambda x: self.encode_date(x)
-        fields_def_ext['dtime_2']['decoder'] = lambda x: self.decode_time(x)
-        fields_def_ext['dtime_2']['encoder'] = lambda x: self.encode_time(x)
-        fields_def_ext['relative_orbit']['decoder'] = lambda x: self.decode_rel_orbit(x)
-        fields_def_ext['relative_orbit']['encoder'] = lambda x: self.encode_rel_orbit(x)
+        super(SgrtFilename, self).__init__(fields, self._get_fields_def(self.single_date), ext=ext,
+                                           pad=SgrtFilename.pad, delimiter=SgrtFilename.delimiter, convert=convert,
+                                           layout=self.get_layout())
 
-        super(SgrtFilename, self).__init__(fields, fields_def_ext, ext=ext, pad=SgrtFilename.pad,
-                                           delimiter=SgrtFilename.delimiter, convert=convert)
+    @classmethod
+    def _get_fields_def(cls, single_date):
+        """
+        Returns the (cached) SGRT fields definition extended by decoders and encoders of SgrtFilename objects.
+        It is built once per class and 'single_date' setting, i.e. not per object.
+
+        Parameters
+        ----------
+        single_date : bool
+            True if 'dtime_2' is the time of a single date, else it is a second date.
+
+        Returns
+        -------
+        OrderedDict
+            Fields definition with decoders and encoders for the dates/times and the relative orbit.
+            It is shared and must not be altered.
+        """
+
+        fields_def_ext = cls._fields_defs.get((cls, single_date))
+        if fields_def_ext is None:
+            if single_date:
+                decode_dtime_2 = lambda x: cached_strptime(x, cls.time_format).time()
+                encode_dtime_2 = lambda x: cls._encode_dtime(x, cls.time_format)
+            else:
+                decode_dtime_2 = lambda x: cached_strptime(x, cls.date_format).date()
+                encode_dtime_2 = lambda x: cls._encode_dtime(x, cls.date_format)
+
+            fields_def_ext = OrderedDict(SgrtFilename.fields_def)
+            fields_def_ext['dtime_1'] = dict(fields_def_ext['dtime_1'],
+                                             decoder=lambda x: cached_strptime(x, cls.date_format).date(),
+                                             encoder=lambda x: cls._encode_dtime(x, cls.date_format))
+            fields_def_ext['dtime_2'] = dict(fields_def_ext['dtime_2'], decoder=decode_dtime_2, encoder=encode_dtime_2)
+            fields_def_ext['relative_orbit'] = dict(fields_def_ext['relative_orbit'], decoder=int,
+                                                    encoder=cls._encode_rel_orbit)
+            cls._fields_defs[(cls, single_date)] = fields_def_ext
+
+        return fields_def_ext
 
     @classmethod
-    def from_filename(cls, filename_str, convert=False):
+    def from_filename(cls, filename_str, convert=False, fields=None):
         """
         Converts a filename given as a string into an SgrtFilename class object.
 
@@ -131,15 +172,346 @@ class SgrtFilename(SmartFilename):
             Filename without any paths (e.g., "M20170725_165004--_SIG0-----_S1BIWGRDH1VVA_146_A0104_EU500M_E048N012T6.tif").
         convert: bool, optional
             If true, decoding is applied to parts of the filename, where such an operation is available (default is False).
+        fields : list of str, optional
+            Names of the requested fields. If given, only these fields are extracted and decoded into a named tuple
+            (default: None).
+
+        Returns
+        -------
+        SgrtFilename or namedtuple
+            Class representing an SGRT filename or record of the requested fields.
+        """
+
+        fields_def = SgrtFilename.fields_def if fields is None else cls.decoding_fields_def()
+        return super().from_filename(filename_str, fields_def, pad=SgrtFilename.pad,
+                                     delimiter=SgrtFilename.delimiter, convert=convert, fields=fields,
+                                     layout=cls.get_layout())
+
+    @classmethod
+    def parse_many(cls, filenames, convert=False, fields=None, categorical=False, datetime64=False):
+        """
+        Parses many SGRT filenames at once into a table with one column per field.
+
+        Parameters
+        ----------
+        filenames : list of str or numpy.ndarray
+            Filenames without any paths.
+        convert: bool, optional
+            If true, decoding is applied to parts of the filename, where such an operation is available (default is False).
+        fields : list of str, optional
+            Names of the requested fields. If given, only these fields are extracted and decoded (default: all fields).
+        categorical : bool, optional
+            If true, the columns are dictionary-encoded (pandas.Categorical) (default is False).
+        datetime64 : bool, optional
+            If true (and 'convert' is true), 'dtime_1' and 'dtime_2' are merged column-wise into the
+            numpy.datetime64 columns 'stime' and 'etime', following the 'single_date' logic (default is False).
+
+        Returns
+        -------
+        pandas.DataFrame
+            Table with one row per filename and one column per (requested) SGRT field.
+        """
+
+        if not (convert and datetime64):
+            return super().parse_many(filenames, cls.decoding_fields_def(), pad=SgrtFilename.pad,
+                                      delimiter=SgrtFilename.delimiter, convert=convert, fields=fields,
+                                      categorical=categorical)
+
+        names = list(SgrtFilename.fields_def.keys()) if fields is None else list(fields)
+        names = ['stime' if name == 'dtime_1' else 'etime' if name == 'dtime_2' else name for name in names]
+        # the encoded and padded dates/times are kept to merge them afterwards
+        fields_def_ext = cls.decoding_fields_def()
+        for name in ['dtime_1', 'dtime_2']:
+            fields_def_ext[name] = dict(fields_def_ext[name], column_decoder=lambda x: x)
+        table = super().parse_many(filenames, fields_def_ext, pad=SgrtFilename.pad,
+                                   delimiter=SgrtFilename.delimiter, convert=True,
+                                   fields=[name for name in names if name not in ['stime', 'etime']] +
+                                          ['dtime_1', 'dtime_2'],
+                                   categorical=categorical)
+
+        dtime_1 = np.asarray(table.pop('dtime_1'), dtype=str)
+        dtime_2 = np.asarray(table.pop('dtime_2'), dtype=str)
+        date_1 = parse_datetime64(dtime_1, cls.date_format)
+        # a time is only given for a single date, e.g. '165004--'
+        single_date = np.char.endswith(dtime_2, '--')
+        time_2 = parse_datetime64(dtime_2.astype('U6'), cls.time_format)
+        stime = np.where(single_date, date_1 + time_2, date_1)
+        etime = np.where(single_date, stime, parse_datetime64(dtime_2, cls.date_format))
+
+        for name, values in [('stime', stime), ('etime', etime)]:
+            if name in names:
+                table[name] = pd.Categorical(values) if categorical else values
+
+        return table[names]
+
+    @classmethod
+    def decoding_fields_def(cls):
+        """
+        Returns the SGRT fields definition extended by decoders, which do not depend on an instance.
+
+        Returns
+        -------
+        OrderedDict
+            Fields definition with decoders for the dates/times and the relative orbit.
+        """
+
+        def decode_time(string):
+            # a time is only given for a single date, e.g. '165004--'
+            if len(string) == 6:
+                return cached_strptime(string, cls.time_format).time()
+            else:
+                return cached_strptime(string, cls.date_format).date()
+
+        fields_def_ext = OrderedDict(SgrtFilename.fields_def)
+        fields_def_ext['dtime_1'] = dict(fields_def_ext['dtime_1'],
+                                         decoder=lambda x: cached_strptime(x, cls.date_format).date())
+        fields_def_ext['dtime_2'] = dict(fields_def_ext['dtime_2'], decoder=decode_time)
+        fields_def_ext['relative_orbit'] = dict(fields_def_ext['relative_orbit'], decoder=int)
+
+        return fields_def_ext
+
+    @classmethod
+    def get_regex(cls, ext=None):
+        """
+        Returns the (cached) regular expression matching SGRT filenames. Next to the field lengths and delimiters,
+        it checks that dates, times and the relative orbit consist of digits.
+
+        Parameters
+        ----------
+        ext : str, optional
+            File name extension. If not given, any extension is accepted (default: None).
+
+        Returns
+        -------
+        regex.Pattern
+            Compiled regular expression.
+        """
+
+        return super().get_regex(cls.regex_fields_def(), pad=SgrtFilename.pad, delimiter=SgrtFilename.delimiter,
+                                 ext=ext)
+
+    @classmethod
+    def regex_fields_def(cls):
+        """
+        Returns the SGRT fields definition extended by regular expressions of the field contents.
+
+        Returns
+        -------
+        OrderedDict
+            Fields definition requiring digits for the dates/times and the relative orbit.
+        """
+
+        fields_def_ext = OrderedDict(SgrtFilename.fields_def)
+        fields_def_ext['dtime_1'] = dict(fields_def_ext['dtime_1'], regex='[0-9]{8}')
+        fields_def_ext['dtime_2'] = dict(fields_def_ext['dtime_2'], regex='[0-9]{6}--|[0-9]{8}')
+        fields_def_ext['relative_orbit'] = dict(fields_def_ext['relative_orbit'], regex='[0-9]{3}|---')
+
+        return fields_def_ext
+
+    @classmethod
+    def validate_many(cls, filenames):
+        """
+        Validates many SGRT filenames at once. Next to the lengths of the fields and the delimiters, it checks
+        that the dates/times can be decoded and that the relative orbit consists of digits.
+
+        Parameters
+        ----------
+        filenames : list of str
+            Filenames without any paths.
+
+        Returns
+        -------
+        pandas.DataFrame
+            Table with one row per filename and the boolean columns 'layout', 'dtime_1', 'dtime_2',
+            'relative_orbit' and 'valid' (true if the check passed).
+        """
+
+        filenames = list(filenames)
+        report = super().validate_many(filenames, cls.regex_fields_def(), pad=SgrtFilename.pad,
+                                       delimiter=SgrtFilename.delimiter)
+        if not filenames:
+            return report
+
+        # dates/times consisting of digits might still not exist (e.g., 20180230)
+        columns = compile_layout(SgrtFilename.fields_def, pad=SgrtFilename.pad,
+                                 delimiter=SgrtFilename.delimiter).split_many(filenames, names=['dtime_1', 'dtime_2'])
+        dtime_2 = columns['dtime_2']
+        report['dtime_1'] &= ~np.isnat(parse_datetime64(columns['dtime_1'], cls.date_format))
+        report['dtime_2'] &= np.where(np.char.endswith(dtime_2, '--'),
+                                      ~np.isnat(parse_datetime64(dtime_2.astype('U6'), cls.time_format)),
+                                      ~np.isnat(parse_datetime64(dtime_2, cls.date_format)))
+        report['valid'] = report.drop(columns='valid').all(axis=1)
+
+        return report
+
+    @classmethod
+    def build_many(cls, fields, ext=".tif"):
+        """
+        Builds many SGRT filenames at once from columns of field values. As for a single SgrtFilename,
+        'dtime_1' and 'dtime_2' are either a date range or a single date and time.
+
+        Parameters
+        ----------
+        fields : dict or pandas.DataFrame
+            Name of fields (keys) and array-like columns or single values (values).
+        ext : str, optional
+            File name extension (default is '.tif').
+
+        Returns
+        -------
+        numpy.ndarray
+            Array of SGRT filenames.
+        """
+
+        columns = to_columns(fields)
+        if 'dtime_1' in columns:
+            if 'dtime_2' in columns:
+                dtime_2 = columns['dtime_2']
+                single_date = map_unique(dtime_2, cls._is_single_date).astype(bool)
+            else:
+                dtime_2 = columns['dtime_1']
+                single_date = np.ones(len(dtime_2), dtype=bool)
+            columns['dtime_1'] = map_unique(columns['dtime_1'], lambda x: cls._encode_dtime(x, cls.date_format))
+            columns['dtime_2'] = np.where(single_date,
+                                          map_unique(dtime_2, lambda x: cls._encode_dtime(x, cls.time_format)),
+                                          map_unique(dtime_2, lambda x: cls._encode_dtime(x, cls.date_format)))
+
+        fields_def_ext = OrderedDict(SgrtFilename.fields_def)
+        fields_def_ext['relative_orbit'] = dict(fields_def_ext['relative_orbit'], encoder=cls._encode_rel_orbit)
+
+        return super().build_many(columns, fields_def_ext, ext=ext, pad=SgrtFilename.pad,
+                                  delimiter=SgrtFilename.delimiter)
+
+    @classmethod
+    def expand(cls, fields, ext=".tif", lazy=False):
+        """
+        Expands an SGRT filename template into all combinations of the given field values (e.g., tiles x dates x
+        variables), without creating an SgrtFilename object per combination. Each value is validated only once.
+        As for a single SgrtFilename, 'dtime_2' is a time or a date, or it is derived from 'dtime_1'.
+
+        Parameters
+        ----------
+        fields : dict
+            Name of fields (keys) and single values or iterables of values (values). Fields, which vary together,
+            can be given by a tuple of names and an iterable of value tuples (see 'SmartFilename.expand').
+        ext : str, optional
+            File name extension (default is '.tif').
+        lazy : bool, optional
+            If true, the filenames are generated one after another, else they are returned as an array
+            (default is False).
+
+        Returns
+        -------
+        numpy.ndarray or generator
+            SGRT filenames of all combinations.
+        """
+
+        fields_ext = OrderedDict()
+        for key, values in fields.items():
+            if key == 'dtime_1' and 'dtime_2' not in fields:
+                # the time of a single date is taken from 'dtime_1'
+                if isinstance(values, str) or np.ndim(values) == 0:
+                    values = [values]
+                fields_ext[('dtime_1', 'dtime_2')] = [(value, cls._get_time(value)) for value in values]
+            else:
+                fields_ext[key] = values
+
+        fields_def_ext = OrderedDict(SgrtFilename.fields_def)
+        fields_def_ext['dtime_1'] = dict(fields_def_ext['dtime_1'],
+                                         encoder=lambda x: cls._encode_dtime(x, cls.date_format))
+        fields_def_ext['dtime_2'] = dict(fields_def_ext['dtime_2'],
+                                         encoder=lambda x: cls._encode_dtime(x, cls.time_format
+                                                                             if cls._is_single_date(x)
+                                                                             else cls.date_format))
+        fields_def_ext['relative_orbit'] = dict(fields_def_ext['relative_orbit'], encoder=cls._encode_rel_orbit)
+
+        return super().expand(fields_ext, fields_def_ext, ext=ext, pad=SgrtFilename.pad,
+                              delimiter=SgrtFilename.delimiter, lazy=lazy)
+
+    @staticmethod
+    def _is_single_date(dtime_2):
+        """
+        Checks if the second date/time field refers to a single date, i.e. if it is a time.
+
+        Parameters
+        ----------
+        dtime_2 : str, datetime.date, datetime.time
+            Encoded or decoded second date/time field.
+
+        Returns
+        -------
+        bool
+            True if the filename refers to a single date.
+        """
+
+        if isinstance(dtime_2, str):
+            return dtime_2.endswith('--')
+        else:
+            return isinstance(dtime_2, dt.time) or (dtime_2.year < 1950)
+
+    @staticmethod
+    def _get_time(dtime_1):
+        """
+        Returns the time of the first date/time field, which is used as the second one for a single date.
+
+        Parameters
+        ----------
+        dtime_1 : str, datetime.date, datetime.datetime
+            Encoded or decoded first date/time field.
+
+        Returns
+        -------
+        str, datetime.time
+            Time of the day (strings are kept).
+        """
+
+        if isinstance(dtime_1, dt.datetime):
+            return dtime_1.time()
+        elif isinstance(dtime_1, dt.date):
+            return dt.time()
+        else:
+            return dtime_1
+
+    @staticmethod
+    def _encode_dtime(time_obj, time_format):
+        """
+        Encodes a date/time object with the given format. Strings are kept.
+
+        Parameters
+        ----------
+        time_obj : str, datetime.date, datetime.datetime, datetime.time
+            Date/time object.
+        time_format : str
+            Datetime format.
+
+        Returns
+        -------
+        str, object
+            Encoded date/time or original object.
+        """
+
+        if isinstance(time_obj, (dt.datetime, dt.date, dt.time)):
+            return time_obj.strftime(time_format)
+        else:
+            return time_obj
+
+    @staticmethod
+    def _encode_rel_orbit(relative_orbit):
+        """
+        Encodes a relative orbit number with three digits. Strings are kept.
+
+        Parameters
+        ----------
+        relative_orbit : int, str
+            Relative orbit.
 
         Returns
         -------
-        SgrtFilename
-            Class representing an SGRT filename.
+        str, object
+            Encoded relative orbit or original object.
         """
 
-        return super().from_filename(filename_str, SgrtFilename.fields_def, pad=SgrtFilename.pad,
-                                     delimiter=SgrtFilename.delimiter, convert=convert)
+        return "{:03d}".format(relative_orbit) if isinstance(relative_orbit, int) else relative_orbit
 
     @property
     def stime(self):
@@ -238,7 +610,7 @@ class SgrtFilename(SmartFilename):
             Original object or datetime.date object parsed from the given string.
         """
         if isinstance(string, str):
-            return datetime.strptime(string, self.date_format).date()
+            return cached_strptime(string, self.date_format).date()
         else:
             return string
 
@@ -259,7 +631,7 @@ class SgrtFilename(SmartFilename):
         """
         if isinstance(string, str):
             if self.single_date:
-                return datetime.time(datetime.strptime(string, self.time_format))
+                return cached_strptime(string, self.time_format).time()
             else:
                 return self.decode_date(string)
         else:
@@ -345,6 +717,22 @@ class SgrtFilename(SmartFilename):
             return relative_orbit
 
 
+# order of the folder levels below the sensor directory
+sgrt_hierarchy = ['mode', 'group', 'datalog',
+                  'product', 'wflow', 'grid',
+                  'tile', 'var', 'qlook']
+
+# folder levels repeating a filename field
+sgrt_level_fields = OrderedDict([('wflow', 'workflow_id'),
+                                 ('grid', 'grid_name'),
+                                 ('tile', 'tile_name'),
+                                 ('var', 'var_name')])
+
+# filename fields defining the SGRT directory of a file
+sgrt_dir_fields = ['pflag', 'mode_id', 'product_type', 'res_class',
+                   'workflow_id', 'grid_name', 'tile_name', 'var_name']
+
+
 def sgrt_path(root, mode=None, group=None, datalog=None,
               product=None, wflow=None, grid=None, tile=None, var=None,
               qlook=True, make_dir=False):
@@ -385,8 +773,7 @@ def sgrt_path(root, mode=None, group=None, datalog=None,
     """
 
     # check the sensor folder name
-    if root.split(os.sep)[-1] not in allowed_sensor_dirs:
-        raise ValueError('Wrong input for "root"!')
+    _check_sensor_dir(root)
 
     # define the datalog folder name
     if datalog is None:
@@ -407,14 +794,7 @@ def sgrt_path(root, mode=None, group=None, datalog=None,
 
     # define the group folder name
     if group is None:
-        if wflow.startswith('A'):
-            group = 'preprocessed'
-        elif wflow.startswith('B'):
-            group = 'parameters'
-        elif wflow.startswith('C'):
-            group = 'products'
-        else:
-            raise ValueError('Wrong input for "wflow" level!')
+        group = _get_group(wflow)
 
 
     # defining the folder levels
@@ -435,7 +815,186 @@ def sgrt_path(root, mode=None, group=None, datalog=None,
                      make_dir=make_dir)
 
 
-def sgrt_tree(root, target_level=None, register_file_pattern=None):
+def sgrt_dir(root, filename, product, grid_prefix='EQUI7_', qlook=None):
+    """
+    Resolves the SGRT directory of a file directly from its filename fields,
+    without building a SmartPath.
+
+    Parameters
+    ----------
+    root : str
+        root directory of the path. must contain satellite sensor at toplevel.
+        e.g. "R:\\Datapool_processed\\Sentinel-1_CSAR"
+    filename : str or SgrtFilename
+        SGRT filename without any paths.
+    product : str
+        e.g. "ssm" (not contained in the filename)
+    grid_prefix : str, optional
+        prefix of the grid folder name, e.g. "EQUI7_" for "EQUI7_EU500M"
+        (default: "EQUI7_").
+    qlook : bool, optional
+        if the quicklook subdir should be integrated (default: only for
+        filenames with the product flag "Q").
+
+    Returns
+    -------
+    str
+        SGRT directory of the file.
+    """
+
+    _check_sensor_dir(root)
+    fields = SgrtFilename.from_filename(str(filename), fields=list(sgrt_dir_fields))
+    if qlook is None:
+        qlook = fields.pflag == 'Q'
+
+    return _resolve_sgrt_dir(root, fields.mode_id + fields.product_type + fields.res_class, product,
+                             fields.workflow_id, grid_prefix + fields.grid_name, fields.tile_name,
+                             fields.var_name.lower(), qlook)
+
+
+def sgrt_dirs(root, filenames, product, grid_prefix='EQUI7_', qlook=None):
+    """
+    Resolves the SGRT directories of many files at once (see sgrt_dir()).
+    The directory is only constructed once per unique combination of the
+    folder levels.
+
+    Parameters
+    ----------
+    root : str
+        root directory of the path. must contain satellite sensor at toplevel.
+        e.g. "R:\\Datapool_processed\\Sentinel-1_CSAR"
+    filenames : list of str or numpy.ndarray
+        SGRT filenames without any paths.
+    product : str or list of str
+        e.g. "ssm", a single one or one per filename.
+    grid_prefix : str, optional
+        prefix of the grid folder name, e.g. "EQUI7_" for "EQUI7_EU500M"
+        (default: "EQUI7_").
+    qlook : bool, optional
+        if the quicklook subdir should be integrated (default: only for
+        filenames with the product flag "Q").
+
+    Returns
+    -------
+    numpy.ndarray
+        SGRT directories of the files. The directory of a filename, which
+        does not follow the SGRT naming convention or has an unknown
+        workflow ID, is None.
+    """
+
+    _check_sensor_dir(root)
+    filenames = list(filenames)
+    fields = SgrtFilename.parse_many(filenames, fields=list(sgrt_dir_fields))
+    if len(fields) == 0:
+        return np.array([], dtype=object)
+
+    fields['product'] = product
+    if qlook is None:
+        fields['pflag'] = fields['pflag'] == 'Q'
+    else:
+        fields['pflag'] = qlook
+    codes, combinations = pd.factorize(pd.MultiIndex.from_frame(fields))
+
+    dirs = []
+    for combination in combinations:
+        levels = dict(zip(fields.columns, combination))
+        try:
+            dirs.append(_resolve_sgrt_dir(root, levels['mode_id'] + levels['product_type'] + levels['res_class'],
+                                          levels['product'], levels['workflow_id'],
+                                          grid_prefix + levels['grid_name'], levels['tile_name'],
+                                          levels['var_name'].lower(), levels['pflag']))
+        except ValueError:
+            dirs.append(None)
+
+    dirs = np.array(dirs, dtype=object)[codes]
+    dirs[~SgrtFilename.matches(filenames)] = None
+
+    return dirs
+
+
+@lru_cache(maxsize=65536)
+def _resolve_sgrt_dir(root, mode, product, wflow, grid, tile, var, qlook):
+    """
+    Joins the SGRT folder levels of a dataset (cached per combination).
+
+    Parameters
+    ----------
+    root : str
+        root directory of the path, i.e. the sensor directory.
+    mode : str
+        e.g. "IWGRDH"
+    product : str
+        e.g. "ssm"
+    wflow : str
+        e.g. "C1003"; the group level is derived from it.
+    grid : str
+        e.g. "EQUI7_EU500M"
+    tile : str
+        e.g. "E048N012T6"
+    var : str
+        e.g. "ssm"
+    qlook : bool
+        if the quicklook subdir should be integrated.
+
+    Returns
+    -------
+    str
+        SGRT directory.
+
+    Raises
+    ------
+    ValueError
+        if the workflow ID does not start with "A", "B" or "C".
+    """
+
+    levels = [root, mode, _get_group(wflow), 'datasets', product, wflow, grid, tile, var]
+    if qlook:
+        levels.append('qlooks')
+
+    return os.path.join(*levels)
+
+
+def _get_group(wflow):
+    """
+    Derives the group folder name from the workflow ID.
+
+    Parameters
+    ----------
+    wflow : str
+        e.g. "C1003"
+
+    Returns
+    -------
+    str
+        "preprocessed", "parameters" or "products"
+    """
+
+    if wflow.startswith('A'):
+        return 'preprocessed'
+    elif wflow.startswith('B'):
+        return 'parameters'
+    elif wflow.startswith('C'):
+        return 'products'
+    else:
+        raise ValueError('Wrong input for "wflow" level!')
+
+
+def _check_sensor_dir(root):
+    """
+    Checks the sensor folder name of the root directory.
+
+    Parameters
+    ----------
+    root : str
+        root directory of the path.
+    """
+
+    if root.split(os.sep)[-1] not in allowed_sensor_dirs:
+        raise ValueError('Wrong input for "root"!')
+
+
+def sgrt_tree(root, target_level=None, register_file_pattern=None, as_bytes=False, workers=None,
+              record_mtimes=False):
 
     """
     Realisation of the full SGRT folder naming convention, yielding a
@@ -458,6 +1017,15 @@ def sgrt_tree(root, target_level=None, register_file_pattern=None):
         No asterisk is needed ('*')!
         Sequence of strings in given tuple is crucial!
         Be careful: If the tree is large, this can take a while!
+    as_bytes : bool, optional
+        If True, directories are walked and files are searched as bytes
+        (see build_smarttree()).
+    workers : int, optional
+        If larger than 1, directories are listed concurrently by this number
+        of threads (see build_smarttree()).
+    record_mtimes : bool, optional
+        If True, the modification times of the directories are recorded,
+        which allows to refresh the SmartTree (see build_smarttree()).
 
     Returns
     -------
@@ -466,15 +1034,16 @@ def sgrt_tree(root, target_level=None, register_file_pattern=None):
     """
 
     # defining the hierarchy
-    hierarchy = ['mode', 'group','datalog',
-                 'product', 'wflow', 'grid',
-                 'tile', 'var', 'qlook']
+    hierarchy = list(sgrt_hierarchy)
 
     # Check for allowed directory topnames for "root".
     if root.split(os.sep)[-1] in allowed_sensor_dirs:
         sgrt_tree = build_smarttree(root, hierarchy,
                                     target_level=target_level,
-                                    register_file_pattern=register_file_pattern)
+                                    register_file_pattern=register_file_pattern,
+                                    as_bytes=as_bytes,
+                                    workers=workers,
+                                    record_mtimes=record_mtimes)
     else:
         raise ValueError('Root-directory "{}" does is '
                          'not a valid SGRT folder!'.format(root))
@@ -482,5 +1051,103 @@ def sgrt_tree(root, target_level=None, register_file_pattern=None):
     return sgrt_tree
 
 
+def validate_sgrt_files(files, root, hierarchy=None):
+    """
+    Validates SGRT files at once, e.g. the file register of a SmartTree().
+    Next to the filenames (see SgrtFilename.validate_many()), it checks that
+    the filenames match the folder levels they are stored in (e.g. the
+    "tile_name" and the "tile" level).
+
+    Parameters
+    ----------
+    files : list of str
+        full paths of the files below "root".
+    root : str
+        top level directory of the SGRT dataset (i.e. the sensor directory).
+    hierarchy : list of str, optional
+        order of the folder levels below "root" (default: sgrt_hierarchy).
+
+    Returns
+    -------
+    report : pandas.DataFrame
+        one row per file with the columns "dir", "filename", the boolean
+        checks "layout", "dtime_1", "dtime_2", "relative_orbit", "levels"
+        and "valid" (true if the check passed).
+    summary : pandas.DataFrame
+        one row per directory with the number of files ("files"), of
+        invalid files ("invalid") and of failed checks per check. The checks
+        of the fields and levels are only counted for files with a valid
+        "layout", i.e. each invalid file is counted in one check at least
+        and a file with a wrong layout in the "layout" check only.
+    """
+
+    hierarchy = sgrt_hierarchy if hierarchy is None else hierarchy
+    files = list(files)
+    dirs = np.array([os.path.dirname(f) for f in files], dtype=object)
+    filenames = [os.path.basename(f) for f in files]
+
+    report = SgrtFilename.validate_many(filenames)
+    checks = [name for name in report.columns if name != 'valid']
+
+    # the folder levels are only derived once per directory
+    dir_codes, unique_dirs = pd.factorize(dirs)
+    dir_levels = [dict(zip(hierarchy, os.path.relpath(d, root).split(os.sep))) for d in unique_dirs]
+
+    levels_ok = np.ones(len(files), dtype=bool)
+    if files:
+        fields = SgrtFilename.parse_many(filenames, fields=list(sgrt_level_fields.values()))
+        for level, name in sgrt_level_fields.items():
+            level_values = np.array([levels.get(level, '') for levels in dir_levels], dtype=str)[dir_codes]
+            field_values = fields[name].to_numpy(dtype=str)
+            if level == 'grid':
+                # e.g. 'EU500M' in grid level 'EQUI7_EU500M'
+                complies = np.char.endswith(level_values, field_values)
+            else:
+                complies = np.char.lower(level_values) == np.char.lower(field_values)
+            levels_ok &= (level_values == '') | complies
+    # filenames with a wrong layout are not compared with their folders
+    report['levels'] = levels_ok | ~report['layout'].to_numpy()
+    report['valid'] = report.pop('valid') & report['levels']
+    report.insert(0, 'dir', dirs)
+    report.insert(1, 'filename', filenames)
+
+    failed = ~report.drop(columns=['dir', 'filename'])
+    # the fields of a filename with a wrong layout are not checked
+    for name in checks:
+        if name != 'layout':
+            failed[name] &= report['layout']
+    failed = failed.rename(columns={'valid': 'invalid'})
+    failed.insert(0, 'files', 1)
+    failed['dir'] = dirs
+    summary = failed.groupby('dir', sort=True).sum()
+
+    return report, summary
+
+
+def validate_sgrt_tree(smart_tree):
+    """
+    Validates all files in the file register of an SGRT SmartTree()
+    (see validate_sgrt_files()).
+
+    Parameters
+    ----------
+    smart_tree : SmartTree
+        SGRT tree built with a file register (e.g. by sgrt_tree()).
+
+    Returns
+    -------
+    report : pandas.DataFrame
+        one row per file with the results of the checks.
+    summary : pandas.DataFrame
+        one row per directory with the number of files and failed checks.
+    """
+
+    if not smart_tree.has_register:
+        raise ValueError('SmartTree has no file register!')
+
+    return validate_sgrt_files(smart_tree.file_register, smart_tree.root,
+                               hierarchy=smart_tree.hierarchy[1:])
+
+
 if __name__ == '__main__':
     pass
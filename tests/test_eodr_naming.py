@@ -90,6 +90,81 @@ class TestEODRFilename(unittest.TestCase):
         self.assertEqual(self.eodr_fn_4['d2'], 'aug')
         self.assertEqual(self.eodr_fn_4.ext, '.vrt')
 
+    def test_parse_many(self):
+        """
+        Tests parsing many EODR filenames with different layouts at once.
+
+        """
+        fns = ['123456------_20181220T232333_---------------_B5_34_aug.vrt',
+               '654321------_20181220T232333_20181221T232333_B12.vrt',
+               '123456------_20181221T232333_---------------_B5_35_sep.vrt']
+
+        table = EODRFilename.parse_many(fns)
+        self.assertEqual(list(table['band']), ['B5', 'B12', 'B5'])
+        self.assertEqual(list(table['d2']), ['aug', '', 'sep'])
+
+        table = EODRFilename.parse_many(fns, convert=True)
+        self.assertEqual(table['dt_1'][2], datetime(2018, 12, 21, 23, 23, 33))
+        self.assertEqual(table['dt_2'][1], datetime(2018, 12, 21, 23, 23, 33))
+        self.assertIsNone(table['dt_2'][0])
+        # missing dimensions are None, as for a single filename
+        self.assertEqual(list(table['d2']), ['aug', None, 'sep'])
+        self.assertEqual(list(EODRFilename.parse_many(fns, convert=True, fields=['band', 'd3'])['d3']),
+                         [None, None, None])
+
+        table = EODRFilename.parse_many(fns, convert=True, datetime64=True)
+        self.assertEqual(str(table['dt_1'].dtype), 'datetime64[s]')
+        self.assertEqual(list(table['dt_2'].isna()), [True, False, True])
+        self.assertEqual(table['dt_1'][2], datetime(2018, 12, 21, 23, 23, 33))
+
+    def test_field_projection(self):
+        """
+        Tests extracting only some fields of EODR filenames.
+
+        """
+        fns = ['123456------_20181220T232333_---------------_B5_34_aug.vrt',
+               '654321------_20181220T232333_20181221T232333_B12.vrt']
+
+        record = EODRFilename.from_filename(fns[0], convert=True, fields=['band', 'dt_1', 'd2'])
+        self.assertEqual(tuple(record), ('B5', datetime(2018, 12, 20, 23, 23, 33), 'aug'))
+
+        table = EODRFilename.parse_many(fns, fields=['band', 'd1'])
+        self.assertEqual(list(table.columns), ['band', 'd1'])
+        self.assertEqual(list(table['band']), ['B5', 'B12'])
+        self.assertEqual(list(table['d1']), ['34', ''])
+
+    def test_compact(self):
+        """
+        Tests the compact representation of EODR filenames with different layouts.
+
+        """
+        compact_fn = EODRFilename.compact('123456------_20181220T232333_---------------_B5_34_aug.vrt', convert=True)
+        self.assertEqual(compact_fn['id'], '123456')
+        self.assertEqual(compact_fn['dt_1'], datetime(2018, 12, 20, 23, 23, 33))
+        self.assertIsNone(compact_fn['dt_2'])
+        self.assertEqual(compact_fn['d2'], 'aug')
+
+        compact_fn = EODRFilename.compact('654321------_20181220T232333_20181221T232333_B12.vrt')
+        self.assertEqual(compact_fn.band, 'B12')
+        with self.assertRaises(KeyError):
+            compact_fn['d1']
+
+    def test_cached_layouts(self):
+        """
+        Tests that EODR filenames with the same layout share one fields definition.
+
+        """
+        fn_1 = '123456------_20181220T232333_---------------_B5_34_aug.vrt'
+        fn_2 = '654321------_20181221T232333_---------------_B6_35_sep.vrt'
+        part_lengths = EODRFilename.get_part_lengths(fn_1)
+        self.assertEqual(part_lengths, (2, 2, 3))
+        self.assertEqual(EODRFilename.get_part_lengths(fn_2), part_lengths)
+
+        fields_def = EODRFilename.layout_fields_def(part_lengths)
+        self.assertIs(EODRFilename.layout_fields_def(part_lengths), fields_def)
+        self.assertEqual(list(fields_def.keys()), ['id', 'dt_1', 'dt_2', 'band', 'd1', 'd2'])
+        self.assertNotIn('len', EODRFilename.fields_def['band'])
+        self.assertEqual(str(EODRFilename.from_filename(fn_2)), fn_2)
 
 if __name__ == "__main__":
     unittest.main()
@@ -14,10 +14,22 @@
 # NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE,
 # EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
 
+import pickle
 import unittest
 from collections import OrderedDict
 
+import numpy as np
+
+from geopathfinder.file_naming import InternPool
 from geopathfinder.file_naming import SmartFilename
+from geopathfinder.file_naming import compile_layout
+from geopathfinder.file_naming import detect_convention
+from geopathfinder.file_naming import factorize
+from geopathfinder.file_naming import field_sort_key
+from geopathfinder.file_naming import get_conventions
+from geopathfinder.file_naming import _conventions
+from geopathfinder.file_naming import parse_datetime64
+from geopathfinder.file_naming import partition_by_convention
 
 
 class TestSmartFilename(unittest.TestCase):
@@ -82,6 +94,21 @@ class TestSmartFilename(unittest.TestCase):
         with self.assertRaises(ValueError):
             smrtf['pflag'] = 'MM'
 
+    def test_set_fields_in_place(self):
+        """
+        Test that setting a field updates the filename part in place and leaves it untouched if invalid.
+        """
+        fields = {'pflag': 'M', 'dtime_1': '20180101120000'}
+        smrtf = SmartFilename(fields, self.fields_def, ext='.tif')
+        fn_part = smrtf._fn_map['pflag']
+
+        smrtf['pflag'] = 'D'
+        self.assertIs(smrtf._fn_map['pflag'], fn_part)
+        with self.assertRaises(ValueError):
+            smrtf['pflag'] = 'MM'
+        self.assertEqual(smrtf['pflag'], 'D')
+        self.assertEqual(str(smrtf), 'D_20180101120000.tif')
+
     def test_set_and_get_fields(self):
         """
         Test set and get file name fields.
@@ -98,6 +125,266 @@ class TestSmartFilename(unittest.TestCase):
         self.assertEqual(smrtf['pflag'], 'D')
         self.assertEqual(smrtf['dtime_1'], '20180101130000')
 
+    def test_cached_filename(self):
+        """
+        Test that the cached file name follows changes of fields and extension.
+        """
+        fields = {'pflag': 'M', 'dtime_1': '20180101120000'}
+        smrtf = SmartFilename(fields, self.fields_def, ext='.tif')
+
+        self.assertEqual(str(smrtf), 'M_20180101120000.tif')
+        self.assertIs(str(smrtf), str(smrtf))
+
+        smrtf['pflag'] = 'D'
+        self.assertEqual(str(smrtf), 'D_20180101120000.tif')
+        smrtf.ext = '.nc'
+        self.assertEqual(str(smrtf), 'D_20180101120000.nc')
+
+    def test_build_filename_with_empty_field(self):
+        """
+        Test building file naming with a field of zero length.
+        """
+        fields_def = OrderedDict([('pflag', {'len': 1}), ('band', {}), ('dtime_1', {'len': 14})])
+        smrtf = SmartFilename({'pflag': 'M', 'dtime_1': '20180101120000'}, fields_def)
+
+        self.assertEqual(str(smrtf), 'M__20180101120000')
+
+    def test_lazy_decoding(self):
+        """
+        Test that fields are only decoded once and on first access.
+        """
+        decoded = []
+
+        def decoder(x):
+            decoded.append(x)
+            return int(x)
+
+        fields_def = OrderedDict([('pflag', {'len': 1}), ('dtime_1', {'len': 14, 'decoder': decoder,
+                                                                             'encoder': str})])
+        smrtf = SmartFilename({'pflag': 'M', 'dtime_1': '20180101120000'}, fields_def, convert=True)
+
+        self.assertEqual(smrtf['pflag'], 'M')
+        self.assertEqual(decoded, [])
+        self.assertEqual(smrtf['dtime_1'], 20180101120000)
+        self.assertEqual(smrtf.obj.dtime_1, 20180101120000)
+        self.assertEqual(smrtf['dtime_1'], 20180101120000)
+        self.assertEqual(decoded, ['20180101120000'])
+
+    def test_pickle(self):
+        """
+        Test pickling and unpickling of a SmartFilename.
+        """
+        fields = {'pflag': 'M', 'dtime_1': '20180101120000'}
+        smrtf = pickle.loads(pickle.dumps(SmartFilename(fields, self.fields_def, ext='.tif')))
+
+        self.assertEqual(str(smrtf), 'M_20180101120000.tif')
+        self.assertEqual(smrtf['dtime_1'], '20180101120000')
+
+    def test_compile_layout(self):
+        """
+        Test compilation and caching of a fields definition.
+        """
+        layout = compile_layout(self.fields_def)
+
+        self.assertEqual(layout.names, ('pflag', 'dtime_1'))
+        self.assertEqual(layout.slices, (('pflag', 0, 1), ('dtime_1', 2, 16)))
+        self.assertIs(compile_layout(OrderedDict(self.fields_def)), layout)
+        self.assertEqual(layout.split('M_20180101120000.tif'), {'pflag': 'M', 'dtime_1': '20180101120000'})
+
+    def test_from_filename_keeps_fields_def(self):
+        """
+        Test that parsing a filename does not alter the fields definition.
+        """
+        for _ in range(2):
+            smrtf = SmartFilename.from_filename('M_20180101120000.tif', self.fields_def)
+            self.assertEqual(smrtf['dtime_1'], '20180101120000')
+            self.assertEqual(str(smrtf), 'M_20180101120000.tif')
+
+    def test_parse_many(self):
+        """
+        Test parsing many filenames at once.
+        """
+        table = SmartFilename.parse_many(['M_20180101120000.tif', 'D_2018----------.tif'], self.fields_def)
+
+        self.assertEqual(list(table.columns), ['pflag', 'dtime_1'])
+        self.assertEqual(list(table['pflag']), ['M', 'D'])
+        self.assertEqual(list(table['dtime_1']), ['20180101120000', '2018'])
+
+    def test_factorize(self):
+        """
+        Test encoding a column with missing values by its distinct values.
+        """
+        codes, uniques = factorize(np.array(['a', None, 'b', 'a', None], dtype=object))
+
+        self.assertEqual(list(codes), [0, 2, 1, 0, 2])
+        self.assertEqual(list(uniques), ['a', 'b', None])
+
+    def test_matches(self):
+        """
+        Test matching many filenames against a fields definition.
+        """
+        fns = ['M_20180101120000.tif', 'M_2018010112000.tif', 'x\nM_20180101120000', 'M_20180101120000']
+
+        self.assertEqual(list(SmartFilename.matches(fns, self.fields_def)), [True, False, False, True])
+        self.assertEqual(SmartFilename.filter_valid(fns, self.fields_def, ext='.tif'), ['M_20180101120000.tif'])
+
+    def test_build_many(self):
+        """
+        Test building many filenames at once.
+        """
+        fns = SmartFilename.build_many({'pflag': 'M', 'dtime_1': ['20180101120000', '2018']},
+                                       self.fields_def, ext='.tif')
+
+        self.assertEqual(list(fns), ['M_20180101120000.tif', 'M_2018----------.tif'])
+
+    def test_equality_and_hash(self):
+        """
+        Test comparing and hashing filenames by value.
+        """
+        smrtf_1 = SmartFilename({'pflag': 'M', 'dtime_1': '20180101120000'}, self.fields_def, ext='.tif')
+        smrtf_2 = SmartFilename.from_filename('M_20180101120000.tif', self.fields_def)
+        self.assertEqual(smrtf_1, smrtf_2)
+        self.assertEqual(len({smrtf_1, smrtf_2}), 1)
+        self.assertNotEqual(smrtf_1, 'M_20180101120000.tif')
+
+        # a hashed filename can not be changed anymore, else it would get lost in the set
+        filenames = {smrtf_2}
+        with self.assertRaises(TypeError):
+            smrtf_2['pflag'] = 'D'
+        self.assertIn(smrtf_2, filenames)
+        self.assertEqual(str(smrtf_2), 'M_20180101120000.tif')
+
+        smrtf_3 = SmartFilename.from_filename('M_20180101120000.tif', self.fields_def)
+        smrtf_3['pflag'] = 'D'
+        self.assertNotEqual(smrtf_1, smrtf_3)
+        self.assertEqual(hash(smrtf_3), hash('D_20180101120000.tif'))
+
+    def test_sort_key(self):
+        """
+        Test sorting filenames by fields.
+        """
+        fns = ['M_20180102120000.tif', 'D_20180101120000.tif', 'M_2018----------.tif']
+        smrtfs = [SmartFilename.from_filename(fn, self.fields_def) for fn in fns]
+
+        self.assertEqual(smrtfs[0].sort_key('dtime_1', 'pflag'), ('20180102120000', 'M'))
+        sorted_fns = [str(smrtf) for smrtf in sorted(smrtfs, key=field_sort_key('pflag', 'dtime_1'))]
+        self.assertEqual(sorted_fns, ['D_20180101120000.tif', 'M_2018----------.tif', 'M_20180102120000.tif'])
+
+    def test_parse_datetime64(self):
+        """
+        Test decoding columns of fixed-width date/time strings.
+        """
+        dates = parse_datetime64(['20180101', '20180230', '--------', '2018', '20181231'], '%Y%m%d')
+        self.assertEqual(dates.dtype, np.dtype('datetime64[s]'))
+        self.assertEqual(list(dates[[0, 4]]), [np.datetime64('2018-01-01'), np.datetime64('2018-12-31')])
+        self.assertTrue(np.isnat(dates[1:4]).all())
+
+        dts = parse_datetime64(['20181220T232333', '20181220 232333'], '%Y%m%dT%H%M%S')
+        self.assertEqual(dts[0], np.datetime64('2018-12-20T23:23:33'))
+        self.assertTrue(np.isnat(dts[1]))
+
+        times = parse_datetime64(['165004', '246000'], '%H%M%S')
+        self.assertEqual(times[0], np.timedelta64(16 * 3600 + 50 * 60 + 4, 's'))
+        self.assertTrue(np.isnat(times[1]))
+
+        with self.assertRaises(ValueError):
+            parse_datetime64(['2018001'], '%Y%j')
+
+    def test_expand(self):
+        """
+        Test expanding a filename template into all combinations of field values.
+        """
+        fields = {'pflag': ['M', 'D'], 'dtime_1': ['20180101120000', '2018']}
+        fns = SmartFilename.expand(fields, self.fields_def, ext='.tif')
+
+        self.assertEqual(list(fns), ['M_20180101120000.tif', 'M_2018----------.tif',
+                                     'D_20180101120000.tif', 'D_2018----------.tif'])
+        self.assertEqual(list(SmartFilename.expand(fields, self.fields_def, ext='.tif', lazy=True)), list(fns))
+
+        fns = SmartFilename.expand({('pflag', 'dtime_1'): [('M', '2018'), ('D', '2019')]}, self.fields_def)
+        self.assertEqual(list(fns), ['M_2018----------', 'D_2019----------'])
+
+        with self.assertRaises(ValueError):
+            SmartFilename.expand({'pflag': ['M', 'MM']}, self.fields_def)
+
+    def test_intern_pool(self):
+        """
+        Test sharing identical field values via an intern pool.
+        """
+        pool = InternPool()
+        self.assertIs(pool.intern(''.join(['EU', '500M'])), pool.intern('EU500M'))
+        self.assertIs(type(pool.intern(1.0)), float)
+        self.assertIs(type(pool.intern(1)), int)
+        value = ['not', 'immutable']
+        self.assertIs(pool.intern(value), value)
+        self.assertEqual(len(pool), 3)
+
+        fields_def = OrderedDict([('pflag', {'len': 1}), ('orbit', {'len': 3, 'decoder': int, 'encoder': str})])
+        SmartFilename.intern_pool = pool
+        try:
+            smrtf_1 = SmartFilename.from_filename('M_999', fields_def, convert=True)
+            smrtf_2 = SmartFilename.from_filename('D_999', fields_def, convert=True)
+        finally:
+            SmartFilename.intern_pool = None
+        self.assertIs(smrtf_1._fn_map['orbit'].arg, smrtf_2._fn_map['orbit'].arg)
+        self.assertIs(smrtf_1['orbit'], smrtf_2['orbit'])
+
+
+class TestConventionDetection(unittest.TestCase):
+
+    def setUp(self):
+        self.sgrt_fn = 'M20170725_165004--_SIG0-----_S1BIWGRDH1VVA_146_A0104_EU500M_E048N012T6.tif'
+        self.bmon_fn = 'BMON_DM_ENSEMBLE_500m_20160101120000_v1.nc'
+        self.eodr_fn = '123456------_20181220T232333_---------------_B5_34_aug.vrt'
+
+    def test_detect_convention(self):
+        """
+        Test detection of the naming convention of single filenames.
+        """
+        self.assertEqual(detect_convention(self.sgrt_fn).__name__, 'SgrtFilename')
+        self.assertEqual(detect_convention(self.bmon_fn).__name__, 'BMonFilename')
+        self.assertEqual(detect_convention(self.eodr_fn).__name__, 'EODRFilename')
+        self.assertIsNone(detect_convention('dummy_test_file.txt'))
+
+    def test_partition_by_convention(self):
+        """
+        Test partitioning of a mixed listing by naming conventions.
+        """
+        partitions = partition_by_convention([self.eodr_fn, 'dummy_test_file.txt', self.sgrt_fn, self.bmon_fn])
+        partitions = dict((k.__name__ if k else None, v) for k, v in partitions.items())
+
+        self.assertEqual(partitions, {'SgrtFilename': [self.sgrt_fn], 'BMonFilename': [self.bmon_fn],
+                                      'EODRFilename': [self.eodr_fn], None: ['dummy_test_file.txt']})
+
+        # a generator is only consumed once
+        partitions = partition_by_convention(fn for fn in [self.sgrt_fn, 'dummy_test_file.txt'])
+        self.assertEqual(list(partitions.values()), [[self.sgrt_fn], ['dummy_test_file.txt']])
+
+    def test_user_convention(self):
+        """
+        Test detection with subclasses of SmartFilename defined outside of geopathfinder.
+        """
+        self.assertIsNone(detect_convention('XY_ABCDEFG.tif'))
+
+        class PlainFilename(SmartFilename):
+            fields_def = OrderedDict([('pflag', {'len': 1}), ('name', {'len': 4})])
+
+        class UserFilename(SmartFilename):
+            fields_def = OrderedDict([('pflag', {'len': 2}), ('name', {'len': 7})])
+            pad = '-'
+            delimiter = '_'
+
+        try:
+            self.assertNotIn(PlainFilename, get_conventions())
+            self.assertIs(detect_convention('XY_ABCDEFG.tif'), UserFilename)
+            self.assertEqual(detect_convention(self.sgrt_fn).__name__, 'SgrtFilename')
+            partitions = partition_by_convention([self.sgrt_fn, 'XY_ABCDEFG.tif', 'X_ABCD.tif'])
+            self.assertEqual(partitions[UserFilename], ['XY_ABCDEFG.tif'])
+            self.assertEqual(partitions[None], ['X_ABCD.tif'])
+        finally:
+            _conventions.remove(UserFilename)
+        self.assertIsNone(detect_convention('XY_ABCDEFG.tif'))
+
 
 if __name__ == '__main__':
     unittest.main()
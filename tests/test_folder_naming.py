@@ -22,8 +22,12 @@ import shutil
 
 from geopathfinder.folder_naming import SmartPath
 from geopathfinder.folder_naming import NullSmartPath
+from geopathfinder.folder_naming import SmartTree
 from geopathfinder.naming_conventions.sgrt_naming import sgrt_tree
 from geopathfinder.folder_naming import transform_bytes
+from geopathfinder.folder_naming import scan_tree
+from geopathfinder.folder_naming import list_tree
+from geopathfinder.folder_naming import regex_file_search
 
 def cur_path():
     pth, _ = os.path.split(os.path.abspath(__file__))
@@ -172,6 +176,21 @@ class TestSmartPath(unittest.TestCase):
         assert should == result
 
 
+    def test_trim2level(self):
+        '''
+        Testing the removal of levels.
+
+        '''
+        self.sp_obj.trim2level('wflow', remove='deeper_excluding')
+        self.assertEqual(self.sp_obj.hierarchy[-1], 'wflow')
+        self.assertEqual(self.sp_obj.get_dir(), os.path.join(self.path, 'Sentinel-1_CSAR', 'IWGRDH', 'products',
+                                                             'datasets', 'ssm', 'C1003'))
+
+        self.sp_obj.trim2level('group', remove='higher_excluding')
+        self.assertEqual(self.sp_obj.hierarchy, ['group', 'datalog', 'product', 'wflow'])
+        self.assertEqual(self.sp_obj.get_dir(), os.path.join('products', 'datasets', 'ssm', 'C1003'))
+
+
     def test_expand_full_path(self):
         '''
         Testing the path expansion
@@ -203,6 +222,18 @@ class TestSmartPath(unittest.TestCase):
         assert should == result
 
 
+    def test_search_files_missing_dir(self):
+        '''
+        Testing the file search in a directory that does not exist.
+
+        '''
+        missing = os.path.join(self.path, 'not_existing')
+
+        self.assertEqual(regex_file_search(missing, '.tif'), ([], 0))
+        self.assertEqual(regex_file_search(missing, '.tif', as_bytes=True), ([], 0))
+        self.assertEqual(self.sp_obj.search_files('var', pattern='SSM'), [])
+
+
     def test_build_file_register(self):
         '''
         Testing the file register.
@@ -273,6 +304,133 @@ class TestSmartTree(unittest.TestCase):
         # file_register!
 
 
+    def test_tree_as_bytes(self):
+        """
+        Tests building the SmartTree() by walking and searching as bytes.
+
+        """
+        stt_bytes = sgrt_tree(self.test_dir, register_file_pattern='.tif', as_bytes=True)
+
+        self.assertEqual(sorted(stt_bytes.get_all_dirs()), sorted(self.stt_1.get_all_dirs()))
+        self.assertEqual(stt_bytes.file_register, self.stt_1.file_register)
+        self.assertEqual(stt_bytes.file_count, self.stt_1.file_count)
+
+
+    def test_scan_tree(self):
+        """
+        Tests walking the directories like os.walk(), but stopping at a depth.
+
+        """
+        walked = [(dirpath, sorted(dirs + files)) for dirpath, dirs, files in os.walk(self.test_dir, topdown=False)]
+        scanned = [(dirpath, sorted(names)) for dirpath, names in scan_tree(self.test_dir)]
+        self.assertEqual(scanned, walked)
+
+        root_depth = len(self.test_dir.split(os.sep))
+        scanned = [dirpath for dirpath, _ in scan_tree(self.test_dir, max_depth=5)]
+        self.assertEqual(sorted(scanned), sorted([dirpath for dirpath, _ in walked
+                                                  if len(dirpath.split(os.sep)) - root_depth <= 5]))
+
+
+    def test_tree_workers(self):
+        """
+        Tests building the SmartTree() by listing directories concurrently.
+
+        """
+        self.assertEqual(list(scan_tree(self.test_dir, workers=4)), list(scan_tree(self.test_dir)))
+        self.assertEqual(list(scan_tree(self.test_dir, max_depth=3, workers=2)),
+                         list(scan_tree(self.test_dir, max_depth=3)))
+
+        # listings are streamed in the order of a serial top-down walk
+        listings = list_tree(self.test_dir, workers=2)
+        self.assertEqual(next(listings)[0], self.test_dir)
+        self.assertEqual([self.test_dir] + [path for path, _ in listings],
+                         [dirpath for dirpath, _, _ in os.walk(self.test_dir)])
+
+        stt = sgrt_tree(self.test_dir, register_file_pattern='.tif', workers=4)
+        self.assertEqual(stt.get_all_dirs(), self.stt_1.get_all_dirs())
+        self.assertEqual(stt.file_register, self.stt_1.file_register)
+
+        stt = sgrt_tree(self.test_dir, target_level='tile', register_file_pattern='.tif', workers=3, as_bytes=True)
+        stt_serial = sgrt_tree(self.test_dir, target_level='tile', register_file_pattern='.tif')
+        self.assertEqual(stt.get_all_dirs(), stt_serial.get_all_dirs())
+        self.assertEqual(sorted(stt.file_register), sorted(stt_serial.file_register))
+
+
+    def test_tree_snapshot(self):
+        """
+        Tests saving and loading a snapshot of the SmartTree() and refreshing
+        it after changes in the file system.
+
+        """
+        root = os.path.join(self.copy_dir, 'Sentinel-1_CSAR')
+        shutil.copytree(self.test_dir, root)
+        snapshot = os.path.join(self.copy_dir, 'snapshot.json')
+
+        for target_level in [None, 'tile']:
+            stt = sgrt_tree(root, target_level=target_level, register_file_pattern='.tif', record_mtimes=True)
+            stt.save(snapshot)
+            stt_loaded = SmartTree.load(snapshot)
+            self.assertEqual(stt_loaded.get_all_dirs(), stt.get_all_dirs())
+            self.assertEqual(stt_loaded.file_register, stt.file_register)
+            self.assertEqual(stt_loaded.refresh(), [])
+
+        grid_dir = os.path.join(root, 'IWGRDH', 'products', 'datasets', 'ssm', 'C1003', 'EQUI7_EU500M')
+        new_dir = os.path.join(grid_dir, 'E099N099T6', 'ssm')
+        os.makedirs(new_dir)
+        open(os.path.join(new_dir, 'M20170403_053310--_SSM------_S1BIWGRDH1VVD_066_C1003_EU500M_E099N099T6.tif'),
+             'w').close()
+        shutil.rmtree(os.path.join(grid_dir, 'E006N012T6'))
+
+        stt_loaded.refresh()
+        stt = sgrt_tree(root, target_level='tile', register_file_pattern='.tif', record_mtimes=True)
+        self.assertEqual(stt_loaded.get_all_dirs(), stt.get_all_dirs())
+        self.assertEqual(sorted(stt_loaded.file_register), sorted(stt.file_register))
+        self.assertEqual(dict(stt_loaded.mtimes), dict(stt.mtimes))
+
+        self.assertRaises(ValueError, self.stt_1.trim2branch('wflow', 'C1003').refresh)
+        # modification times are only recorded on request
+        self.assertEqual(self.stt_1.mtimes, {})
+        self.assertRaises(ValueError, self.stt_1.refresh)
+
+
+    def test_tree_target_level(self):
+        """
+        Tests the file register of a SmartTree() built down to a target level.
+
+        """
+        stt = sgrt_tree(self.test_dir, target_level='var', register_file_pattern='.tif')
+
+        should = set()
+        for smart_path in stt.get_all_smartpaths():
+            smart_path.build_file_register(down_to_level='var', pattern='.tif')
+            should.update(smart_path.file_register)
+        self.assertEqual(sorted(stt.file_register), sorted(should))
+        self.assertEqual(stt.file_count, 13)
+        self.assertTrue(all(os.path.basename(os.path.dirname(f)) != 'qlooks' for f in stt.file_register))
+
+
+    def test_find(self):
+        """
+        Tests the selection of SmartPaths by folder names at levels.
+
+        """
+        should = [os.path.join(self.test_dir, 'IWGRDH', 'products', 'datasets', 'ssm', 'C1003', 'EQUI7_EU500M',
+                               'E048N012T6', var, 'qlooks') for var in ['ssm-noise', 'ssm']]
+        result = self.stt_1.find(wflow='C1003', tile='E048N012T6')
+        self.assertEqual([x.get_dir() for x in result], should)
+
+        result = self.stt_1.find(tile='E048N012T6', var=['ssm', 'sig0'])
+        self.assertEqual([x.get_dir() for x in result], should[1:])
+        self.assertEqual(self.stt_1.get_smartpath(tile='E048N012T6', var='ssm').get_dir(), should[1])
+        self.assertEqual(self.stt_1.find(wflow='C1003', tile='E048N006T6'), [])
+        self.assertEqual(len(self.stt_1.find()), self.stt_1.dir_count)
+        self.assertRaises(ValueError, self.stt_1.find, sensor='S1')
+
+        # the index is updated with the SmartPaths
+        self.stt_1.remove_smartpath(should[1])
+        self.assertEqual([x.get_dir() for x in self.stt_1.find(wflow='C1003', tile='E048N012T6')], should[:1])
+
+
     def test_get_smartpath(self):
         """
         Tests the selection of a SmartPath matching regex search patterns.
@@ -377,6 +535,11 @@ class TestSmartTree(unittest.TestCase):
         result = sorted(self.stt_1.collect_level_topnames('grid', unique=True))
         self.assertEqual(should, result)
 
+        # the SmartPaths of the tree are not trimmed
+        result = self.stt_1.collect_level_smartpath('grid', pattern='AF010M')
+        self.assertEqual(result[0].hierarchy[-1], 'grid')
+        self.assertTrue(all(x.hierarchy == self.stt_1.hierarchy for x in self.stt_1.get_all_smartpaths()))
+
 
     def test_trim2branch(self):
         """
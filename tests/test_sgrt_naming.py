@@ -16,6 +16,7 @@
 
 
 import os
+import pickle
 import unittest
 import logging
 from datetime import datetime
@@ -24,6 +25,10 @@ from datetime import time
 from geopathfinder.naming_conventions.sgrt_naming import SgrtFilename
 from geopathfinder.naming_conventions.sgrt_naming import sgrt_tree
 from geopathfinder.naming_conventions.sgrt_naming import sgrt_path
+from geopathfinder.naming_conventions.sgrt_naming import sgrt_dir
+from geopathfinder.naming_conventions.sgrt_naming import sgrt_dirs
+from geopathfinder.naming_conventions.sgrt_naming import validate_sgrt_files
+from geopathfinder.naming_conventions.sgrt_naming import validate_sgrt_tree
 
 logging.basicConfig(level=logging.INFO)
 
@@ -64,6 +69,11 @@ class TestSgrtFilename(unittest.TestCase):
 
         self.assertEqual(str(self.sgrt_fn), fn)
 
+        # layout and decoders are shared by all objects of the class
+        self.assertIs(self.sgrt_fn._layout, SgrtFilename.get_layout())
+        self.assertIs(self.sgrt_fn3._layout, SgrtFilename.get_layout())
+        self.assertIs(self.sgrt_fn._fn_map['dtime_1'].decoder, self.sgrt_fn5._fn_map['dtime_1'].decoder)
+
     def test2_get_n_set_date(self):
         """
         Test set and get start and end date.
@@ -192,6 +202,240 @@ class TestSgrtFilename(unittest.TestCase):
         fn = SgrtFilename(xfields)
         self.assertEqual(str(fn), should)
 
+    def test6_parse_many(self):
+        """
+        Tests parsing many SGRT filenames at once.
+
+        """
+        fns = ['M20170725_165004--_SIG0-----_S1BIWGRDH1VVA_146_A0104_EU500M_E048N012T6.tif',
+               'M20170725_20181225_TMENSIG40_ASAWS---M1--D_---_A0104_EU500M_E048N012T6.tif']
+
+        for convert in [False, True]:
+            table = SgrtFilename.parse_many(fns, convert=convert)
+            self.assertEqual(list(table.columns), list(SgrtFilename.fields_def.keys()))
+            for i, fn in enumerate(fns):
+                sgrt_fn = SgrtFilename.from_filename(fn, convert=convert)
+                for name in ['dtime_1', 'dtime_2', 'var_name', 'mode_id', 'tile_name']:
+                    self.assertEqual(table[name][i], sgrt_fn[name])
+
+        table = SgrtFilename.parse_many(fns, convert=True)
+        self.assertEqual(table['relative_orbit'][0], 146)
+        self.assertIsNone(table['relative_orbit'][1])
+
+    def test7_build_many(self):
+        """
+        Tests building many SGRT filenames at once.
+
+        """
+        fields = {'dtime_1': [self.dtime_1, self.dtime_1, self.dtime_1],
+                  'dtime_2': [self.dtime_2, time(1, 2, 3), '165004--'],
+                  'var_name': 'SSM',
+                  'relative_orbit': [1, 146, '---'],
+                  'tile_name': ['E048N012T6', 'E048N012T6', 'E054N012T6']}
+
+        fns = SgrtFilename.build_many(fields)
+        for i, fn in enumerate(fns):
+            fields_i = dict((name, value[i] if isinstance(value, list) else value) for name, value in fields.items())
+            self.assertEqual(fn, str(SgrtFilename(fields_i)))
+
+        with self.assertRaises(ValueError):
+            SgrtFilename.build_many({'var_name': ['SSM', 'SSM-NOISE-1']})
+
+    def test8_pickle(self):
+        """
+        Tests pickling and unpickling of SGRT filenames.
+
+        """
+        for sgrt_fn in [self.sgrt_fn, self.sgrt_fn2, self.sgrt_fn4, self.sgrt_fn5]:
+            sgrt_fn_restored = pickle.loads(pickle.dumps(sgrt_fn))
+            self.assertIsInstance(sgrt_fn_restored, SgrtFilename)
+            self.assertEqual(str(sgrt_fn_restored), str(sgrt_fn))
+            self.assertEqual(sgrt_fn_restored.single_date, sgrt_fn.single_date)
+            self.assertEqual(sgrt_fn_restored['stime'], sgrt_fn['stime'])
+
+    def test9_filter_valid(self):
+        """
+        Tests filtering of SGRT filenames with the convention's regular expression.
+
+        """
+        fns = ['M20170725_165004--_SIG0-----_S1BIWGRDH1VVA_146_A0104_EU500M_E048N012T6.tif',
+               'M20170725_20181225_TMENSIG40_ASAWS---M1--D_---_A0104_EU500M_E048N012T6.tif',
+               'M2017072_165004--_SIG0-----_S1BIWGRDH1VVA_146_A0104_EU500M_E048N012T6.tif',
+               'M20170725_165004--_SIG0-----_S1BIWGRDH1VVA_14X_A0104_EU500M_E048N012T6.tif',
+               'dummy_test_file.txt']
+
+        self.assertEqual(list(SgrtFilename.matches(fns)), [True, True, False, False, False])
+        self.assertEqual(SgrtFilename.filter_valid(fns, ext='.tif'), fns[:2])
+        self.assertIs(SgrtFilename.get_regex(), SgrtFilename.get_regex())
+
+    def test10_field_projection(self):
+        """
+        Tests extracting only some fields of SGRT filenames.
+
+        """
+        fns = ['M20170725_165004--_SIG0-----_S1BIWGRDH1VVA_146_A0104_EU500M_E048N012T6.tif',
+               'M20170725_20181225_TMENSIG40_ASAWS---M1--D_---_A0104_EU500M_E048N012T6.tif']
+
+        record = SgrtFilename.from_filename(fns[0], convert=True, fields=['tile_name', 'dtime_1', 'relative_orbit'])
+        self.assertEqual(record.tile_name, 'E048N012T6')
+        self.assertEqual(record.dtime_1, datetime(2017, 7, 25).date())
+        self.assertEqual(record.relative_orbit, 146)
+        self.assertEqual(tuple(record), ('E048N012T6', datetime(2017, 7, 25).date(), 146))
+
+        table = SgrtFilename.parse_many(fns, fields=['var_name', 'relative_orbit'])
+        self.assertEqual(list(table.columns), ['var_name', 'relative_orbit'])
+        self.assertEqual(list(table['var_name']), ['SIG0', 'TMENSIG40'])
+        self.assertEqual(list(table['relative_orbit']), ['146', ''])
+
+        with self.assertRaises(KeyError):
+            SgrtFilename.from_filename(fns[0], fields=['orbit'])
+
+    def test11_compact(self):
+        """
+        Tests the compact representation of SGRT filenames.
+
+        """
+        fn = 'M20170725_165004--_SIG0-----_S1BIWGRDH1VVA_146_A0104_EU500M_E048N012T6.tif'
+        compact_fn = SgrtFilename.compact(fn, convert=True)
+        sgrt_fn = SgrtFilename.from_filename(fn, convert=True)
+
+        self.assertEqual(str(compact_fn), fn)
+        self.assertEqual(compact_fn.ext, '.tif')
+        for name in SgrtFilename.fields_def.keys():
+            self.assertEqual(compact_fn[name], sgrt_fn[name])
+        self.assertEqual(compact_fn.obj.relative_orbit, 146)
+        self.assertEqual(compact_fn.tile_name, 'E048N012T6')
+        self.assertEqual(str(compact_fn.to_smartfilename()), fn)
+        self.assertEqual(pickle.loads(pickle.dumps(compact_fn)).dtime_1, sgrt_fn['dtime_1'])
+        for name in ['stime', 'etime', 'time', 'product_id', 'ftile']:
+            self.assertEqual(compact_fn[name], sgrt_fn[name])
+            self.assertEqual(getattr(compact_fn, name), getattr(sgrt_fn, name))
+        self.assertEqual(compact_fn['stime'], datetime(2017, 7, 25, 16, 50, 4))
+
+        with self.assertRaises(KeyError):
+            compact_fn['orbit']
+        with self.assertRaises(AttributeError):
+            compact_fn.orbit
+        with self.assertRaises(AttributeError):
+            compact_fn.tile_name = 'E054N012T6'
+
+        self.assertEqual(compact_fn, sgrt_fn)
+        self.assertEqual(hash(compact_fn), hash(sgrt_fn))
+        self.assertEqual(compact_fn.sort_key('tile_name', 'dtime_1'), sgrt_fn.sort_key('tile_name', 'dtime_1'))
+
+    def test12_parse_many_categorical(self):
+        """
+        Tests parsing many SGRT filenames into dictionary-encoded columns.
+
+        """
+        fns = ['M20170725_165004--_SIG0-----_S1BIWGRDH1VVA_146_A0104_EU500M_E048N012T6.tif',
+               'M20170725_20181225_TMENSIG40_ASAWS---M1--D_---_A0104_EU500M_E048N012T6.tif',
+               'M20170726_165004--_SIG0-----_S1BIWGRDH1VVA_146_A0104_EU500M_E054N012T6.tif']
+
+        table = SgrtFilename.parse_many(fns, convert=True, categorical=True)
+        expected = SgrtFilename.parse_many(fns, convert=True)
+        self.assertEqual(str(table['tile_name'].dtype), 'category')
+        self.assertEqual(list(table['var_name'].cat.categories), ['SIG0', 'TMENSIG40'])
+        self.assertEqual(list(table['var_name'].cat.codes), [0, 1, 0])
+        self.assertEqual(list(table['relative_orbit'].cat.codes), [0, -1, 0])
+        self.assertEqual(list(table['tile_name'] == 'E048N012T6'), [True, True, False])
+        for name in ['dtime_1', 'var_name', 'tile_name']:
+            self.assertEqual(list(table[name]), list(expected[name]))
+
+    def test13_parse_many_datetime64(self):
+        """
+        Tests parsing many SGRT filenames into start and end time columns.
+
+        """
+        fns = ['M20170725_165004--_SIG0-----_S1BIWGRDH1VVA_146_A0104_EU500M_E048N012T6.tif',
+               'M20170725_20181225_TMENSIG40_ASAWS---M1--D_---_A0104_EU500M_E048N012T6.tif']
+
+        table = SgrtFilename.parse_many(fns, convert=True, datetime64=True)
+        self.assertEqual(list(table.columns)[:4], ['pflag', 'stime', 'etime', 'var_name'])
+        self.assertEqual(str(table['stime'].dtype), 'datetime64[s]')
+        for i, fn in enumerate(fns):
+            sgrt_fn = SgrtFilename.from_filename(fn, convert=True)
+            # date ranges are given by dates in SgrtFilename, i.e. they start at midnight
+            self.assertEqual(table['stime'][i], datetime(*sgrt_fn.stime.timetuple()[:6]))
+            self.assertEqual(table['etime'][i], datetime(*sgrt_fn.etime.timetuple()[:6]))
+            self.assertEqual(table['relative_orbit'][i], sgrt_fn['relative_orbit'])
+
+        table = SgrtFilename.parse_many(fns, convert=True, datetime64=True, fields=['tile_name', 'etime'])
+        self.assertEqual(list(table.columns), ['tile_name', 'etime'])
+        self.assertEqual(table['etime'][1], datetime(2018, 12, 25))
+
+    def test14_expand(self):
+        """
+        Tests expanding an SGRT filename template.
+
+        """
+        fields = {'dtime_1': [self.dtime_1, datetime(2008, 1, 2, 12, 30)],
+                  'var_name': ['SSM', 'SSM-NOISE'],
+                  'relative_orbit': [1, 146],
+                  'tile_name': 'E048N012T6'}
+
+        fns = SgrtFilename.expand(fields)
+        self.assertEqual(len(fns), 8)
+        self.assertEqual(list(SgrtFilename.expand(fields, lazy=True)), list(fns))
+        self.assertEqual(fns[-1], str(SgrtFilename({'dtime_1': datetime(2008, 1, 2, 12, 30), 'var_name': 'SSM-NOISE',
+                                                    'relative_orbit': 146, 'tile_name': 'E048N012T6'})))
+
+        fns = SgrtFilename.expand({'dtime_1': self.dtime_1, 'dtime_2': [self.dtime_2, time(1, 2, 3)]})
+        self.assertEqual(fns[0], str(SgrtFilename({'dtime_1': self.dtime_1, 'dtime_2': self.dtime_2})))
+        self.assertEqual(fns[1], str(SgrtFilename({'dtime_1': self.dtime_1, 'dtime_2': time(1, 2, 3)})))
+
+    def test15_bytes(self):
+        """
+        Tests parsing SGRT filenames given as bytes.
+
+        """
+        fn = 'M20170725_165004--_SIG0-----_S1BIWGRDH1VVA_146_A0104_EU500M_E048N012T6.tif'
+        fn_bytes = fn.encode()
+
+        record = SgrtFilename.from_filename(fn_bytes, convert=True, fields=['tile_name', 'relative_orbit'])
+        self.assertEqual(tuple(record), ('E048N012T6', 146))
+        self.assertEqual(str(SgrtFilename.from_filename(fn_bytes)), fn)
+
+        table = SgrtFilename.parse_many([fn_bytes, fn_bytes], fields=['var_name', 'tile_name'])
+        self.assertEqual(list(table['var_name']), ['SIG0', 'SIG0'])
+        self.assertEqual(list(table['tile_name']), ['E048N012T6', 'E048N012T6'])
+
+        self.assertEqual(SgrtFilename.filter_valid([fn_bytes, b'M20170725_SIG0.tif']), [fn_bytes])
+
+        # non-ASCII filenames are decoded like by os.fsdecode
+        fn_umlaut = fn.replace('SIG0', 'SIG\u00c4').encode()
+        fn_undecodable = fn_bytes.replace(b'SIG0', b'SIG\xff')
+        table = SgrtFilename.parse_many([fn_bytes, fn_umlaut, fn_undecodable], fields=['var_name', 'tile_name'])
+        self.assertEqual(list(table['var_name']), ['SIG0', 'SIG\u00c4', os.fsdecode(b'SIG\xff')])
+        self.assertEqual(list(table['tile_name']), ['E048N012T6'] * 3)
+        record = SgrtFilename.from_filename(fn_umlaut, fields=['var_name', 'tile_name'])
+        self.assertEqual(tuple(record), ('SIG\u00c4', 'E048N012T6'))
+
+    def test16_validate_many(self):
+        """
+        Tests validating many SGRT filenames at once.
+
+        """
+        filenames = ['M20170725_165004--_SIG0-----_S1BIWGRDH1VVA_146_A0104_EU500M_E048N012T6.tif',
+                     'M20171325_165004--_SIG0-----_S1BIWGRDH1VVA_146_A0104_EU500M_E048N012T6.tif',
+                     'M20170725_166004--_SIG0-----_S1BIWGRDH1VVA_146_A0104_EU500M_E048N012T6.tif',
+                     'M20170725_165004--_SIG0-----_S1BIWGRDH1VVA_1X6_A0104_EU500M_E048N012T6.tif',
+                     'M20170725_SIG0.tif']
+
+        report = SgrtFilename.validate_many(filenames)
+        self.assertEqual(list(report.columns), ['layout', 'dtime_1', 'dtime_2', 'relative_orbit', 'valid'])
+        self.assertEqual(list(report['layout']), [True, True, True, True, False])
+        self.assertEqual(list(report['dtime_1']), [True, False, True, True, False])
+        self.assertEqual(list(report['dtime_2']), [True, True, False, True, False])
+        self.assertEqual(list(report['relative_orbit']), [True, True, True, False, False])
+        self.assertEqual(list(report['valid']), [True, False, False, False, False])
+
+        folder = os.path.join('root', 'IWGRDH', 'preprocessed', 'datasets', 'resampled', 'A0104', 'EQUI7_EU500M',
+                              'E048N006T6', 'sig0')
+        report, summary = validate_sgrt_files([os.path.join(folder, filenames[0])], 'root')
+        self.assertEqual(list(report['levels']), [False])
+        self.assertEqual(summary.loc[folder, 'levels'], 1)
+
 
 class TestSgrtPath(unittest.TestCase):
     """
@@ -206,6 +450,61 @@ class TestSgrtPath(unittest.TestCase):
         self.test_dir = os.path.join(os.path.dirname(
             os.path.abspath(__file__)), 'test_data', 'Sentinel-1_CSAR')
 
+    def test_sgrt_dir(self):
+        """
+        Tests resolving the SGRT directories of files from their filenames.
+
+        """
+        filenames = ['M20170403_053310--_SSM-NOISE_S1BIWGRDH1VVD_066_C1003_EU500M_E048N012T6.tif',
+                     'Q20170403_053310--_SSM------_S1BIWGRDH1VVD_066_C1003_EU500M_E048N012T6.tif',
+                     'M20160831_163321--_SIG0-----_S1AIWGRDH1VVA_175_A0202_EU500M_E048N006T6.tif',
+                     'M20170403_053310--_SSM-NOISE_S1BIWGRDH1VVD_066_C1003_EU500M_E048N012T6.tif']
+        should = [sgrt_path(self.test_dir, mode='IWGRDH', product='ssm', wflow='C1003', grid='EQUI7_EU500M',
+                            tile='E048N012T6', var='ssm-noise', qlook=False).get_dir(),
+                  sgrt_path(self.test_dir, mode='IWGRDH', product='ssm', wflow='C1003', grid='EQUI7_EU500M',
+                            tile='E048N012T6', var='ssm', qlook=True).get_dir(),
+                  sgrt_path(self.test_dir, mode='IWGRDH', product='resampled', wflow='A0202', grid='EQUI7_EU500M',
+                            tile='E048N006T6', var='sig0', qlook=False).get_dir()]
+        should.append(should[0])
+
+        self.assertEqual(sgrt_dir(self.test_dir, filenames[0], 'ssm'), should[0])
+        self.assertEqual(sgrt_dir(self.test_dir, SgrtFilename.from_filename(filenames[1]), 'ssm'), should[1])
+        self.assertEqual(list(sgrt_dirs(self.test_dir, filenames, ['ssm', 'ssm', 'resampled', 'ssm'])), should)
+        self.assertEqual(sgrt_dirs(self.test_dir, filenames[:2], 'ssm', qlook=False)[1], os.path.dirname(should[1]))
+        self.assertEqual(len(sgrt_dirs(self.test_dir, [], 'ssm')), 0)
+        # files, which do not follow the naming convention, have no directory
+        invalid = ['file_too_deep.tif', filenames[0].replace('_C1003_', '_X1003_')]
+        dirs = sgrt_dirs(self.test_dir, filenames[:1] + invalid, 'ssm')
+        self.assertEqual(list(dirs), should[:1] + [None, None])
+
+        with self.assertRaises(ValueError):
+            sgrt_dir(os.path.dirname(self.test_dir), filenames[0], 'ssm')
+
+    def test_validate_tree(self):
+        """
+        Tests validating the files of a SGRT tree against their names and folders.
+
+        """
+        stt = sgrt_tree(self.test_dir, register_file_pattern='.tif')
+        report, summary = validate_sgrt_tree(stt)
+
+        self.assertEqual(len(report), stt.file_count)
+        invalid = report[~report['valid']]
+        self.assertEqual(sorted(invalid['filename'])[-1], 'file_too_deep.tif')
+        self.assertEqual(list(invalid['layout']).count(False), 1)
+        # workflow, tile or grid do not match the folders
+        self.assertEqual(sorted(invalid.loc[~invalid['levels'], 'filename']),
+                         ['M20160831_163321--_PLIA-----_S1AIWGRDH1--A_175_A0201_EU500M_E006N006T6.tif',
+                          'M20160831_163321--_SIG0-----_S1AIWGRDH1VVA_175_A0201_EU500M_E048N006T6.tif',
+                          'M20161017_053649--_SSM------_S1BIWGRDH1VVD_066_C1003_AF010M_E006N006T1.tif',
+                          'Q20160831_163321--_SIG0-----_S1AIWGRDH1VVA_175_A0201_EU500M_E006N006T6.tif'])
+        self.assertEqual(summary['files'].sum(), stt.file_count)
+        self.assertEqual(summary['invalid'].sum(), 5)
+        # the fields of 'file_too_deep.tif' are not counted as failed checks
+        self.assertEqual(summary['layout'].sum(), 1)
+        self.assertEqual(summary[['dtime_1', 'dtime_2', 'relative_orbit']].to_numpy().sum(), 0)
+        self.assertEqual(summary['levels'].sum(), 4)
+
     def test_full_path(self):
         """
         Tests the SmartPath() for the SGRT naming conventions